@@ -0,0 +1,117 @@
+"""
+Compare saving a large scene the way `Project.save_scene` does (serializing
+and writing all of it on the UI thread) against `Autosave`: journaling a
+change to one object, and compacting the journal into a snapshot in the
+background. For the background write, this measures the longest time the UI
+thread is kept waiting (for the GIL), by running a 1ms timer loop on it
+while the snapshot is written.
+
+Models need an OpenGL context for their materials, so this uses a standalone
+(offscreen) context like `benchmarks.instanced_rendering`. Run from the
+repository root with:
+
+    python -m benchmarks.autosave
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+import numpy as np
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    args = parser.parse_args()
+
+    if args.backend:
+        ctx = mgl.create_standalone_context(require=430, backend=args.backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+
+    import nimble.resources.resources
+    from PyQt5.QtCore import QCoreApplication
+    from nimble.common.autosave import Autosave
+    from nimble.common.serialize import serialize_scene
+    from nimble.common.shader_manager import Shaders
+    from nimble.objects import Cube, GeometryCache, Material, Model, Scene
+    from nimble.utils import write_atomically
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    Shaders().load_defaults()
+    folder = tempfile.TemporaryDirectory()
+
+    print(
+        f"{'objects':>8} {'save':>10} {'journal 1':>10} "
+        f"{'compact':>10} {'ui stall':>10}"
+    )
+    for n in (1_000, 10_000, 50_000):
+        rng = np.random.default_rng(0)
+        scene = Scene()
+        for i in range(n):
+            model = Model(
+                Material("viewport"),
+                geometry=GeometryCache().get(Cube),
+                name=f"Object {i}",
+                position=rng.uniform(-50, 50, 3).astype("f4"),
+            )
+            scene.objects[model.name] = model
+            scene.objects_list.append(model.name)
+
+        start = time.perf_counter()
+        write_atomically(
+            Path(folder.name) / "scene.json", json.dumps(serialize_scene(scene))
+        )
+        save_ms = (time.perf_counter() - start) * 1000
+
+        autosave = Autosave(scene)
+        autosave.start(folder.name)
+        autosave.executor.shutdown(wait=True)
+        autosave.executor = None
+        scene.set_active(n // 2)
+
+        # Journal a change to the selected object
+        active = scene.get_active()
+        active.translate((1, 0, 0))
+        start = time.perf_counter()
+        autosave.flush()
+        journal_ms = (time.perf_counter() - start) * 1000
+        autosave.executor.shutdown(wait=True)
+        autosave.executor = None
+
+        # Compact in the background, and see how long the UI thread waits
+        active.translate((1, 0, 0))
+        autosave.entries = autosave.compact_after
+        start = time.perf_counter()
+        autosave.flush()
+        compact_ms = (time.perf_counter() - start) * 1000
+
+        stall = 0.0
+        last = time.perf_counter()
+        while not all(write.done() for write in autosave.writes):
+            time.sleep(0.001)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+        autosave.stop()
+
+        print(
+            f"{n:>8} {save_ms:>8.1f}ms {journal_ms:>8.2f}ms "
+            f"{compact_ms:>8.2f}ms {stall * 1000:>8.1f}ms"
+        )
+        scene.release()
+
+    folder.cleanup()
+
+
+if __name__ == "__main__":
+    main()
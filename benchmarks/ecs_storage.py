@@ -0,0 +1,105 @@
+"""
+Compare the dict/set ECS backend (`BaseWorld`) with the archetype backend
+(`ArchetypeWorld`) for queries, adding components and removing components.
+
+Run from the repository root with:
+
+    python -m benchmarks.ecs_storage
+"""
+
+import timeit
+from typing import Callable, List, Type
+
+from nimble.common.ecs import ArchetypeWorld, BaseWorld
+
+
+class Position:
+    pass
+
+
+class Velocity:
+    pass
+
+
+class Renderable:
+    pass
+
+
+class Tag:
+    pass
+
+
+def populate(world_cls: Type[BaseWorld], n: int) -> BaseWorld:
+    """Create `n` entities spread over a few different archetypes."""
+    world = world_cls()
+    for i in range(n):
+        components = [Position()]
+        if i % 2 == 0:
+            components.append(Velocity())
+        if i % 3 == 0:
+            components.append(Renderable())
+        world.create_entity(*components)
+    return world
+
+
+def bench_query(world: BaseWorld) -> Callable[[], None]:
+    def run():
+        # Clear the cache so the query is actually executed every time
+        world.clear_cache()
+        for _ in world.get_components(Position, Velocity):
+            pass
+
+    return run
+
+
+def bench_add(world: BaseWorld, entities: List[int]) -> Callable[[], None]:
+    def run():
+        for entity in entities:
+            world.add_component(entity, Tag())
+
+    return run
+
+
+def bench_remove(world: BaseWorld, entities: List[int]) -> Callable[[], None]:
+    def run():
+        for entity in entities:
+            world.remove_component(entity, Tag)
+
+    return run
+
+
+def bench_remove_if_tagged(world: BaseWorld) -> Callable[[], None]:
+    def run():
+        for entity, _ in list(world.get_component(Tag)):
+            world.remove_component(entity, Tag)
+
+    return run
+
+
+def time_it(fn: Callable[[], None], setup: Callable[[], None] = None) -> float:
+    """Return the best time (in milliseconds) over a few runs of `fn`."""
+    times = []
+    for _ in range(5):
+        if setup is not None:
+            setup()
+        times.append(timeit.timeit(fn, number=1))
+    return min(times) * 1000
+
+
+def main():
+    print(f"{'entities':>10} {'backend':>10} {'query':>10} {'add':>10} {'remove':>10}")
+    for n in (1_000, 10_000, 100_000):
+        for world_cls in (BaseWorld, ArchetypeWorld):
+            world = populate(world_cls, n)
+            entities = list(range(1, n + 1, 10))
+
+            query = time_it(bench_query(world))
+            add = time_it(bench_add(world, entities), bench_remove_if_tagged(world))
+            remove = time_it(bench_remove(world, entities), bench_add(world, entities))
+
+            name = "dict/set" if world_cls is BaseWorld else "archetype"
+            print(f"{n:>10} {name:>10} {query:>9.2f}ms {add:>8.2f}ms {remove:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
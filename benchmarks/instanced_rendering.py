@@ -0,0 +1,99 @@
+"""
+Compare drawing every object with its own draw call against the instanced
+renderer used by `Scene.render`.
+
+This uses a standalone (offscreen) OpenGL context, so it runs on machines
+without a display or GPU, as long as a software OpenGL driver (e.g. Mesa's
+llvmpipe through EGL) is available. Run from the repository root with:
+
+    python -m benchmarks.instanced_rendering
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+import numpy as np
+from pyrr import Vector3
+
+
+def create_context(backend: str) -> mgl.Context:
+    if backend:
+        ctx = mgl.create_standalone_context(require=430, backend=backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+    return ctx
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--size", type=int, nargs=2, default=(640, 360))
+    args = parser.parse_args()
+
+    ctx = create_context(args.backend)
+
+    # These need an active context to import/initialize
+    import nimble.resources.resources
+    from nimble.common.shader_manager import Shaders
+    from nimble.common.models.size import ViewportSize
+    from nimble.interface.orbit_camera import OrbitCamera
+    from nimble.objects import Cube, Material, Model
+    from nimble.objects.instancing import InstancedRenderer
+    from nimble.objects.transform_store import TransformStore
+
+    Shaders().load_defaults()
+    camera = OrbitCamera(ViewportSize(*args.size), radius=40.0, far=500.0)
+    fbo = ctx.simple_framebuffer(tuple(args.size))
+    fbo.use()
+    ctx.enable(mgl.DEPTH_TEST)
+
+    print(f"{'objects':>8} {'per object':>12} {'instanced':>12} {'speedup':>8}")
+    for n in (100, 1_000, 10_000):
+        rng = np.random.default_rng(0)
+        geometry = Cube()
+        models = [
+            Model(
+                Material("viewport", color=tuple(rng.random(3))),
+                geometry=geometry,
+                position=Vector3(rng.uniform(-20, 20, 3), dtype="f4"),
+                scale=Vector3((0.3, 0.3, 0.3), dtype="f4"),
+            )
+            for _ in range(n)
+        ]
+        TransformStore().update()
+        renderer = InstancedRenderer()
+
+        def per_object():
+            for model in models:
+                model.render(camera)
+
+        def instanced():
+            renderer.render(camera, models)
+
+        timings = []
+        for draw in (per_object, instanced):
+            draw()  # Warm up
+            ctx.finish()
+            start = time.perf_counter()
+            for _ in range(args.frames):
+                fbo.clear()
+                draw()
+            ctx.finish()
+            timings.append((time.perf_counter() - start) / args.frames * 1000)
+
+        renderer.release()
+        print(
+            f"{n:>8} {timings[0]:>10.2f}ms {timings[1]:>10.2f}ms "
+            f"{timings[0] / timings[1]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Compare redrawing and uploading the whole overlay texture every frame (what
+`OverlayProcessor.process` used to do) against only redrawing and uploading
+the regions where overlays changed. A score counter like the one in the
+roll-a-ball example is drawn with PIL, with its text either changing every
+frame or staying the same.
+
+Textures need an OpenGL context, so this uses a standalone (offscreen) context
+like `benchmarks.instanced_rendering`. Run from the repository root with:
+
+    python -m benchmarks.overlay_compositing
+"""
+
+import argparse
+import os
+import timeit
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+import numpy as np
+from PIL import Image
+
+
+def time_it(fn: Callable[[], None]) -> float:
+    """Return the best time (in milliseconds) of `fn` over a few runs."""
+    return min(timeit.repeat(fn, number=10, repeat=5)) / 10 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    args = parser.parse_args()
+
+    if args.backend:
+        ctx = mgl.create_standalone_context(require=430, backend=args.backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+
+    import nimble.resources.resources
+    from nimble.common.overlay.overlay import OverlayProcessor
+    from nimble.common.overlay.text_overlay import TextOverlay
+    from nimble.common.world import World
+
+    class PilTextOverlay(TextOverlay):
+        # Text overlays are drawn with OpenGL, so draw this one like any
+        # other overlay instead
+        on_gpu = False
+
+    print(f"{'size':>10} {'text':>10} {'full':>10} {'dirty':>10} {'speedup':>8}")
+    for size in ((1280, 720), (1920, 1080)):
+        texture = ctx.texture(size, 4)
+        world = World()
+        processor = OverlayProcessor(texture)
+        world.add_processor(processor)
+        overlay = PilTextOverlay("Score: 0")
+        overlay.position = (10, 0)
+        world.add_overlay_component(world.create_entity(), overlay)
+
+        def full_redraw():
+            buffer = Image.new("RGBA", size, (0, 0, 0, 0))
+            overlay.draw(buffer)
+            texture.write(np.array(buffer)[::-1].tobytes())
+
+        for changing in (True, False):
+            frame = 0
+
+            def update():
+                nonlocal frame
+                if changing:
+                    frame += 1
+                    overlay.text = f"Score: {frame}"
+
+            def full():
+                update()
+                full_redraw()
+
+            def dirty():
+                update()
+                world.process()
+
+            full_ms = time_it(full)
+            dirty_ms = time_it(dirty)
+            ctx.finish()
+            print(
+                f"{'x'.join(map(str, size)):>10} "
+                f"{'changing' if changing else 'same':>10} "
+                f"{full_ms:>8.3f}ms {dirty_ms:>8.3f}ms {full_ms / dirty_ms:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Run several independent physics simulations (like automated headless
+playtests), one after another in this process and then in parallel worker
+processes, and check that both give the same results.
+
+Every `PhysicsProcessor` has its own physics server, so simulations don't
+interfere, whether they run in the same process or in different ones.
+
+Creating geometries needs an OpenGL context, so every worker creates a
+standalone (offscreen) context like `benchmarks.instanced_rendering`. Run from
+the repository root with:
+
+    python -m benchmarks.parallel_physics
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+
+
+def init_worker(backend: str):
+    import moderngl as mgl
+    import moderngl_window as mglw
+
+    if backend:
+        ctx = mgl.create_standalone_context(require=430, backend=backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+
+    import nimble.resources.resources
+    from nimble.common.shader_manager import Shaders
+
+    Shaders().load_defaults()
+
+
+def playtest(args) -> np.ndarray:
+    """Drop `bodies` spheres onto the ground for `frames` frames, and return
+    their final positions."""
+    seed, bodies, frames = args
+
+    from pyrr import Vector3
+
+    from nimble.common.world import World
+    from nimble.objects import Cube, GeometryCache, Material, Model, Sphere
+    from nimble.objects.component import PhysicsComponent, PhysicsProcessor
+
+    rng = np.random.default_rng(seed)
+    world = World()
+    models = []
+    for i in range(bodies + 1):
+        ground = i == bodies
+        model = Model(
+            Material("viewport"),
+            geometry=GeometryCache().get(Cube if ground else Sphere),
+            position=Vector3(
+                (0, 0, 0) if ground else rng.uniform((-5, 2, -5), (5, 20, 5)),
+                dtype="f4",
+            ),
+            scale=Vector3((20, 1, 20) if ground else (1, 1, 1), dtype="f4"),
+        )
+        component = PhysicsComponent(model, slot_params=[1, 0.5, ground])
+        model.add_component(component)
+        world.add_component(world.create_entity(), component)
+        models.append(model)
+
+    processor = PhysicsProcessor()
+    world.add_processor(processor)
+    for _ in range(frames):
+        processor.step(1 / 60)
+    processor.close()
+
+    return np.array([model.position for model in models[:-1]])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    parser.add_argument("--runs", type=int, default=8)
+    parser.add_argument("--bodies", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    tests = [(seed, args.bodies, args.frames) for seed in range(args.runs)]
+
+    init_worker(args.backend)
+    start = time.perf_counter()
+    serial = [playtest(test) for test in tests]
+    serial_time = time.perf_counter() - start
+
+    # Spawn (instead of fork) so that workers don't inherit this process'
+    # OpenGL context
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(
+        args.processes, initializer=init_worker, initargs=(args.backend,)
+    ) as pool:
+        # Don't count starting the workers
+        pool.map(playtest, [(0, 1, 1)] * args.processes)
+        start = time.perf_counter()
+        parallel = pool.map(playtest, tests)
+        parallel_time = time.perf_counter() - start
+
+    same = all(np.array_equal(a, b) for a, b in zip(serial, parallel))
+    print(
+        f"{args.runs} runs of {args.bodies} bodies for {args.frames} frames: "
+        f"{serial_time:.2f}s in this process, {parallel_time:.2f}s in "
+        f"{args.processes} processes ({serial_time / parallel_time:.1f}x), "
+        f"same results: {same}"
+    )
+
+
+if __name__ == "__main__":
+    main()
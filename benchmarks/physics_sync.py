@@ -0,0 +1,92 @@
+"""
+Compare reading the state of every physics body back into its model one body
+at a time (what `PhysicsProcessor.process` used to do after every step)
+against the bulk readback and write-back used now. The simulation step itself
+isn't timed. Half of the bodies are static.
+
+Creating geometries needs an OpenGL context, so this uses a standalone
+(offscreen) context like `benchmarks.instanced_rendering`. Run from the
+repository root with:
+
+    python -m benchmarks.physics_sync
+"""
+
+import argparse
+import os
+import timeit
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+import numpy as np
+from pyrr import Vector3
+
+
+def time_it(fn: Callable[[], None]) -> float:
+    """Return the best time (in milliseconds) of `fn` over a few runs."""
+    return min(timeit.repeat(fn, number=10, repeat=5)) / 10 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    args = parser.parse_args()
+
+    if args.backend:
+        ctx = mgl.create_standalone_context(require=430, backend=args.backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+
+    import nimble.resources.resources
+    from nimble.common.shader_manager import Shaders
+    from nimble.common.world import World
+    from nimble.objects import Cube, GeometryCache, Material, Model
+    from nimble.objects.component import PhysicsComponent, PhysicsProcessor
+
+    Shaders().load_defaults()
+    print(f"{'bodies':>8} {'per body':>12} {'bulk':>12} {'speedup':>8}")
+    for n in (100, 1_000, 5_000):
+        rng = np.random.default_rng(0)
+        world = World()
+        for i in range(2 * n):
+            model = Model(
+                Material("viewport"),
+                geometry=GeometryCache().get(Cube),
+                position=Vector3(rng.uniform(-50, 50, 3), dtype="f4"),
+            )
+            component = PhysicsComponent(model, slot_params=[1, 0.5, i % 2 == 0])
+            model.add_component(component)
+            world.add_component(world.create_entity(), component)
+
+        processor = PhysicsProcessor()
+        world.add_processor(processor)
+        for _ in range(10):
+            processor.step(processor.time_step)
+
+        p = processor.physics
+
+        def per_body():
+            for _, component in world.get_component(PhysicsComponent):
+                if not component.static.get_value():
+                    pos, rot = p.getBasePositionAndOrientation(component.body_id)
+                    component.model.set_position(pos)
+                    x, y, z = p.getEulerFromQuaternion(rot)
+                    component.model.set_rotation((-x, -y, -z))
+
+        def bulk():
+            processor.current_state = processor.read_state()
+            processor.interpolate(1.0)
+
+        timings = [time_it(per_body), time_it(bulk)]
+        print(
+            f"{n:>8} {timings[0]:>10.3f}ms {timings[1]:>10.3f}ms "
+            f"{timings[0] / timings[1]:>7.1f}x"
+        )
+        processor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Time the primitive mesh builders in `nimble.objects.draw_primitive` as the
+number of segments grows. The builders only use numpy, so this doesn't need an
+OpenGL context. Run from the repository root with:
+
+    python -m benchmarks.primitive_meshes
+"""
+
+import timeit
+from typing import Callable, Dict
+
+import nimble.common  # Imports nimble.objects in the right order
+from nimble.objects.draw_primitive import (
+    Mesh,
+    capsule_mesh,
+    cone_mesh,
+    cylinder_mesh,
+    plane_mesh,
+    sphere_mesh,
+    torus_mesh,
+)
+
+builders: Dict[str, Callable[[int], Mesh]] = {
+    "sphere": lambda n: sphere_mesh(sectors=n, rings=n // 2),
+    "cylinder": lambda n: cylinder_mesh(radial_segments=n, height_segments=n // 2),
+    "cone": lambda n: cone_mesh(radial_segments=n, height_segments=n // 2),
+    "torus": lambda n: torus_mesh(radial_segments=n, tubular_segments=n // 2),
+    "capsule": lambda n: capsule_mesh(sectors=n, rings=n // 4),
+    "plane": lambda n: plane_mesh(subdivisions=n),
+}
+
+
+def time_it(fn: Callable[[], Mesh]) -> float:
+    """Return the best time (in milliseconds) over a few runs of `fn`."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1000
+
+
+def main():
+    print(f"{'primitive':>10} {'segments':>10} {'vertices':>10} {'time':>10}")
+    for name, build in builders.items():
+        for n in (16, 64, 256, 1024):
+            vertices = len(build(n).positions)
+            elapsed = time_it(lambda: build(n))
+            print(f"{name:>10} {n:>10} {vertices:>10} {elapsed:>8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
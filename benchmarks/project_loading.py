@@ -0,0 +1,111 @@
+"""
+Compare loading a project with `Project.load_project` (which blocks the UI
+thread until the scene is loaded) against `Project.load_project_async`, for
+scenes in the JSON and binary formats (see `benchmarks.scene_file` for the
+objects in them). For the background load, this measures the total time and
+the longest time the UI thread was kept busy, with a 1ms timer on it.
+
+Loading from JSON still blocks the UI thread while the background thread
+parses the file, since `json.load` never lets go of the GIL.
+
+Models need an OpenGL context for their materials, so this uses a standalone
+(offscreen) context like `benchmarks.instanced_rendering`. Run from the
+repository root with:
+
+    python -m benchmarks.project_loading
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+
+from benchmarks.scene_file import create_scene_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    args = parser.parse_args()
+
+    if args.backend:
+        ctx = mgl.create_standalone_context(require=430, backend=args.backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+
+    import nimble.resources.resources
+    from PyQt5.QtCore import QCoreApplication, QTimer
+    from nimble.common import ProjectObserver, current_project
+    from nimble.common.scene_file import encode_scene
+    from nimble.common.shader_manager import Shaders
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    Shaders().load_defaults()
+    folder = tempfile.TemporaryDirectory()
+
+    class Finished(ProjectObserver):
+        def load_finished(self, loaded: bool):
+            assert loaded, "the project wasn't loaded"
+            app.exit()
+
+    current_project.add_observer("benchmark", Finished())
+
+    def load_async(file: Path):
+        """Returns the total time, and the longest stall of the UI thread."""
+        stalls = []
+        last = time.perf_counter()
+
+        def tick():
+            nonlocal last
+            now = time.perf_counter()
+            stalls.append(now - last)
+            last = now
+
+        timer = QTimer()
+        timer.timeout.connect(tick)
+        timer.start(1)
+        start = time.perf_counter()
+        current_project.load_project_async(file)
+        app.exec_()
+        timer.stop()
+        return (time.perf_counter() - start) * 1000, max(stalls) * 1000
+
+    print(
+        f"{'objects':>8} {'format':>7} {'blocking':>10} {'async':>10} {'ui stall':>10}"
+    )
+    for n in (1_000, 10_000, 50_000):
+        data = create_scene_data(n)
+        for name in ("json", "binary"):
+            project = Path(folder.name) / f"{name}-{n}"
+            project.mkdir()
+            (project / "project.nimproj").write_text(json.dumps({"name": name}))
+            scene_file = current_project.get_scene_file(project)
+            if name == "json":
+                scene_file.write_text(json.dumps(data))
+            else:
+                scene_file.write_bytes(encode_scene(data))
+            file = current_project.get_project_file(project)
+
+            start = time.perf_counter()
+            current_project.load_project(file)
+            blocking_ms = (time.perf_counter() - start) * 1000
+            async_ms, stall_ms = load_async(file)
+            print(
+                f"{n:>8} {name:>7} {blocking_ms:>8.0f}ms {async_ms:>8.0f}ms "
+                f"{stall_ms:>8.0f}ms"
+            )
+
+    current_project.remove_observer("benchmark")
+    folder.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Compare picking objects with a linear scan over every object (what
+`Scene.cast_ray` used to do), the batched ray/box kernel and the scene's BVH,
+in a scene of 10k objects. Also times building the BVH, and refitting it after objects moved.
+
+Creating geometries needs an OpenGL context, so this uses a standalone
+(offscreen) context like `benchmarks.instanced_rendering`. Run from the
+repository root with:
+
+    python -m benchmarks.ray_picking
+"""
+
+import argparse
+import os
+import timeit
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+import numpy as np
+from pyrr import Vector3
+
+
+def time_it(fn: Callable[[], None], number: int = 1) -> float:
+    """Return the best time (in milliseconds) of `fn` over a few runs."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    parser.add_argument("--objects", type=int, default=10_000)
+    parser.add_argument("--rays", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.backend:
+        ctx = mgl.create_standalone_context(require=430, backend=args.backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+
+    import nimble.resources.resources
+    import nimble.common.models.ray_cast as ray_cast
+    from nimble.common.shader_manager import Shaders
+    from nimble.objects import Cube, GeometryCache, Material, Model, Scene, Sphere
+    from nimble.objects.transform_store import TransformStore
+
+    Shaders().load_defaults()
+
+    rng = np.random.default_rng(0)
+    scene = Scene()
+    for i in range(args.objects):
+        scene.add_obj(
+            Model(
+                Material("viewport"),
+                geometry=GeometryCache().get(Cube if i % 2 else Sphere),
+                name="Object",
+                position=Vector3(rng.uniform(-50, 50, 3), dtype="f4"),
+                rotation=Vector3(rng.uniform(-np.pi, np.pi, 3), dtype="f4"),
+                scale=Vector3(rng.uniform(0.2, 2, 3), dtype="f4"),
+            )
+        )
+
+    rays = [
+        ray_cast.create_ray(
+            Vector3(rng.uniform(-60, 60, 3), dtype="f4"),
+            Vector3(rng.normal(size=3), dtype="f4").normalized,
+        )
+        for _ in range(args.rays)
+    ]
+    models = [scene.objects[name] for name in scene.objects_list]
+
+    # The linear scan is slow, so only time it with a few rays
+    scan_rays = rays[:10]
+
+    def linear_scan():
+        for ray in scan_rays:
+            min_dist = float("inf")
+            for model in models:
+                dist = ray_cast.ray_intersect(model.bounding_box_world, ray)
+                if dist is not None and dist[0] < min_dist:
+                    min_dist = dist[0]
+
+    def bvh_closest():
+        for ray in rays:
+            scene.cast_ray(ray)
+
+    def bvh_all():
+        for ray in rays:
+            scene.cast_ray_all(ray)
+
+    origins = np.array([ray[0] for ray in rays])
+    directions = np.array([ray[1] for ray in rays])
+
+    def batched_scan():
+        # Every ray against every box, in a single call
+        bounds = TransformStore().world_bounds[list(scene.bvh_indices)]
+        ray_cast.intersect_rays_boxes(origins, directions, bounds)
+
+    def build():
+        scene.bvh_outdated = True
+        scene.update_bvh()
+
+    def refit(count: int) -> Callable[[], None]:
+        moved = models[:: len(models) // count][:count]
+
+        def run():
+            for model in moved:
+                model.position = model.position + 0.01
+            scene.update_bvh()
+
+        return run
+
+    build()
+    print(f"{args.objects} objects, times per ray:")
+    print(f"{'linear scan':>20} {time_it(linear_scan) / len(scan_rays):>10.3f}ms")
+    print(f"{'batched scan':>20} {time_it(batched_scan) / len(rays):>10.3f}ms")
+    print(f"{'bvh (closest)':>20} {time_it(bvh_closest) / len(rays):>10.3f}ms")
+    print(f"{'bvh (all hits)':>20} {time_it(bvh_all) / len(rays):>10.3f}ms")
+    print("BVH maintenance:")
+    print(f"{'build':>20} {time_it(build):>10.3f}ms")
+    for count in (1, 100, args.objects):
+        print(f"{f'move {count} + refit':>20} {time_it(refit(count)):>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Compare copying a scene for the game by serializing and unserializing it
+(what `RunWindow.start_game` used to do) against `SceneSnapshot`, for
+scenes of cubes and spheres with physics and script components. Also checks
+that both copies are the same.
+
+Models need an OpenGL context for their materials, so this uses a standalone
+(offscreen) context like `benchmarks.instanced_rendering`. Run from the
+repository root with:
+
+    python -m benchmarks.scene_clone
+"""
+
+import argparse
+import os
+import timeit
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+import numpy as np
+
+
+def time_it(fn: Callable[[], None]) -> float:
+    """Return the best time (in milliseconds) of `fn` over a few runs."""
+    return min(timeit.repeat(fn, number=3, repeat=5)) / 3 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    args = parser.parse_args()
+
+    if args.backend:
+        ctx = mgl.create_standalone_context(require=430, backend=args.backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+
+    import nimble.resources.resources
+    from nimble.common.serialize import serialize_scene, unserialize_scene
+    from nimble.common.shader_manager import Shaders
+    from nimble.objects import (
+        Cube,
+        CustomComponent,
+        GeometryCache,
+        Material,
+        Model,
+        PhysicsComponent,
+        Scene,
+        Sphere,
+    )
+    from nimble.objects.snapshot import SceneSnapshot
+
+    Shaders().load_defaults()
+
+    def create_scene(n: int) -> Scene:
+        rng = np.random.default_rng(0)
+        scene = Scene()
+        for i in range(n):
+            model = Model(
+                Material("viewport", color=tuple(rng.random(3))),
+                geometry=GeometryCache().get(Sphere if i % 2 else Cube),
+                name=f"Object {i}",
+                position=rng.uniform(-50, 50, 3).astype("f4"),
+                rotation=rng.uniform(0, 6, 3).astype("f4"),
+            )
+            model.add_component(PhysicsComponent(model, slot_params=[1, 0.5, i == 0]))
+            model.add_component(CustomComponent(model, slot_params=["spin.py"]))
+            scene.objects[model.name] = model
+            scene.objects_list.append(model.name)
+        return scene
+
+    print(f"{'objects':>8} {'json':>10} {'snapshot':>10} {'speedup':>8}")
+    for n in (100, 1_000, 5_000):
+        scene = create_scene(n)
+
+        copies = {}
+
+        def copy_with(name: str, fn: Callable[[], Scene]):
+            def copy():
+                # Only keep the last copy around, like the game does
+                if name in copies:
+                    copies[name].release()
+                copies[name] = fn()
+
+            return copy
+
+        json_ms = time_it(
+            copy_with("json", lambda: unserialize_scene(serialize_scene(scene)))
+        )
+        snapshot_ms = time_it(
+            copy_with("snapshot", lambda: SceneSnapshot(scene).instantiate())
+        )
+
+        expected = serialize_scene(scene)
+        for copy in copies.values():
+            assert serialize_scene(copy) == expected, "the copies differ"
+            copy.release()
+        scene.release()
+        print(
+            f"{n:>8} {json_ms:>8.2f}ms {snapshot_ms:>8.2f}ms "
+            f"{json_ms / snapshot_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
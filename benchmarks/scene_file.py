@@ -0,0 +1,169 @@
+"""
+Compare loading a scene from the JSON format against the binary format (see
+`nimble.common.scene_file`), for scenes of cubes and spheres with physics
+and script components: the size of the files, opening them, reading a
+single object and creating every model of the scene. Also checks that both
+formats load the same scene.
+
+Models need an OpenGL context for their materials, so this uses a standalone
+(offscreen) context like `benchmarks.instanced_rendering`. Run from the
+repository root with:
+
+    python -m benchmarks.scene_file
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+import numpy as np
+
+
+def time_it(fn: Callable[[], None], number: int = 3) -> float:
+    """Return the best time (in milliseconds) of `fn` over a few runs."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1000
+
+
+def create_scene_data(n: int):
+    """The JSON-compatible representation of a scene with `n` objects."""
+    rng = np.random.default_rng(0)
+    colors = rng.random((8, 3)).round(3).tolist()
+    objects = {}
+    for i in range(n):
+        name = f"Object {i}"
+        objects[name] = {
+            "material": {
+                "shader": "viewport",
+                "material_params": {
+                    "pass_mvp": False,
+                    "draw_wireframe": False,
+                    "draw_bounding_box": False,
+                    "pass_model_matrix": True,
+                    "color": colors[i % len(colors)],
+                },
+            },
+            "name": name,
+            "rotation": rng.uniform(0, 6, 3).astype("f4").tolist(),
+            "position": rng.uniform(-50, 50, 3).astype("f4").tolist(),
+            "scale": [1.0, 1.0, 1.0],
+            "geometry": (
+                {"class_name": "Sphere", "kwargs": {"radius": 0.5}}
+                if i % 2
+                else {"class_name": "Cube", "kwargs": {"size": [1, 1, 1]}}
+            ),
+            "components": [
+                {
+                    "class_name": "PhysicsComponent",
+                    "component_id": None,
+                    "slot_values": [1, 0.5, i == 0],
+                },
+                {
+                    "class_name": "CustomComponent",
+                    "component_id": i,
+                    "slot_values": ["spin.py"],
+                },
+            ],
+        }
+    return {"objects": objects, "objects_list": list(objects), "active_idx": -1}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    args = parser.parse_args()
+
+    if args.backend:
+        ctx = mgl.create_standalone_context(require=430, backend=args.backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+
+    import nimble.resources.resources
+    from nimble.common.scene_file import SceneFile, encode_scene
+    from nimble.common.serialize import serialize_scene, unserialize_scene
+    from nimble.common.shader_manager import Shaders
+
+    Shaders().load_defaults()
+    folder = tempfile.TemporaryDirectory()
+
+    print(
+        f"{'objects':>8} {'format':>7} {'size':>10} {'open':>10} "
+        f"{'1 object':>10} {'load':>10}"
+    )
+    for n in (1_000, 10_000, 50_000):
+        data = create_scene_data(n)
+        json_file = Path(folder.name) / "scene.json"
+        binary_file = Path(folder.name) / "scene.bin"
+        with open(json_file, "w") as f:
+            json.dump(data, f)
+        binary_file.write_bytes(encode_scene(data))
+
+        def open_json():
+            with open(json_file, "r") as f:
+                return json.load(f)
+
+        def load_json():
+            scene = unserialize_scene(open_json())
+            scene.release()
+
+        def open_binary():
+            SceneFile.open(binary_file).close()
+
+        def read_one_binary():
+            with SceneFile.open(binary_file) as scene_file:
+                scene_file.model_data(scene_file.index(f"Object {n // 2}"))
+
+        def load_binary():
+            with SceneFile.open(binary_file) as scene_file:
+                scene = scene_file.load_scene()
+            scene.release()
+
+        # Reading a single object from JSON means parsing all of it
+        json_open_ms = time_it(open_json)
+        results = [
+            ("json", json_file, json_open_ms, json_open_ms, time_it(load_json, 1)),
+            (
+                "binary",
+                binary_file,
+                time_it(open_binary, 100),
+                time_it(read_one_binary, 10),
+                time_it(load_binary, 1),
+            ),
+        ]
+        for (name, file, open_ms, one_ms, load_ms) in results:
+            print(
+                f"{n:>8} {name:>7} {file.stat().st_size / 1024:>8.0f}KB "
+                f"{open_ms:>8.3f}ms {one_ms:>8.3f}ms {load_ms:>8.1f}ms"
+            )
+
+        with SceneFile.open(binary_file) as scene_file:
+            scene = scene_file.load_scene()
+        assert serialize_scene(scene) == data, "the scenes differ"
+        scene.release()
+
+    # Names can be empty (e.g. while an object is renamed in the editor)
+    data = create_scene_data(15)
+    data["objects"] = {
+        ("" if name == "Object 0" else name): dict(
+            model, name="" if name == "Object 0" else name
+        )
+        for (name, model) in data["objects"].items()
+    }
+    data["objects_list"] = list(reversed(data["objects"]))
+    with SceneFile(encode_scene(data)) as scene_file:
+        assert scene_file.names == list(data["objects"]), "the names differ"
+        assert scene_file.to_json() == data, "the scenes differ"
+
+    folder.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Compare how scripts used to be run (`get_component` and a call per model
+every frame, with the first error aborting the frame) against
+`ScriptProcessor` running the same script per model, and against a script
+that defines `process_batch` instead. Every script spins its models, like the
+food in the roll-a-ball example.
+
+Models need an OpenGL context for their materials, so this uses a standalone
+(offscreen) context like `benchmarks.instanced_rendering`. Run from the
+repository root with:
+
+    python -m benchmarks.script_dispatch
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+
+SCRIPT = """\
+from nimble.objects import BaseComponent
+
+class Component(BaseComponent):
+    def process(self, obj):
+        obj.rotate((0.012, 0.024, 0.036))
+"""
+
+BATCH_SCRIPT = """\
+from nimble.objects import BaseComponent
+
+class Component(BaseComponent):
+    def process_batch(self, models):
+        models.rotate((0.012, 0.024, 0.036))
+"""
+
+
+def time_it(fn: Callable[[], None]) -> float:
+    """Return the best time (in milliseconds) of `fn` over a few runs."""
+    return min(timeit.repeat(fn, number=10, repeat=5)) / 10 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    args = parser.parse_args()
+
+    if args.backend:
+        ctx = mgl.create_standalone_context(require=430, backend=args.backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+
+    import nimble.resources.resources
+    from nimble.common import current_project
+    from nimble.common.shader_manager import Shaders
+    from nimble.common.world import World
+    from nimble.objects import CustomComponent, Material, Model, ScriptProcessor
+
+    Shaders().load_defaults()
+    folder = tempfile.TemporaryDirectory()
+    current_project.folder = Path(folder.name)
+    (current_project.folder / "spin.py").write_text(SCRIPT)
+    (current_project.folder / "spin_batch.py").write_text(BATCH_SCRIPT)
+
+    def create_world(n: int, script: str) -> World:
+        world = World()
+        components = []
+        for _ in range(n):
+            model = Model(Material("viewport"))
+            component = CustomComponent(model, slot_params=[script])
+            world.add_component(
+                world.create_entity(), component, type_alias=component.type_alias
+            )
+            components.append(component)
+
+        processor = ScriptProcessor(components)
+        world.add_processor(processor)
+        processor.init()
+        return world
+
+    print(f"{'models':>8} {'before':>10} {'per model':>10} {'batch':>10}")
+    for n in (100, 1_000, 10_000):
+        world = create_world(n, "spin.py")
+        processor = world.get_processor(ScriptProcessor)
+
+        def before():
+            for pid, script in processor.processors.items():
+                for _, component in world.get_component(pid):
+                    script.process(component.model)
+
+        before_ms = time_it(before)
+        per_model_ms = time_it(processor.process)
+
+        world = create_world(n, "spin_batch.py")
+        batch_ms = time_it(world.get_processor(ScriptProcessor).process)
+        print(f"{n:>8} {before_ms:>8.3f}ms {per_model_ms:>8.3f}ms {batch_ms:>8.3f}ms")
+
+    folder.cleanup()
+
+
+if __name__ == "__main__":
+    main()
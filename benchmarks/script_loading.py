@@ -0,0 +1,74 @@
+"""
+Compare getting the code of every script of a project by reading and
+compiling it (what `ScriptProcessor.get_processor_from_script` used to do
+every time a game started) against `ScriptCache`: once from its cache
+directory (like the first game after opening the editor), and once from
+memory (like every game after that).
+
+Run from the repository root with:
+
+    python -m benchmarks.script_loading
+"""
+
+import argparse
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Callable
+
+from nimble.common.script_cache import ScriptCache
+
+# A script of a few hundred lines, like a large gameplay script
+SCRIPT = "from nimble.objects import BaseComponent\n\n\n" + "\n".join(f"""\
+class Component{i}(BaseComponent):
+    def init(self):
+        self.speed = {i} * 0.01
+        self.names = [str(n) for n in range({i})]
+
+    def process(self, obj):
+        if obj.position.y < 0.5:
+            obj.rotate((self.speed, self.speed * 2, self.speed * 3))
+""" for i in range(40))
+
+
+def time_it(fn: Callable[[], None]) -> float:
+    """Return the best time (in milliseconds) of `fn` over a few runs."""
+    return min(timeit.repeat(fn, number=3, repeat=5)) / 3 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+
+    print(f"{'scripts':>8} {'compile':>10} {'disk':>10} {'memory':>10}")
+    for n in (10, 100, 500):
+        with tempfile.TemporaryDirectory() as folder:
+            paths = [Path(folder) / f"script_{i}.py" for i in range(n)]
+            for i, path in enumerate(paths):
+                path.write_text(f"# Script {i}\n{SCRIPT}")
+
+            def read_and_compile():
+                for path in paths:
+                    with open(path, "r") as f:
+                        compile(f.read(), str(path), "exec")
+
+            cache = ScriptCache()
+
+            def from_disk():
+                cache.entries.clear()
+                for path in paths:
+                    cache.get(path)
+
+            def from_memory():
+                for path in paths:
+                    cache.get(path)
+
+            compile_ms = time_it(read_and_compile)
+            disk_ms = time_it(from_disk)
+            memory_ms = time_it(from_memory)
+            print(f"{n:>8} {compile_ms:>8.2f}ms {disk_ms:>8.2f}ms {memory_ms:>8.2f}ms")
+            cache.entries.clear()
+
+
+if __name__ == "__main__":
+    main()
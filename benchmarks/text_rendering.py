@@ -0,0 +1,90 @@
+"""
+Compare drawing many text labels (like damage numbers) with PIL into the
+overlay texture, and uploading it (what `TextOverlay` used to do), against
+drawing them with OpenGL from a glyph atlas with `TextRenderer`. Every label
+changes its text and moves every frame, the worst case for both.
+
+Textures need an OpenGL context, so this uses a standalone (offscreen) context
+like `benchmarks.instanced_rendering`. Run from the repository root with:
+
+    python -m benchmarks.text_rendering
+"""
+
+import argparse
+import os
+import timeit
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+import numpy as np
+from PIL import Image
+
+
+def time_it(fn: Callable[[], None]) -> float:
+    """Return the best time (in milliseconds) of `fn` over a few runs."""
+    return min(timeit.repeat(fn, number=10, repeat=5)) / 10 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    args = parser.parse_args()
+
+    if args.backend:
+        ctx = mgl.create_standalone_context(require=430, backend=args.backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+
+    import nimble.resources.resources
+    from nimble.common.overlay.text_overlay import TextOverlay
+    from nimble.common.overlay.text_renderer import TextRenderer
+    from nimble.common.shader_manager import Shaders
+
+    Shaders().load_defaults()
+    size = (1280, 720)
+    screen = ctx.simple_framebuffer(size)
+    screen.use()
+    ctx.enable(mgl.BLEND)
+    ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE_MINUS_SRC_ALPHA
+    texture = ctx.texture(size, 4)
+    renderer = TextRenderer()
+
+    print(f"{'labels':>8} {'PIL':>10} {'atlas':>10} {'speedup':>8}")
+    for n in (10, 100, 500):
+        rng = np.random.default_rng(0)
+        labels = [TextOverlay("", font_size=24) for _ in range(n)]
+        frame = 0
+
+        def update():
+            nonlocal frame
+            frame += 1
+            for i, label in enumerate(labels):
+                label.text = f"-{(frame + i) % 1000}"
+                label.position = tuple(rng.integers(0, (1200, 690)).tolist())
+
+        def pil():
+            update()
+            buffer = Image.new("RGBA", size, (0, 0, 0, 0))
+            for label in labels:
+                label.draw(buffer)
+            texture.write(np.array(buffer)[::-1].tobytes())
+            ctx.finish()
+
+        def atlas():
+            update()
+            renderer.render(ctx, labels, size)
+            ctx.finish()
+
+        pil_ms = time_it(pil)
+        atlas_ms = time_it(atlas)
+        print(f"{n:>8} {pil_ms:>8.3f}ms {atlas_ms:>8.3f}ms {pil_ms / atlas_ms:>7.1f}x")
+
+    renderer.release()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Measure undoing and redoing changes with the `CommandJournal` of a scene,
+for scenes of increasing size (with the objects of `benchmarks.scene_file`).
+A drag of 1000 mouse moves is recorded as one change, which is undone and
+redone; so is deleting an object. Neither should take longer in a bigger
+scene. For comparison, this also measures serializing the whole scene, which
+is what a snapshot of the scene per change would cost.
+
+The journal is then filled with changes, to check that it stays within its
+memory budget.
+
+Models need an OpenGL context for their materials, so this uses a standalone
+(offscreen) context like `benchmarks.instanced_rendering`. Run from the
+repository root with:
+
+    python -m benchmarks.undo
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+
+from benchmarks.scene_file import create_scene_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.backend:
+        ctx = mgl.create_standalone_context(require=430, backend=args.backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+
+    import nimble.resources.resources
+    from nimble.common.serialize import serialize_scene, unserialize_scene
+    from nimble.common.shader_manager import Shaders
+
+    Shaders().load_defaults()
+
+    def per_call(fn, repeat: int) -> float:
+        """The average time of `fn`, in microseconds."""
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        return (time.perf_counter() - start) / repeat * 1e6
+
+    print(
+        f"{'objects':>8} {'drag undo+redo':>15} {'delete undo+redo':>17} "
+        f"{'serialize':>10}"
+    )
+    for n in (1_000, 10_000, 50_000):
+        scene = unserialize_scene(create_scene_data(n))
+        journal = scene.journal
+        idx = n // 2
+        model = scene.get_obj_from_idx(idx)
+
+        for _ in range(1000):
+            old = tuple(model.position)
+            model.translate((0.001, 0, 0))
+            journal.set_field(idx, model, "position", old, merge=True)
+        journal.seal()
+        assert len(journal.undo_stack) == 1
+
+        def undo_redo():
+            journal.undo()
+            journal.redo()
+
+        drag_us = per_call(undo_redo, args.repeat)
+
+        journal.delete_obj(idx)
+        delete_us = per_call(undo_redo, args.repeat)
+
+        serialize_us = per_call(lambda: serialize_scene(scene), 1)
+        print(
+            f"{n:>8} {drag_us:>13.1f}us {delete_us:>15.1f}us "
+            f"{serialize_us / 1000:>8.1f}ms"
+        )
+
+        if n == 1_000:
+            journal.clear()
+            journal.budget = 64 * 1024
+            count = len(scene.objects_list)
+            for i in range(100_000):
+                m = scene.get_obj_from_idx(i % count)
+                old = tuple(m.scale)
+                m.scale = (1 + i, 1, 1)
+                journal.set_field(i % count, m, "scale", old)
+            print(
+                f"100000 changes: {len(journal.undo_stack)} kept, "
+                f"{journal.used} of {journal.budget} bytes"
+            )
+
+        scene.release()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,14 @@
-from nimble.launch import start
+import sys
 
-start()
+if len(sys.argv) > 1 and sys.argv[1] == "run":
+    from nimble.headless import main
+
+    main(sys.argv[2:])
+elif len(sys.argv) > 1 and sys.argv[1] == "convert":
+    from nimble.common.scene_file import main
+
+    main(sys.argv[2:])
+else:
+    from nimble.launch import start
+
+    start()
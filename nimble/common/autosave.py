@@ -0,0 +1,345 @@
+"""Autosaving of the scene, to a journal of the objects that changed."""
+
+from __future__ import annotations
+import json
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from PyQt5.QtCore import QTimer
+
+from nimble.common.scene_file import encode_scene, read_scene_data
+from nimble.common.script_cache import ScriptCache
+from nimble.common.serialize import serialize_model, serialize_scene
+from nimble.objects import Model, ModelObserver, Scene, SceneObserver
+from nimble.utils import write_atomically
+
+
+def apply_entry(data: Any, entry: Any):
+    """Apply an entry of the journal to a scene (in the format of
+    `serialize_scene`), in place."""
+    objects: Dict[str, Any] = data["objects"]
+    objects.update(entry.get("objects", {}))
+    data["active_idx"] = entry["active_idx"]
+
+    if "objects_list" in entry:
+        data["objects_list"] = entry["objects_list"]
+    elif "removed" in entry or "added" in entry:
+        # Applying an entry twice gives the same result
+        removed = set(entry.get("removed", ()))
+        objects_list = [name for name in data["objects_list"] if name not in removed]
+        present = set(objects_list)
+        objects_list += [name for name in entry.get("added", ()) if name not in present]
+        data["objects_list"] = objects_list
+    else:
+        return
+
+    # Forget the objects that were deleted (or renamed)
+    data["objects"] = {
+        name: objects[name] for name in data["objects_list"] if name in objects
+    }
+
+
+class Autosave(SceneObserver, ModelObserver):
+    """Saves the changes to the scene in the background, so they can be
+    recovered (with `recover`) if the editor crashes.
+
+    Only the objects that changed are saved. They are found with the
+    notifications of the scene, and of the selected object (the only one that
+    can be edited). Every `interval` milliseconds, the changed objects are
+    serialized and appended to a journal (`autosave.journal`, in the
+    `.nimblecache` folder of the project) as a line of JSON. After
+    `compact_after` entries, the journal is compacted instead: the whole scene
+    is written to a snapshot in the binary format (`autosave.nimscn`), and the
+    journal starts over. The scene is never serialized as a whole for this,
+    because a serialized copy of it is kept up to date with every entry.
+
+    Files are written by a background thread, and atomically, so a crash
+    never leaves a broken snapshot behind (and at most the last line of the
+    journal). The UI thread only serializes the objects that changed.
+
+    Saving the scene deletes the snapshot and the journal, so changes are
+    journaled relative to the saved scene again. So does closing the editor
+    (see `stop`), which discards the unsaved changes; only a crash leaves an
+    autosave behind.
+    """
+
+    # In milliseconds
+    interval = 2000
+    compact_after = 100
+
+    snapshot_name = "autosave.nimscn"
+    journal_name = "autosave.journal"
+
+    def __init__(self, scene: Scene):
+        self.scene = scene
+        # The project folder that is autosaved to, or `None` while stopped
+        self.folder: Optional[Path] = None
+
+        # The scene as of the last entry, in the format of `serialize_scene`
+        self.data: Any = None
+        self.changed: Set[Model] = set()
+        self.structure_changed = False
+        self.active: Optional[Model] = None
+        self.entries = 0
+
+        self.timer: Optional[QTimer] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.writes: List[Future] = []
+
+        scene.register_observer(self)
+        scene.register_active_obj_observer(self, "autosave")
+        # Emitted when objects are added, deleted or renamed
+        scene.dataChanged.connect(self.objects_changed)
+
+    @classmethod
+    def paths(cls, folder: Path):
+        directory = Path(folder) / ScriptCache.directory_name
+        return (directory / cls.snapshot_name, directory / cls.journal_name)
+
+    @classmethod
+    def recover(cls, folder: Path, scene_file: Path) -> Optional[Any]:
+        """The scene of the project in `folder` with its autosaved changes (in
+        the format of `serialize_scene`), or `None` if there are none."""
+        snapshot, journal = cls.paths(folder)
+        entries = []
+        if journal.exists():
+            with open(journal, "r") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # The last line was only partly written
+                        break
+
+        if not entries and not snapshot.exists():
+            return None
+
+        data = read_scene_data(snapshot if snapshot.exists() else scene_file)
+        for entry in entries:
+            apply_entry(data, entry)
+        return data
+
+    @property
+    def running(self) -> bool:
+        return self.folder is not None
+
+    def start(self, folder: Path, data: Any = None, recovered: bool = False):
+        """Start autosaving to the project in `folder`. `data` is the scene
+        in the format of `serialize_scene`, if it's known already (otherwise,
+        the scene is serialized). With `recovered`, `data` was returned by
+        `recover`. Otherwise, any older autosave is deleted."""
+        self.stop()
+        self.folder = Path(folder)
+        self.changed.clear()
+        self.structure_changed = False
+        self.active = self.scene.get_active()
+        self.entries = 0
+        self.data = serialize_scene(self.scene) if data is None else data
+
+        if recovered:
+            # Start over from a snapshot of the recovered scene
+            self.compact()
+        else:
+            self.submit(self.delete_files, *self.paths(self.folder))
+
+        if self.timer is None:
+            self.timer = QTimer()
+            self.timer.timeout.connect(self.flush)
+        self.timer.start(self.interval)
+
+    def stop(self, discard: bool = False):
+        """Save the last changes (or delete the autosave, with `discard`),
+        and wait for them to be written."""
+        if not self.running:
+            return
+
+        if discard:
+            self.submit(self.delete_files, *self.paths(self.folder))
+        else:
+            self.flush()
+        self.timer.stop()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        self.check_writes()
+        self.folder = None
+        self.data = None
+        self.changed.clear()
+        self.active = None
+
+    def saved(self, data: Any):
+        """Start the journal over, after the scene was saved as `data` (in
+        the format of `serialize_scene`)."""
+        if not self.running:
+            return
+
+        self.data = data
+        self.changed.clear()
+        self.structure_changed = False
+        self.entries = 0
+        self.submit(self.delete_files, *self.paths(self.folder))
+
+    def flush(self):
+        """Journal the changes since the last flush."""
+        self.check_writes()
+        if not self.running:
+            return
+
+        entry = self.changes()
+        if entry is None:
+            return
+
+        apply_entry(self.data, entry)
+        self.entries += 1
+        if self.entries >= self.compact_after:
+            self.compact()
+        else:
+            _, journal = self.paths(self.folder)
+            self.submit(self.append, journal, entry)
+
+    def compact(self):
+        """Write the whole scene to the snapshot, and empty the journal."""
+        self.entries = 0
+        # The copy of the scene keeps changing, so the snapshot gets its own
+        # copy of it (the serialized objects themselves are never changed)
+        data = {
+            "objects": dict(self.data["objects"]),
+            "objects_list": list(self.data["objects_list"]),
+            "active_idx": self.data["active_idx"],
+        }
+        self.submit(self.write_snapshot, *self.paths(self.folder), data)
+
+    def changes(self) -> Optional[Any]:
+        """An entry for the journal with the changes since the last one, or
+        `None` if nothing changed."""
+        scene = self.scene
+        entry: Dict[str, Any] = {}
+        objects: Dict[str, Any] = {}
+
+        names = scene.objects_list
+        if self.structure_changed and names != self.data["objects_list"]:
+            old = self.data["objects_list"]
+            old_names, new_names = set(old), set(names)
+            removed = [name for name in old if name not in new_names]
+            added = [name for name in names if name not in old_names]
+            if [name for name in old if name in new_names] + added == names:
+                entry["removed"] = removed
+                entry["added"] = added
+            else:
+                # Objects were renamed (or moved)
+                entry["objects_list"] = list(names)
+
+            for name in added:
+                objects[name] = serialize_model(scene.objects[name])
+        self.structure_changed = False
+
+        # The selected object can also be changed without any notifications
+        # (e.g. its color, or the slots of its components)
+        active = scene.get_active()
+        if active is not None:
+            self.changed.add(active)
+
+        for model in self.changed:
+            name = model.name
+            if name in objects or scene.objects.get(name) is not model:
+                # New, or deleted since
+                continue
+            data = serialize_model(model)
+            if data != self.data["objects"].get(name):
+                objects[name] = data
+        self.changed.clear()
+
+        if objects:
+            entry["objects"] = objects
+        if not entry:
+            return None
+        entry["active_idx"] = scene.active_idx
+        return entry
+
+    def submit(self, fn, *args):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(1, thread_name_prefix="autosave")
+        self.writes.append(self.executor.submit(fn, *args))
+
+    def check_writes(self):
+        """Log the errors of finished writes (from the UI thread)."""
+        pending = []
+        for write in self.writes:
+            if not write.done():
+                pending.append(write)
+            elif write.exception() is not None:
+                logging.getLogger("nimble").warning(
+                    f"Couldn't autosave the scene: {write.exception()}"
+                )
+        self.writes = pending
+
+    # These run in the background thread, in the order they were submitted
+
+    @staticmethod
+    def append(journal: Path, entry: Any):
+        line = json.dumps(entry) + "\n"
+        journal.parent.mkdir(exist_ok=True)
+        with open(journal, "a") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def write_snapshot(snapshot: Path, journal: Path, data: Any):
+        snapshot.parent.mkdir(exist_ok=True)
+        write_atomically(snapshot, encode_scene(data))
+        # Everything in the journal is in the snapshot now
+        write_atomically(journal, b"")
+
+    @staticmethod
+    def delete_files(*paths: Path):
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+    # Notifications of the selected object
+
+    def mark_changed(self, obj: Model):
+        if self.running:
+            self.changed.add(obj)
+
+    def translation_changed(self, obj: Model) -> None:
+        self.mark_changed(obj)
+
+    def rotation_changed(self, obj: Model) -> None:
+        self.mark_changed(obj)
+
+    def scale_changed(self, obj: Model) -> None:
+        self.mark_changed(obj)
+
+    def component_added(self, obj: Model, component_id: int) -> None:
+        self.mark_changed(obj)
+
+    def component_removed(self, obj: Model, component_id: int) -> None:
+        self.mark_changed(obj)
+
+    def color_changed(self, obj: Model) -> None:
+        self.mark_changed(obj)
+
+    def slots_changed(self, obj: Model, component_id: int) -> None:
+        self.mark_changed(obj)
+
+    # Notifications of the scene
+
+    def select_changed(self, idx: int, obj: Optional[Model]) -> None:
+        # Catch the changes to the previous selection that had no
+        # notifications
+        if self.active is not None:
+            self.mark_changed(self.active)
+        self.active = obj
+
+    def obj_deleted(self, deleted_idx: int) -> None:
+        self.structure_changed = True
+
+    def obj_name_changed(self, idx: int, obj: Model) -> None:
+        self.structure_changed = True
+
+    def objects_changed(self, *_):
+        self.structure_changed = True
@@ -7,8 +7,11 @@ integrate it more into nimble.
 """
 
 import time as _time
+from itertools import count as _count
 
 from typing import Any as _Any
+from typing import Dict as _Dict
+from typing import FrozenSet as _FrozenSet
 from typing import Iterable as _Iterable
 from typing import List as _List
 from typing import Optional as _Optional
@@ -43,6 +46,64 @@ class Processor:
         pass
 
 
+class _CachedQuery:
+    """The cached result of a `get_component`/`get_components` call.
+    Keeps track of which row each Entity is in, so the result can be patched
+    in place when a single Entity changes.
+    Once the result is handed out (with `share`), it's copied before it's
+    patched, so a caller iterating over it never sees it change.
+    """
+
+    __slots__ = ("component_types", "single", "results", "rows", "version", "shared")
+
+    # Shared by every query, so a version is never reused (even after the
+    # cache is cleared)
+    _versions = _count()
+
+    def __init__(self, component_types: _Tuple[_Any, ...], single: bool, results):
+        self.component_types = component_types
+        self.single = single
+        self.results = results
+        self.rows = {entity: row for row, (entity, _) in enumerate(results)}
+        self.version = next(self._versions)
+        self.shared = False
+
+    def share(self):
+        """The result, which won't change anymore."""
+        self.shared = True
+        return self.results
+
+    def _unshare(self) -> None:
+        if self.shared:
+            self.results = list(self.results)
+            self.shared = False
+
+    def update(self, entity: int, components: _List[_Any]) -> None:
+        """Insert or replace the row of an Entity."""
+        row = (entity, components[0] if self.single else components)
+        self.version = next(self._versions)
+        self._unshare()
+        index = self.rows.get(entity)
+        if index is None:
+            self.rows[entity] = len(self.results)
+            self.results.append(row)
+        else:
+            self.results[index] = row
+
+    def discard(self, entity: int) -> None:
+        """Remove the row of an Entity, if it has one."""
+        index = self.rows.pop(entity, None)
+        if index is None:
+            return
+
+        self.version = next(self._versions)
+        self._unshare()
+        last = self.results.pop()
+        if index < len(self.results):
+            self.results[index] = last
+            self.rows[last[0]] = index
+
+
 class BaseWorld:
     """A World object keeps track of all Entities, Components, and Processors.
     A World contains a database of all Entity/Component assignments. The World
@@ -50,7 +111,7 @@ class BaseWorld:
     frame of your game.
     """
 
-    def __init__(self, timed=False):
+    def __init__(self, timed=False, profiler=None):
         self._processors = []
         self._next_entity_id = 0
         self._components = {}
@@ -58,13 +119,40 @@ class BaseWorld:
         self._dead_entities = set()
         self._get_component_cache = {}
         self._get_components_cache = {}
-        if timed:
+        self._type_queries = {}
+        # An object with a `record(name, start, end)` method (like
+        # `nimble.common.profiler.FrameProfiler`), which gets the start and
+        # end time of every Processor
+        self.profiler = profiler
+        if timed or profiler is not None:
             self.process_times = {}
             self._process = self._timed_process
 
     def clear_cache(self) -> None:
         self._get_component_cache = {}
         self._get_components_cache = {}
+        self._type_queries = {}
+
+    def _cache_query(self, cache, key, component_types, single, results):
+        query = _CachedQuery(component_types, single, results)
+        cache[key] = query
+        for component_type in set(component_types):
+            self._type_queries.setdefault(component_type, []).append(query)
+        return query
+
+    def _component_added(self, entity: int, component_type: _Any) -> None:
+        """Patch the cached queries involving `component_type`, after a
+        Component of that type was added to (or replaced on) an Entity."""
+        for query in self._type_queries.get(component_type, ()):
+            components = self.try_components(entity, *query.component_types)
+            if components is not None:
+                query.update(entity, components)
+
+    def _component_removed(self, entity: int, component_type: _Any) -> None:
+        """Patch the cached queries involving `component_type`, after a
+        Component of that type was removed from an Entity."""
+        for query in self._type_queries.get(component_type, ()):
+            query.discard(entity)
 
     def clear_database(self) -> None:
         """Remove all Entities and Components from the World."""
@@ -145,8 +233,9 @@ class BaseWorld:
                 if not self._components[component_type]:
                     del self._components[component_type]
 
+                self._component_removed(entity, component_type)
+
             del self._entities[entity]
-            self.clear_cache()
 
         else:
             self._dead_entities.add(entity)
@@ -232,7 +321,7 @@ class BaseWorld:
             self._entities[entity] = {}
 
         self._entities[entity][component_type] = component_instance
-        self.clear_cache()
+        self._component_added(entity, component_type)
 
     def remove_component(self, entity: int, component_type: _Type[_C]) -> int:
         """Remove a Component instance from an Entity, by type.
@@ -254,7 +343,7 @@ class BaseWorld:
         if not self._entities[entity]:
             del self._entities[entity]
 
-        self.clear_cache()
+        self._component_removed(entity, component_type)
         return entity
 
     def _get_component(self, component_type: _Type[_C]) -> _Iterable[_Tuple[int, _C]]:
@@ -287,26 +376,47 @@ class BaseWorld:
     def get_component(self, component_type: _Type[_C]) -> _List[_Tuple[int, _C]]:
         """Return a sequence of (entity, component) pairs for each entity with
         component_type.
+        The result is cached until a Component of component_type is added or
+        removed. The returned list itself never changes, so Components can be
+        added or removed while iterating over it.
         """
         try:
-            return self._get_component_cache[component_type]
+            return self._get_component_cache[component_type].share()
         except KeyError:
-            return self._get_component_cache.setdefault(
-                component_type, list(self._get_component(component_type))
-            )
+            return self._cache_query(
+                self._get_component_cache,
+                component_type,
+                (component_type,),
+                True,
+                list(self._get_component(component_type)),
+            ).share()
+
+    def get_component_version(self, component_type: _Type[_C]) -> int:
+        """Return a number that changes every time the result of
+        `get_component(component_type)` changes, so work derived from it
+        can be cached until then.
+        """
+        self.get_component(component_type)
+        return self._get_component_cache[component_type].version
 
     def get_components(
         self, *component_types: _Type[_C]
     ) -> _List[_Tuple[int, _List[_C]]]:
         """Return a sequence of (entity, (*components)) pairs for each entity
         with every component in component_types.
+        Like `get_component`, the result is cached, and never changes once
+        it's returned.
         """
         try:
-            return self._get_components_cache[component_types]
+            return self._get_components_cache[component_types].share()
         except KeyError:
-            return self._get_components_cache.setdefault(
-                component_types, list(self._get_components(*component_types))
-            )
+            return self._cache_query(
+                self._get_components_cache,
+                component_types,
+                component_types,
+                False,
+                list(self._get_components(*component_types)),
+            ).share()
 
     def try_component(self, entity: int, component_type: _Type[_C]) -> _Optional[_C]:
         """Try to get a single component type for an Entity.
@@ -353,22 +463,26 @@ class BaseWorld:
                 if not self._components[component_type]:
                     del self._components[component_type]
 
+                self._component_removed(entity, component_type)
+
             del self._entities[entity]
 
         self._dead_entities.clear()
-        self.clear_cache()
 
     def _process(self, *args, **kwargs):
         for processor in self._processors:
             processor.process(*args, **kwargs)
 
     def _timed_process(self, *args, **kwargs):
-        """Track Processor execution time for benchmarking."""
+        """Track Processor execution time (in milliseconds) for benchmarking."""
         for processor in self._processors:
-            start_time = _time.process_time()
+            start_time = _time.perf_counter()
             processor.process(*args, **kwargs)
-            process_time = int(round((_time.process_time() - start_time) * 1000, 2))
-            self.process_times[processor.__class__.__name__] = process_time
+            end_time = _time.perf_counter()
+            name = processor.__class__.__name__
+            self.process_times[name] = (end_time - start_time) * 1000
+            if self.profiler is not None:
+                self.profiler.record(name, start_time, end_time)
 
     def process(self, *args, **kwargs):
         """Call the process method on all Processors, in order of their priority.
@@ -381,3 +495,242 @@ class BaseWorld:
         """
         self._clear_dead_entities()
         self._process(*args, **kwargs)
+
+
+class _Archetype:
+    """A table holding every Entity that has exactly the same set of Component
+    types. Each Component type gets its own column, and row `i` of every column
+    belongs to `entities[i]`.
+    """
+
+    __slots__ = ("signature", "entities", "columns", "add_edges", "remove_edges")
+
+    def __init__(self, signature: _FrozenSet[_Any]):
+        self.signature = signature
+        self.entities: _List[int] = []
+        self.columns: _Dict[_Any, _List[_Any]] = {ct: [] for ct in signature}
+
+        # Cached transitions to the archetype with one type added/removed
+        self.add_edges: _Dict[_Any, _Archetype] = {}
+        self.remove_edges: _Dict[_Any, _Archetype] = {}
+
+    def move_from(
+        self, source: "_Archetype", row: int, entity: int, extra_type=None, extra=None
+    ) -> int:
+        """Append a row copied from `row` of `source` (plus the `extra` component
+        of type `extra_type`, if given), and return its index."""
+        self.entities.append(entity)
+        for component_type, column in self.columns.items():
+            if component_type == extra_type:
+                column.append(extra)
+            else:
+                column.append(source.columns[component_type][row])
+        return len(self.entities) - 1
+
+    def remove(self, row: int) -> _Optional[int]:
+        """Remove a row by swapping the last row into its place.
+        :return: The Entity that was moved into `row`, or None if the last row
+                 was removed.
+        """
+        for column in self.columns.values():
+            last = column.pop()
+            if row < len(column):
+                column[row] = last
+
+        last_entity = self.entities.pop()
+        if row < len(self.entities):
+            self.entities[row] = last_entity
+            return last_entity
+        return None
+
+
+class ArchetypeWorld(BaseWorld):
+    """A World that stores Components in archetype tables.
+    Every unique combination of Component types gets its own table
+    (`_Archetype`), with one contiguous column per type. Queries only need to
+    find the matching tables, then walk their columns, instead of intersecting
+    sets and looking up every Entity.
+    """
+
+    def __init__(self, timed=False, profiler=None):
+        super().__init__(timed, profiler)
+        self._archetypes: _Dict[_FrozenSet[_Any], _Archetype] = {}
+        # Entity -> (archetype, row)
+        self._locations: _Dict[int, _Tuple[_Archetype, int]] = {}
+        # Component type -> archetypes containing that type
+        self._type_archetypes: _Dict[_Any, _List[_Archetype]] = {}
+        # Query -> archetypes matching every type in the query
+        self._query_archetypes: _Dict[_Tuple[_Any, ...], _List[_Archetype]] = {}
+
+    def clear_database(self) -> None:
+        """Remove all Entities and Components from the World."""
+        self._archetypes.clear()
+        self._locations.clear()
+        self._type_archetypes.clear()
+        self._query_archetypes.clear()
+        super().clear_database()
+
+    def _get_archetype(self, signature: _FrozenSet[_Any]) -> _Archetype:
+        try:
+            return self._archetypes[signature]
+        except KeyError:
+            pass
+
+        archetype = _Archetype(signature)
+        self._archetypes[signature] = archetype
+        for component_type in signature:
+            self._type_archetypes.setdefault(component_type, []).append(archetype)
+
+        # Keep cached query matches up to date
+        for query, matches in self._query_archetypes.items():
+            if signature.issuperset(query):
+                matches.append(archetype)
+
+        return archetype
+
+    def _match_archetypes(
+        self, component_types: _Tuple[_Any, ...]
+    ) -> _List[_Archetype]:
+        try:
+            return self._query_archetypes[component_types]
+        except KeyError:
+            pass
+
+        query = frozenset(component_types)
+        matches = [
+            archetype
+            for archetype in self._type_archetypes.get(component_types[0], [])
+            if archetype.signature.issuperset(query)
+        ]
+        self._query_archetypes[component_types] = matches
+        return matches
+
+    def _move(
+        self, entity: int, target: _Optional[_Archetype], extra_type=None, extra=None
+    ) -> None:
+        """Move an Entity into the `target` archetype (or out of the World if
+        `target` is None), optionally adding the `extra` component."""
+        location = self._locations.pop(entity, None)
+        if location is None:
+            if target is None:
+                return
+            target.entities.append(entity)
+            target.columns[extra_type].append(extra)
+            self._locations[entity] = (target, len(target.entities) - 1)
+            return
+
+        source, row = location
+        if target is not None:
+            new_row = target.move_from(source, row, entity, extra_type, extra)
+            self._locations[entity] = (target, new_row)
+
+        moved = source.remove(row)
+        if moved is not None:
+            self._locations[moved] = (source, row)
+
+    def _remove_entity(self, entity: int) -> None:
+        location = self._locations.get(entity)
+        if location is not None:
+            for component_type in location[0].signature:
+                self._component_removed(entity, component_type)
+        self._move(entity, None)
+
+    def delete_entity(self, entity: int, immediate=False) -> None:
+        if immediate:
+            if entity not in self._locations:
+                raise KeyError(entity)
+            self._remove_entity(entity)
+        else:
+            self._dead_entities.add(entity)
+
+    def entity_exists(self, entity: int) -> bool:
+        return entity in self._locations and entity not in self._dead_entities
+
+    def component_for_entity(self, entity: int, component_type: _Type[_C]) -> _C:
+        archetype, row = self._locations[entity]
+        return archetype.columns[component_type][row]
+
+    def components_for_entity(self, entity: int) -> _Tuple[_C, ...]:
+        archetype, row = self._locations[entity]
+        return tuple(column[row] for column in archetype.columns.values())
+
+    def has_component(self, entity: int, component_type: _Type[_C]) -> bool:
+        return component_type in self._locations[entity][0].signature
+
+    def has_components(self, entity: int, *component_types: _Type[_C]) -> bool:
+        return self._locations[entity][0].signature.issuperset(component_types)
+
+    def add_component(
+        self,
+        entity: int,
+        component_instance: _C,
+        type_alias: _Optional[_Type[_C]] = None,
+    ) -> None:
+        component_type = type_alias or type(component_instance)
+        location = self._locations.get(entity)
+
+        if location is None:
+            target = self._get_archetype(frozenset((component_type,)))
+        else:
+            source, row = location
+            if component_type in source.signature:
+                # Replace the component in place, the archetype doesn't change
+                source.columns[component_type][row] = component_instance
+                self._component_added(entity, component_type)
+                return
+
+            target = source.add_edges.get(component_type)
+            if target is None:
+                target = self._get_archetype(source.signature | {component_type})
+                source.add_edges[component_type] = target
+
+        self._move(entity, target, component_type, component_instance)
+        self._component_added(entity, component_type)
+
+    def remove_component(self, entity: int, component_type: _Type[_C]) -> int:
+        source, _ = self._locations[entity]
+        if component_type not in source.signature:
+            raise KeyError(component_type)
+
+        target = source.remove_edges.get(component_type)
+        if target is None and len(source.signature) > 1:
+            target = self._get_archetype(source.signature - {component_type})
+            source.remove_edges[component_type] = target
+
+        self._move(entity, target)
+        self._component_removed(entity, component_type)
+        return entity
+
+    def _get_component(self, component_type: _Type[_C]) -> _Iterable[_Tuple[int, _C]]:
+        for archetype in self._type_archetypes.get(component_type, []):
+            yield from zip(archetype.entities, archetype.columns[component_type])
+
+    def _get_components(
+        self, *component_types: _Type[_C]
+    ) -> _Iterable[_Tuple[int, _List[_C]]]:
+        if not component_types:
+            return
+
+        for archetype in self._match_archetypes(component_types):
+            columns = [archetype.columns[ct] for ct in component_types]
+            for entity, *components in zip(archetype.entities, *columns):
+                yield entity, components
+
+    def try_component(self, entity: int, component_type: _Type[_C]) -> _Optional[_C]:
+        archetype, row = self._locations[entity]
+        column = archetype.columns.get(component_type)
+        return None if column is None else column[row]
+
+    def try_components(
+        self, entity: int, *component_types: _Type[_C]
+    ) -> _Optional[_List[_List[_C]]]:
+        archetype, row = self._locations[entity]
+        if archetype.signature.issuperset(component_types):
+            return [archetype.columns[ct][row] for ct in component_types]
+        return None
+
+    def _clear_dead_entities(self):
+        for entity in self._dead_entities:
+            self._remove_entity(entity)
+
+        self._dead_entities.clear()
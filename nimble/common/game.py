@@ -0,0 +1,138 @@
+from __future__ import annotations
+import time
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+
+import moderngl as mgl
+from moderngl_window.opengl.vao import VAO
+
+from nimble.common.keys import PressedKeys
+from nimble.common.overlay.overlay import OverlayComponent, OverlayProcessor
+from nimble.common.overlay.text_renderer import TextRenderer
+from nimble.common.profiler import FrameProfiler
+from nimble.common.shader_manager import Shaders
+from nimble.common.world import World
+from nimble.objects import PhysicsProcessor, ScriptProcessor, Scene
+from nimble.objects.component import CameraComponent
+
+if TYPE_CHECKING:
+    from nimble.interface.orbit_camera import OrbitCamera
+
+
+class Game:
+    """A running game: a world with an entity for every model of the scene,
+    and the script, physics and overlay processors that run it.
+
+    This doesn't depend on any Qt widgets, so it runs inside the game window
+    (see `GameViewport`) as well as headless (see `nimble.headless`).
+
+    When the `FrameProfiler` is enabled, every frame, processor, script and
+    render pass is recorded to it.
+    """
+
+    def __init__(
+        self,
+        scene: Scene,
+        camera: OrbitCamera,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.scene = scene
+        self.world = World(profiler=FrameProfiler())
+        camera_entity = self.world.create_entity()
+        self.world.add_component(camera_entity, CameraComponent(camera))
+        self.camera = camera
+
+        self.keys = PressedKeys()
+        custom_components = []
+        for model in self.scene.objects.values():
+            entity_id = self.world.create_entity()
+            model.entity_id = entity_id
+            for component in model.components:
+                self.world.add_component(
+                    entity_id, component, type_alias=component.type_alias
+                )
+                if (
+                    component.type_alias is not None
+                    and component.type_alias.startswith("custom_")
+                ):
+                    custom_components.append(component)
+
+        self.script_processor = ScriptProcessor(custom_components)
+        self.world.add_processor(self.script_processor, priority=1)
+        self.script_processor.add_keys_attr(self.keys)
+
+        self.physics_processor = PhysicsProcessor(clock=clock)
+        self.world.add_processor(self.physics_processor)
+
+        self.overlay_buffer: Optional[mgl.Texture] = None
+        self.overlay_processor = OverlayProcessor(self.overlay_buffer)
+        self.world.add_processor(self.overlay_processor)
+        self.text_renderer = TextRenderer()
+
+    def process(self):
+        """Run every processor once (one frame of the game)."""
+        profiler = FrameProfiler()
+        profiler.begin_frame()
+        with profiler.section("update"):
+            self.world.process()
+
+    def resize(self, ctx: mgl.Context, size: Tuple[int, int]):
+        """Create the texture the overlays are drawn to, for a screen of
+        `size`."""
+        if self.overlay_buffer:
+            self.overlay_buffer.release()
+            self.overlay_buffer = None
+
+        self.overlay_buffer = ctx.texture(size, 4)
+        self.overlay_processor.texture_resized(self.overlay_buffer)
+
+    def render(
+        self,
+        ctx: mgl.Context,
+        screen: mgl.Framebuffer,
+        active_buffer: mgl.Framebuffer,
+        overlay_vao: VAO,
+    ):
+        """Draw the scene, and the overlays on top of it.
+
+        The timings of the render passes only include the time taken to
+        submit the draw calls, since OpenGL runs them asynchronously."""
+        profiler = FrameProfiler()
+        with profiler.section("render"):
+            ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE_MINUS_SRC_ALPHA
+            ctx.enable(mgl.BLEND | mgl.DEPTH_TEST)
+            ctx.clear(0.235, 0.235, 0.235)
+            screen.use()
+
+            with profiler.section("render/scene"):
+                self.scene.render(self.camera, active_buffer, screen)
+
+            with profiler.section("render/overlays"):
+                self.overlay_buffer.use(location=0)
+                self.overlay_buffer.repeat_x = False
+                self.overlay_buffer.repeat_y = False
+                texture_shader = Shaders()["texture"]
+
+                ctx.enable(mgl.BLEND)
+                overlay_vao.render(texture_shader)
+
+            with profiler.section("render/text"):
+                ctx.disable(mgl.DEPTH_TEST)
+                self.text_renderer.render(
+                    ctx,
+                    (
+                        overlay
+                        for _, overlay in self.world.get_component(OverlayComponent)
+                        if overlay.on_gpu
+                    ),
+                    self.overlay_buffer.size,
+                )
+
+    def reload_script(self, script: str) -> bool:
+        """Swap in the new version of a script (e.g. `player.py`) that
+        changed while the game runs."""
+        return self.script_processor.reload(script)
+
+    def close(self):
+        """Shut down the game's physics simulation, and release its buffers."""
+        self.physics_processor.close()
+        self.text_renderer.release()
@@ -0,0 +1,165 @@
+"""A bounding volume hierarchy over the world bounding boxes of models."""
+
+from typing import List, Optional, Tuple
+import numpy as np
+
+from nimble.common.models.ray_cast import Ray, intersect_boxes
+from nimble.objects.transform_store import TransformStore
+
+
+def _expand_bits(v: np.ndarray) -> np.ndarray:
+    """Spread the lower 10 bits of every value out, so that there are two zero
+    bits between each of them."""
+    v = v.astype(np.uint32)
+    v = (v * np.uint32(0x00010001)) & np.uint32(0xFF0000FF)
+    v = (v * np.uint32(0x00000101)) & np.uint32(0x0F00F00F)
+    v = (v * np.uint32(0x00000011)) & np.uint32(0xC30C30C3)
+    v = (v * np.uint32(0x00000005)) & np.uint32(0x49249249)
+    return v
+
+
+def morton_codes(points: np.ndarray) -> np.ndarray:
+    """30 bit morton codes of (N, 3) points, which sort them along a z-order
+    curve through their bounding box."""
+    lower = points.min(axis=0)
+    extent = points.max(axis=0) - lower
+    extent[extent == 0] = 1
+
+    cells = np.clip((points - lower) / extent * 1023, 0, 1023)
+    x, y, z = _expand_bits(cells).T
+    return (x << 2) | (y << 1) | z
+
+
+class BVH:
+    """A linear bounding volume hierarchy over the world bounding boxes of
+    slots in the `TransformStore`.
+
+    The slots are sorted along a morton curve and grouped into leaves of
+    `leaf_size` slots. Every level above the leaves joins pairs of nodes from
+    the level below, so the tree is just a list of (N, 2, 3) arrays of bounds,
+    and the children of node `i` are nodes `2i` and `2i + 1` of the level
+    below.
+
+    Moving a slot doesn't change the structure of the tree, only the bounds of
+    the nodes above it, so `refit` only recalculates the nodes above slots
+    whose version in the store changed. Adding or removing slots needs a new
+    `build`.
+    """
+
+    def __init__(self, leaf_size: int = 4):
+        self.leaf_size = leaf_size
+        self.slots = np.zeros(0, dtype=np.intp)
+        # The slots of every leaf, padded by repeating the last slot
+        self.leaves = np.zeros((0, leaf_size), dtype=np.intp)
+        self.levels: List[np.ndarray] = []
+        self.versions = np.zeros(0, dtype=np.uint32)
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def build(self, slots: np.ndarray):
+        """Build the hierarchy for the given slots of the store."""
+        store = TransformStore()
+        store.update()
+        slots = np.asarray(slots, dtype=np.intp)
+        self.levels = []
+
+        if len(slots) == 0:
+            self.slots = slots
+            self.leaves = np.zeros((0, self.leaf_size), dtype=np.intp)
+            self.versions = np.zeros(0, dtype=np.uint32)
+            return
+
+        bounds = store.world_bounds[slots]
+        order = np.argsort(morton_codes(bounds.mean(axis=1)), kind="stable")
+        self.slots = slots[order]
+
+        padded = -len(self.slots) % self.leaf_size
+        self.leaves = np.concatenate(
+            (self.slots, np.repeat(self.slots[-1:], padded))
+        ).reshape(-1, self.leaf_size)
+
+        self.versions = store.versions[self.slots]
+        self._refit_leaves(np.arange(len(self.leaves)))
+
+    def refit(self):
+        """Update the bounds of every node above a slot that moved since the
+        last build or refit."""
+        if len(self.slots) == 0:
+            return
+
+        store = TransformStore()
+        store.update()
+        versions = store.versions[self.slots]
+        changed = np.flatnonzero(versions != self.versions)
+        if len(changed) == 0:
+            return
+
+        self.versions = versions
+        self._refit_leaves(np.unique(changed // self.leaf_size))
+
+    def _refit_leaves(self, leaves: np.ndarray):
+        bounds = TransformStore().world_bounds[self.leaves[leaves]]
+        if not self.levels:
+            self.levels.append(np.empty((len(self.leaves), 2, 3), dtype="f4"))
+        level = self.levels[0]
+        level[leaves, 0] = bounds[:, :, 0].min(axis=1)
+        level[leaves, 1] = bounds[:, :, 1].max(axis=1)
+
+        # Walk up the tree, only recalculating the parents of changed nodes
+        nodes = leaves
+        depth = 0
+        while len(self.levels[depth]) > 1:
+            below = self.levels[depth]
+            if depth + 1 == len(self.levels):
+                self.levels.append(np.empty(((len(below) + 1) // 2, 2, 3), dtype="f4"))
+            above = self.levels[depth + 1]
+
+            nodes = np.unique(nodes // 2)
+            left = below[2 * nodes]
+            right = below[np.minimum(2 * nodes + 1, len(below) - 1)]
+            above[nodes, 0] = np.minimum(left[:, 0], right[:, 0])
+            above[nodes, 1] = np.maximum(left[:, 1], right[:, 1])
+            depth += 1
+
+    def intersect(self, ray: Ray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find every slot whose bounding box is hit by `ray` (in no particular
+        order). Returns the slots, and the distances where the ray enters and
+        leaves their bounding boxes."""
+        if len(self.slots) == 0:
+            empty = np.zeros(0, dtype="f4")
+            return np.zeros(0, dtype=np.intp), empty, empty
+
+        # Go down the tree one level at a time, only keeping the nodes hit
+        nodes = np.zeros(1, dtype=np.intp)
+        for depth in range(len(self.levels) - 1, -1, -1):
+            level = self.levels[depth]
+            if depth != len(self.levels) - 1:
+                nodes = np.concatenate((2 * nodes, 2 * nodes + 1))
+                nodes = nodes[nodes < len(level)]
+
+            hit, _, _ = intersect_boxes(level[nodes], ray)
+            nodes = nodes[hit]
+            if len(nodes) == 0:
+                break
+
+        slots = np.unique(self.leaves[nodes])
+        hit, near, far = intersect_boxes(TransformStore().world_bounds[slots], ray)
+        return slots[hit], near[hit], far[hit]
+
+    def cast_ray(self, ray: Ray) -> Optional[Tuple[int, float]]:
+        """Return the slot whose bounding box the ray enters first, and the
+        distance to it."""
+        slots, near, _ = self.intersect(ray)
+        if len(slots) == 0:
+            return None
+
+        closest = np.argmin(near)
+        return (int(slots[closest]), float(near[closest]))
+
+    def cast_ray_all(self, ray: Ray) -> List[Tuple[int, float]]:
+        """Return every slot hit by the ray, and the distance to it, sorted
+        from the closest to the farthest."""
+        slots, near, _ = self.intersect(ray)
+        order = np.argsort(near, kind="stable")
+        return [(int(slots[i]), float(near[i])) for i in order]
@@ -0,0 +1,56 @@
+"""Vectorized helpers for (N, 4) arrays of quaternions, in pybullet's (x, y, z, w)
+order."""
+
+import numpy as np
+
+
+def lerp(a: np.ndarray, b: np.ndarray, t: float) -> np.ndarray:
+    """Linear interpolation between `a` and `b`."""
+    return a + (b - a) * t
+
+
+def slerp(q0: np.ndarray, q1: np.ndarray, t: float) -> np.ndarray:
+    """Spherical linear interpolation between unit quaternions."""
+    dot = np.sum(q0 * q1, axis=-1, keepdims=True)
+
+    # q and -q are the same rotation, so take the shorter way around
+    q1 = np.where(dot < 0, -q1, q1)
+    dot = np.abs(dot)
+
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+
+    # Fall back to a linear interpolation when the quaternions are very close
+    close = sin_theta < 1e-6
+    sin_theta = np.where(close, 1.0, sin_theta)
+    w0 = np.where(close, 1 - t, np.sin((1 - t) * theta) / sin_theta)
+    w1 = np.where(close, t, np.sin(t * theta) / sin_theta)
+
+    result = w0 * q0 + w1 * q1
+    return result / np.linalg.norm(result, axis=-1, keepdims=True)
+
+
+def euler_from_quaternion(q: np.ndarray) -> np.ndarray:
+    """Convert quaternions to (roll, pitch, yaw) euler angles, the same way as
+    `pybullet.getEulerFromQuaternion`."""
+    x, y, z, w = np.moveaxis(q, -1, 0)
+    sqx, sqy, sqz, sqw = x * x, y * y, z * z, w * w
+
+    sarg = -2 * (x * z - w * y)
+    # Gimbal lock, when the pitch is +-90 degrees
+    down = sarg <= -0.99999
+    up = sarg >= 0.99999
+    regular = ~(down | up)
+
+    roll = np.where(
+        regular, np.arctan2(2 * (y * z + w * x), sqw - sqx - sqy + sqz), 0.0
+    )
+    pitch = np.where(
+        regular, np.arcsin(np.clip(sarg, -1, 1)), np.where(down, -np.pi / 2, np.pi / 2)
+    )
+    yaw = np.where(
+        regular,
+        np.arctan2(2 * (x * y + w * z), sqw + sqx - sqy - sqz),
+        np.where(down, 2 * np.arctan2(x, -y), 2 * np.arctan2(-x, y)),
+    )
+    return np.stack((roll, pitch, yaw), axis=-1)
@@ -1,4 +1,5 @@
 from typing import Optional, Tuple
+import numpy as np
 from pyrr import Vector3, Vector4
 from nimble.interface.orbit_camera import OrbitCamera
 from nimble.common.models.bounding_box import BoundingBox
@@ -63,30 +64,60 @@ def does_intersect(
     return ray_intersect(bounds, r) is not None
 
 
-def ray_intersect(bounds: BoundingBox, r: Ray) -> Optional[Tuple[float, float]]:
-    (orig, _, invdir, sign) = r
-
-    tmin = (bounds[sign[0]].x - orig.x) * invdir.x
-    tmax = (bounds[1 - sign[0]].x - orig.x) * invdir.x
-
-    tymin = (bounds[sign[1]].y - orig.y) * invdir.y
-    tymax = (bounds[1 - sign[1]].y - orig.y) * invdir.y
+def slab_test(
+    bounds: np.ndarray, origins: np.ndarray, inv_directions: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The slab test, for any shapes of `bounds` (..., 2, 3), `origins` (..., 3)
+    and `inv_directions` (..., 3) that broadcast together.
+
+    Returns the hit mask, and the distances along the ray where it enters
+    (tmin) and leaves (tmax) every box. Like `ray_intersect`, boxes behind the
+    origin of a ray still count as hits (with a negative tmax)."""
+    origins = origins[..., np.newaxis, :]
+    inv_directions = inv_directions[..., np.newaxis, :]
+
+    # Rays parallel to an axis give nan (0 * inf) if they start exactly on a
+    # face, so use fmin/fmax to ignore that axis
+    with np.errstate(invalid="ignore", over="ignore"):
+        t = (bounds - origins) * inv_directions
+    tmin = np.fmax.reduce(np.fmin(t[..., 0, :], t[..., 1, :]), axis=-1)
+    tmax = np.fmin.reduce(np.fmax(t[..., 0, :], t[..., 1, :]), axis=-1)
+
+    return tmin <= tmax, tmin, tmax
+
+
+def intersect_boxes(
+    bounds: np.ndarray, r: Ray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Test one ray against an (N, 2, 3) array of bounding boxes.
+    Returns (N,) arrays of the hit mask, tmin and tmax."""
+    orig, _, invdir, _ = r
+    return slab_test(
+        np.asarray(bounds, dtype="f4"),
+        np.asarray(orig, dtype="f4"),
+        np.asarray(invdir, dtype="f4"),
+    )
+
+
+def intersect_rays_boxes(
+    origins: np.ndarray, directions: np.ndarray, bounds: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Test (R, 3) rays against an (N, 2, 3) array of bounding boxes.
+    Returns (R, N) arrays of the hit mask, tmin and tmax."""
+    origins = np.asarray(origins, dtype="f4")
+    with np.errstate(divide="ignore"):
+        inv_directions = 1.0 / np.asarray(directions, dtype="f4")
+
+    return slab_test(
+        np.asarray(bounds, dtype="f4")[np.newaxis],
+        origins[:, np.newaxis],
+        inv_directions[:, np.newaxis],
+    )
 
-    if (tmin > tymax) or (tymin > tmax):
-        return None
-    if tymin > tmin:
-        tmin = tymin
-    if tymax < tmax:
-        tmax = tymax
 
-    tzmin = (bounds[sign[2]].z - orig.z) * invdir.z
-    tzmax = (bounds[1 - sign[2]].z - orig.z) * invdir.z
-
-    if (tmin > tzmax) or (tzmin > tmax):
-        return None
-    if tzmin > tmin:
-        tmin = tzmin
-    if tzmax < tmax:
-        tmax = tzmax
-
-    return (tmin, tmax)
+def ray_intersect(bounds: BoundingBox, r: Ray) -> Optional[Tuple[float, float]]:
+    """Get the distances where a ray enters and leaves a bounding box, or None
+    if it misses it."""
+    hit, tmin, tmax = intersect_boxes(np.array(bounds, dtype="f4")[np.newaxis], r)
+    if hit[0]:
+        return (float(tmin[0]), float(tmax[0]))
@@ -0,0 +1,191 @@
+"""Glyph atlases, for drawing text with OpenGL."""
+
+import io
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import moderngl as mgl
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+from PyQt5.QtCore import QFile
+
+from nimble.common.singleton import Singleton
+
+# Every vertex of a laid out string is (x, y, u, v), all in pixels: x and y
+# from the origin of the text, u and v in the atlas
+layout_floats = 4
+
+
+class Glyph(NamedTuple):
+    # How far to move the pen after the glyph
+    advance: float
+    # The two triangles of the glyph, relative to the pen, or `None` for
+    # glyphs that don't draw anything (like spaces)
+    quad: Optional[np.ndarray]
+
+
+class GlyphAtlas:
+    """Every glyph of a font at one size, rasterized into a single channel
+    texture.
+
+    Printable ASCII is rasterized up front, and any other character the first
+    time it is laid out. Glyphs are packed into rows ("shelves") of the
+    atlas, and the atlas grows taller when it is full. Coordinates in the
+    atlas are in pixels, so laid out text stays valid when it grows.
+    """
+
+    width = 512
+    # Empty pixels around every glyph, so they don't bleed into each other
+    padding = 1
+
+    def __init__(self, font: ImageFont.FreeTypeFont):
+        self.font = font
+        # The same line spacing as PIL's multiline text
+        self.line_height = font.getbbox("A")[3] + 4
+
+        self.pixels = np.zeros((64, self.width), dtype="u1")
+        self.glyphs: Dict[str, Glyph] = {}
+        # Where the next glyph goes, and the height of the current shelf
+        self.shelf_x = self.padding
+        self.shelf_y = self.padding
+        self.shelf_height = 0
+
+        self.texture: Optional[mgl.Texture] = None
+        # The rows of `pixels` that changed since the texture was uploaded
+        self.dirty_rows: Optional[Tuple[int, int]] = None
+
+        for code in range(32, 127):
+            self.glyph(chr(code))
+
+    def glyph(self, char: str) -> Glyph:
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.glyphs[char] = self.rasterize(char)
+        return glyph
+
+    def rasterize(self, char: str) -> Glyph:
+        advance = self.font.getlength(char)
+        left, top, right, bottom = self.font.getbbox(char)
+        width, height = right - left, bottom - top
+        if width <= 0 or height <= 0:
+            return Glyph(advance, None)
+
+        image = Image.new("L", (width, height), 0)
+        ImageDraw.Draw(image).text((-left, -top), char, 255, font=self.font)
+
+        x, y = self.allocate(width, height)
+        self.pixels[y : y + height, x : x + width] = np.array(image)
+        self.mark_dirty(y, y + height)
+
+        quad = np.array(
+            [
+                (left, top, x, y),
+                (right, top, x + width, y),
+                (left, bottom, x, y + height),
+                (left, bottom, x, y + height),
+                (right, top, x + width, y),
+                (right, bottom, x + width, y + height),
+            ],
+            dtype="f4",
+        )
+        return Glyph(advance, quad)
+
+    def allocate(self, width: int, height: int) -> Tuple[int, int]:
+        """Find room for a glyph, and return its top left corner."""
+        if width + 2 * self.padding > self.width:
+            raise ValueError("glyph is too wide for the atlas")
+
+        if self.shelf_x + width + self.padding > self.width:
+            # Start a new shelf
+            self.shelf_x = self.padding
+            self.shelf_y += self.shelf_height + self.padding
+            self.shelf_height = 0
+
+        while self.shelf_y + height + self.padding > self.pixels.shape[0]:
+            self.pixels = np.vstack((self.pixels, np.zeros_like(self.pixels)))
+            # The texture has to be recreated
+            self.mark_dirty(0, self.pixels.shape[0])
+
+        position = (self.shelf_x, self.shelf_y)
+        self.shelf_x += width + self.padding
+        self.shelf_height = max(self.shelf_height, height)
+        return position
+
+    def mark_dirty(self, top: int, bottom: int):
+        if self.dirty_rows is not None:
+            top, bottom = min(top, self.dirty_rows[0]), max(bottom, self.dirty_rows[1])
+        self.dirty_rows = (top, bottom)
+
+    def layout(self, text: str) -> np.ndarray:
+        """The vertices of the glyphs of `text` (see `layout_floats`), with
+        the top left of the first line at the origin."""
+        quads = []
+        pens = []
+        x = y = 0.0
+        for char in text:
+            if char == "\n":
+                x = 0.0
+                y += self.line_height
+                continue
+
+            glyph = self.glyph(char)
+            if glyph.quad is not None:
+                quads.append(glyph.quad)
+                pens.append((x, y))
+            x += glyph.advance
+
+        if not quads:
+            return np.zeros((0, layout_floats), dtype="f4")
+
+        vertices = np.stack(quads)
+        vertices[:, :, :2] += np.array(pens, dtype="f4")[:, np.newaxis]
+        return vertices.reshape(-1, layout_floats)
+
+    def use(self, ctx: mgl.Context, location: int = 0):
+        """Upload the glyphs that were added since the last use, and bind the
+        atlas."""
+        height, width = self.pixels.shape
+        if self.texture is None or self.texture.size != (width, height):
+            if self.texture is not None:
+                self.texture.release()
+            self.texture = ctx.texture((width, height), 1, self.pixels.tobytes())
+            self.dirty_rows = None
+        elif self.dirty_rows is not None:
+            top, bottom = self.dirty_rows
+            self.texture.write(
+                self.pixels[top:bottom].tobytes(),
+                viewport=(0, top, width, bottom - top),
+            )
+            self.dirty_rows = None
+
+        self.texture.use(location=location)
+
+    def release(self):
+        if self.texture is not None:
+            self.texture.release()
+            self.texture = None
+
+
+class GlyphAtlases(metaclass=Singleton):
+    """A global cache of fonts and their glyph atlases, so every font file is
+    only read and parsed once per size."""
+
+    def __init__(self):
+        self.font_files: Dict[str, bytes] = {}
+        self.atlases: Dict[Tuple[str, int], GlyphAtlas] = {}
+
+    def font_bytes(self, name: str) -> bytes:
+        """The contents of a font from the Qt resources (e.g.
+        `OpenSans-Regular.ttf`)."""
+        data = self.font_files.get(name)
+        if data is None:
+            file = QFile(f":/fonts/{name}")
+            file.open(QFile.ReadOnly)
+            data = self.font_files[name] = file.readAll().data()
+        return data
+
+    def get(self, name: str, size: int) -> GlyphAtlas:
+        atlas = self.atlases.get((name, size))
+        if atlas is None:
+            font = ImageFont.truetype(io.BytesIO(self.font_bytes(name)), size=size)
+            atlas = self.atlases[(name, size)] = GlyphAtlas(font)
+        return atlas
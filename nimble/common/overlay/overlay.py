@@ -1,14 +1,48 @@
 import numpy as np
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from PIL import Image
 from moderngl.texture import Texture
 
 from nimble.common.ecs import Processor
 from nimble.common.world import World
 
+# A rectangle on the screen, as (left, top, right, bottom) pixels (like PIL
+# boxes, the right and bottom edges are exclusive)
+Rect = Tuple[int, int, int, int]
+
+
+def _intersects(a: Rect, b: Rect) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _union(a: Rect, b: Rect) -> Rect:
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _is_empty(rect: Rect) -> bool:
+    return rect[0] >= rect[2] or rect[1] >= rect[3]
+
 
 class OverlayComponent:
-    """A 2D component that overlays the 3D scene."""
+    """A 2D component that overlays the 3D scene.
+
+    Overlays that know where they draw return their rectangle from `bounds`,
+    and set `dirty` whenever they change. They are only redrawn when they (or
+    an overlay they overlap) changed. Overlays without bounds are redrawn
+    every frame, along with the rest of the screen.
+
+    Overlays that are drawn with OpenGL instead (like `TextOverlay`) set
+    `on_gpu`, and aren't drawn into the overlay texture at all.
+    """
+
+    # Set when the overlay changed, and cleared once it has been drawn
+    dirty = True
+    # Drawn with OpenGL, instead of with `draw`
+    on_gpu = False
+
+    def bounds(self) -> Optional[Rect]:
+        """The rectangle the overlay draws into, or `None` if it is unknown."""
+        return None
 
     def draw(self, buffer: Image.Image):
         """Draws the image to the screen."""
@@ -16,36 +50,124 @@ class OverlayComponent:
 
 
 class OverlayProcessor(Processor):
+    """Draws overlays into a texture, that is drawn over the scene.
+
+    Only the regions of the screen where overlays changed (or moved away from)
+    are cleared, redrawn and uploaded to the texture. When nothing changed,
+    the texture isn't touched at all.
+    """
+
     def __init__(self, texture: Optional[Texture] = None):
         self.texture = texture
+        self.screen_buffer = None
+        # The rectangle every overlay was last drawn into
+        self.drawn: Dict[OverlayComponent, Rect] = {}
+        self.redraw_all = True
 
         if self.texture is not None:
-            # Create an empty screen buffer
-            self.screen_buffer = Image.new(
-                "RGBA", self.texture.size + (4,), (0, 0, 0, 0)
-            )
-        else:
-            self.screen_buffer = None
+            self.texture_resized(self.texture)
 
     def texture_resized(self, texture: Optional[Texture]):
         self.texture = texture
+        # Create an empty screen buffer
         self.screen_buffer = Image.new("RGBA", self.texture.size, (0, 0, 0, 0))
+        self.redraw_all = True
 
     def process(self):
-        """Draws all overlays to the OpenGL texture."""
+        """Draws the overlays that changed to the OpenGL texture."""
         if self.texture is None:
             return
 
-        size = self.screen_buffer.size
-        self.screen_buffer.paste((0, 0, 0, 0), (0, 0, *size))  # Fill with black
         self.world: World = self.world
+        overlays = [
+            overlay
+            for _, overlay in self.world.get_component(OverlayComponent)
+            if not overlay.on_gpu
+        ]
+
+        width, height = self.screen_buffer.size
+        redraw_all = self.redraw_all
+        bounds: Dict[OverlayComponent, Rect] = {}
+        dirty: List[Rect] = []
+        for overlay in overlays:
+            rect = overlay.bounds()
+            if rect is None:
+                redraw_all = True
+                continue
+
+            # Keep the rectangle on the screen
+            rect = (
+                max(rect[0], 0),
+                max(rect[1], 0),
+                min(rect[2], width),
+                min(rect[3], height),
+            )
+            bounds[overlay] = rect
+            if overlay.dirty or self.drawn.get(overlay) != rect:
+                dirty.append(rect)
+                # Clear where the overlay used to be
+                dirty.append(self.drawn.get(overlay, rect))
+
+        # Clear where removed overlays used to be
+        dirty.extend(
+            rect for overlay, rect in self.drawn.items() if overlay not in bounds
+        )
+
+        if redraw_all:
+            regions = [(0, 0, width, height)]
+        else:
+            regions = self.dirty_regions(dirty, bounds.values())
+
+        self.drawn = bounds
+        self.redraw_all = False
+        if not regions:
+            # Nothing changed, so the texture is still up to date
+            return
+
+        for region in regions:
+            self.screen_buffer.paste((0, 0, 0, 0), region)
+
+        for overlay in overlays:
+            # Draw all the overlays in the regions onto the screen buffer
+            rect = bounds.get(overlay)
+            if rect is None or any(_intersects(rect, region) for region in regions):
+                overlay.draw(self.screen_buffer)
+            overlay.dirty = False
+
+        for left, top, right, bottom in regions:
+            # Flip the image, because OpenGL expects it that way
+            pixels = np.array(self.screen_buffer.crop((left, top, right, bottom)))
+            self.texture.write(
+                pixels[::-1].tobytes(),
+                viewport=(left, height - bottom, right - left, bottom - top),
+            )
+
+    @staticmethod
+    def dirty_regions(dirty: Iterable[Rect], bounds: Iterable[Rect]) -> List[Rect]:
+        """Combine the dirty rectangles into regions that don't overlap each
+        other, and that completely contain every overlay they touch (so no
+        overlay gets drawn over itself without being cleared first)."""
+        regions = [rect for rect in dirty if not _is_empty(rect)]
+        bounds = [rect for rect in bounds if not _is_empty(rect)]
 
-        for _, overlay_component in self.world.get_component(OverlayComponent):
-            # Draw all the overlays onto the screen buffer
-            overlay_component.draw(self.screen_buffer)
+        changed = True
+        while changed:
+            changed = False
+            for i, region in enumerate(regions):
+                for rect in bounds:
+                    if _intersects(region, rect) and _union(region, rect) != region:
+                        region = regions[i] = _union(region, rect)
+                        changed = True
 
-        # Flip the image, because OpenGL expects it that way
-        texture = np.flip(np.array(self.screen_buffer), axis=0).astype("u1")
+            merged: List[Rect] = []
+            for region in regions:
+                for j, other in enumerate(merged):
+                    if _intersects(region, other):
+                        merged[j] = _union(region, other)
+                        changed = True
+                        break
+                else:
+                    merged.append(region)
+            regions = merged
 
-        # Load the image to the texture
-        self.texture.write(texture.tobytes())
+        return regions
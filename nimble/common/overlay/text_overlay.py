@@ -1,28 +1,60 @@
-import io
-from PyQt5.QtCore import QFile
-from PIL import ImageFont, ImageDraw, Image
+import math
+from typing import Optional, Tuple
+import numpy as np
+from PIL import ImageDraw, Image, ImageFont
 
-from nimble.common.overlay.overlay import OverlayComponent
+from nimble.common.overlay.glyph_atlas import GlyphAtlas, GlyphAtlases
+from nimble.common.overlay.overlay import OverlayComponent, Rect
+from nimble.common.overlay.text_renderer import vertex_floats
+
+
+def _rgba(color) -> Tuple[int, int, int, int]:
+    return (*color, 255) if len(color) == 3 else tuple(color)
 
 
 class TextOverlay(OverlayComponent):
-    """A 2D text overlay component."""
+    """A 2D text overlay component.
+
+    The text is drawn with OpenGL from a glyph atlas shared by every text with
+    the same font and size (see `TextRenderer`). It is only laid out again
+    when the text or the font changes.
+    """
 
-    def __init__(self, text, font_size=32):
-        file = QFile(":/fonts/OpenSans-Regular.ttf")
-        file.setOpenMode(QFile.ReadOnly)
-        self.font_bytes = file.readAll().data()
+    on_gpu = True
 
+    def __init__(
+        self,
+        text,
+        font_size=32,
+        color=(255, 255, 255, 255),
+        font_name="OpenSans-Regular.ttf",
+    ):
         self._text = text
         self._font_size = font_size
-        self.position = (0, 0)
+        self._position = (0, 0)
+        self._color = _rgba(color)
+        self.font_name = font_name
 
-        self.font = None
+        self._layout: Optional[np.ndarray] = None
+        self._vertices: Optional[np.ndarray] = None
+
+        self.atlas: Optional[GlyphAtlas] = None
         self.update_font()
 
     def update_font(self):
         """Updates the font with new font size."""
-        self.font = ImageFont.truetype(io.BytesIO(self.font_bytes), size=self.font_size)
+        self.atlas = GlyphAtlases().get(self.font_name, self.font_size)
+        self._layout = None
+        self.changed()
+
+    def changed(self):
+        """Mark the overlay to be redrawn, e.g. after a change to the font."""
+        self.dirty = True
+        self._vertices = None
+
+    @property
+    def font(self) -> ImageFont.FreeTypeFont:
+        return self.atlas.font
 
     @property
     def text(self) -> str:
@@ -30,7 +62,12 @@ class TextOverlay(OverlayComponent):
 
     @text.setter
     def text(self, text: str):
-        self._text = text
+        # Scripts often set the text every frame, so only lay it out again
+        # when it actually changes
+        if text != self._text:
+            self._text = text
+            self._layout = None
+            self.changed()
 
     @property
     def font_size(self) -> int:
@@ -38,9 +75,65 @@ class TextOverlay(OverlayComponent):
 
     @font_size.setter
     def font_size(self, font_size: int):
-        self._font_size = font_size
-        self.update_font()
+        if font_size != self._font_size:
+            self._font_size = font_size
+            self.update_font()
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return self._position
+
+    @position.setter
+    def position(self, position: Tuple[int, int]):
+        if tuple(position) != self._position:
+            self._position = tuple(position)
+            self.changed()
+
+    @property
+    def color(self) -> Tuple[int, int, int, int]:
+        return self._color
+
+    @color.setter
+    def color(self, color: Tuple[int, int, int, int]):
+        if _rgba(color) != self._color:
+            self._color = _rgba(color)
+            self.changed()
+
+    @property
+    def layout(self) -> np.ndarray:
+        """The glyphs of the text, relative to its position (see
+        `GlyphAtlas.layout`)."""
+        if self._layout is None:
+            self._layout = self.atlas.layout(self.text)
+        return self._layout
+
+    def vertices(self) -> np.ndarray:
+        """The vertices of the text on the screen, as drawn by `TextRenderer`."""
+        if self._vertices is None:
+            layout = self.layout
+            vertices = np.empty((len(layout), vertex_floats), dtype="f4")
+            vertices[:, : layout.shape[1]] = layout
+            vertices[:, :2] += self.position
+            vertices[:, layout.shape[1] :] = np.array(self.color, dtype="f4") / 255
+            self._vertices = vertices
+        return self._vertices
+
+    def bounds(self) -> Optional[Rect]:
+        x, y = self.position
+        layout = self.layout
+        if len(layout) == 0:
+            return (x, y, x, y)
+
+        left, top = layout[:, :2].min(axis=0)
+        right, bottom = layout[:, :2].max(axis=0)
+        return (
+            math.floor(x + left),
+            math.floor(y + top),
+            math.ceil(x + right),
+            math.ceil(y + bottom),
+        )
 
     def draw(self, buffer: Image.Image):
+        """Draws the text with PIL instead, e.g. to save it to an image."""
         draw = ImageDraw.Draw(buffer)
-        draw.text(self.position, self.text, (255, 255, 255), font=self.font)
+        draw.text(self.position, self.text, self.color, font=self.font)
@@ -0,0 +1,107 @@
+"""Batched rendering of text overlays."""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import moderngl as mgl
+
+from nimble.common.overlay.glyph_atlas import GlyphAtlas, layout_floats
+from nimble.common.shader_manager import Shaders
+
+if TYPE_CHECKING:
+    from nimble.common.overlay.text_overlay import TextOverlay
+
+
+# Every vertex is a position on the screen and in the atlas (in pixels), and
+# a color
+vertex_format = "2f 2f 4f"
+vertex_attributes = ("in_position", "in_texcoord_0", "in_color")
+vertex_floats = layout_floats + 4
+
+
+class TextBatch:
+    """The vertex buffer of every text drawn with one glyph atlas."""
+
+    def __init__(self, program: mgl.Program):
+        self.program = program
+        self.overlays: List[TextOverlay] = []
+        self.vertex_array: Optional[mgl.VertexArray] = None
+        self.vertex_buffer: Optional[mgl.Buffer] = None
+        self.count = 0
+
+    def prepare(self, ctx: mgl.Context, overlays: List[TextOverlay]):
+        """Upload the vertices of the overlays, if any of them changed."""
+        if overlays == self.overlays and not any(overlay.dirty for overlay in overlays):
+            return
+
+        self.overlays = overlays
+        data = np.concatenate([overlay.vertices() for overlay in overlays])
+        self.count = len(data)
+        for overlay in overlays:
+            overlay.dirty = False
+        if self.count == 0:
+            return
+
+        if self.vertex_buffer is None or self.vertex_buffer.size < data.nbytes:
+            self.release()
+            # Leave some room to grow, to avoid reallocating every time a
+            # text gets longer
+            self.vertex_buffer = ctx.buffer(reserve=data.nbytes * 2)
+            self.vertex_array = ctx.vertex_array(
+                self.program,
+                [(self.vertex_buffer, vertex_format, *vertex_attributes)],
+            )
+
+        self.vertex_buffer.write(data)
+
+    def render(self):
+        if self.count:
+            self.vertex_array.render(mgl.TRIANGLES, vertices=self.count)
+
+    def release(self):
+        if self.vertex_array is not None:
+            self.vertex_array.release()
+            self.vertex_array = None
+        if self.vertex_buffer is not None:
+            self.vertex_buffer.release()
+            self.vertex_buffer = None
+
+
+class TextRenderer:
+    """Draws text overlays with OpenGL. All the text with the same font and
+    size is drawn with a single draw call, from their glyph atlas."""
+
+    def __init__(self):
+        self.batches: Dict[GlyphAtlas, TextBatch] = {}
+
+    def render(
+        self, ctx: mgl.Context, overlays: Iterable[TextOverlay], size: Tuple[int, int]
+    ):
+        """Draw the overlays over a screen of `size`, in pixels."""
+        groups: Dict[GlyphAtlas, List[TextOverlay]] = {}
+        for overlay in overlays:
+            group = groups.get(overlay.atlas)
+            if group is None:
+                groups[overlay.atlas] = [overlay]
+            else:
+                group.append(overlay)
+
+        program = Shaders()["text"]
+        program["screen_size"].value = size
+        for atlas, group in groups.items():
+            batch = self.batches.get(atlas)
+            if batch is None:
+                batch = self.batches[atlas] = TextBatch(program)
+
+            batch.prepare(ctx, group)
+            atlas.use(ctx, location=0)
+            batch.render()
+
+        # Release batches that weren't needed this frame
+        for atlas in self.batches.keys() - groups.keys():
+            self.batches.pop(atlas).release()
+
+    def release(self):
+        for batch in self.batches.values():
+            batch.release()
+        self.batches.clear()
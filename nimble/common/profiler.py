@@ -0,0 +1,172 @@
+"""A profiler for the frames of a running game."""
+
+from __future__ import annotations
+from collections import deque
+from contextlib import contextmanager
+import json
+import time
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from nimble.common.singleton import Singleton
+
+
+class FrameProfiler(metaclass=Singleton):
+    """Records how long every frame, and every section of a frame (e.g. each
+    processor, script and render pass) took, in milliseconds of wall-clock
+    time.
+
+    The durations of the last `history` frames are kept in a ring buffer per
+    section, for rolling statistics. Every recorded section is also kept as
+    an event (for the same number of frames), which can be exported in the
+    Chrome trace format (open it in chrome://tracing or https://ui.perfetto.dev).
+
+    Nothing is recorded unless `enabled` is set, so calling `section` or
+    `record` is almost free when the profiler isn't used.
+    """
+
+    def __init__(self, history: int = 600):
+        self.enabled = False
+        self.reset(history)
+
+    def reset(self, history: Optional[int] = None):
+        """Forget everything that was recorded."""
+        if history is not None:
+            self.history = history
+
+        self.samples: Dict[str, np.ndarray] = {}
+        self.counts: Dict[str, int] = {}
+        # (name, start, end) of every section, and the start of every frame
+        self.events: Deque[Tuple[str, float, float]] = deque()
+        self.frame_starts: Deque[float] = deque(maxlen=self.history)
+        self.origin = time.perf_counter()
+
+    def record(self, name: str, start: float, end: float):
+        """Record that section `name` ran from `start` to `end` (both from
+        `time.perf_counter`)."""
+        if not self.enabled:
+            return
+
+        self._add_sample(name, (end - start) * 1000)
+        self.events.append((name, start, end))
+
+    def _add_sample(self, name: str, duration: float):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = np.zeros(self.history)
+            self.counts[name] = 0
+
+        samples[self.counts[name] % self.history] = duration
+        self.counts[name] += 1
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """Record how long the body of a `with` block takes."""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def begin_frame(self):
+        """Mark the start of a frame. The time between two frames is recorded
+        as the "frame" section."""
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        if self.frame_starts:
+            self._add_sample("frame", (now - self.frame_starts[-1]) * 1000)
+
+        if len(self.frame_starts) == self.history:
+            # Drop the events of the frame that falls out of the history
+            oldest = self.frame_starts[1]
+            while self.events and self.events[0][1] < oldest:
+                self.events.popleft()
+        self.frame_starts.append(now)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.samples)
+
+    def timings(self, name: str) -> np.ndarray:
+        """The durations of the last (at most `history`) runs of a section,
+        from the oldest to the newest."""
+        samples = self.samples.get(name)
+        if samples is None:
+            return np.zeros(0)
+
+        count = self.counts[name]
+        if count < self.history:
+            return samples[:count]
+        return np.roll(samples, -(count % self.history))
+
+    def stats(self, name: str) -> Dict[str, float]:
+        """The mean, median (p50), p95, p99 and max duration of a section over
+        the history."""
+        timings = self.timings(name)
+        if len(timings) == 0:
+            return {key: 0.0 for key in ("mean", "p50", "p95", "p99", "max")}
+
+        p50, p95, p99 = np.percentile(timings, (50, 95, 99))
+        return {
+            "mean": float(timings.mean()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "max": float(timings.max()),
+        }
+
+    def report(self) -> str:
+        """A table of the statistics of every section."""
+        width = max([len(name) for name in self.names] + [7])
+        lines = [
+            f"{'section':<{width}}"
+            + "".join(f"{key:>11}" for key in ("mean", "p50", "p95", "p99", "max"))
+        ]
+        for name in self.names:
+            lines.append(
+                f"{name:<{width}}"
+                + "".join(f"{value:>9.3f}ms" for value in self.stats(name).values())
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict:
+        """The recorded sections, as a trace in the Chrome trace event format."""
+
+        def microseconds(t: float) -> float:
+            return (t - self.origin) * 1e6
+
+        events = [
+            {
+                "name": "frame",
+                "ph": "i",
+                "s": "g",
+                "ts": microseconds(start),
+                "pid": 0,
+                "tid": 0,
+            }
+            for start in self.frame_starts
+        ]
+        events.extend(
+            {
+                "name": name,
+                "cat": name.split("/")[0],
+                "ph": "X",
+                "ts": microseconds(start),
+                "dur": (end - start) * 1e6,
+                "pid": 0,
+                "tid": 0,
+            }
+            for name, start, end in self.events
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, filename: str):
+        with open(filename, "w") as f:
+            json.dump(self.chrome_trace(), f)
@@ -1,21 +1,34 @@
 from __future__ import annotations
 import glob
+import logging
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from PyQt5.QtWidgets import QFileSystemModel
-from PyQt5.QtCore import QDir, QAbstractListModel, QFileSystemWatcher, QModelIndex, Qt
+from PyQt5.QtCore import (
+    QDir,
+    QAbstractListModel,
+    QFileSystemWatcher,
+    QModelIndex,
+    Qt,
+    QTimer,
+)
 from PyQt5.QtGui import QIcon
 import json
 
+from nimble.common.autosave import Autosave
+from nimble.common.project_loader import ProjectFiles, ProjectLoader
+from nimble.common.scene_file import encode_scene
+from nimble.common.script_cache import ScriptCache
 from nimble.common.serialize import (
     serialize_model,
     serialize_scene,
     unserialize_model,
-    unserialize_scene,
 )
 from nimble.objects import Scene
 from nimble.resources import script_boilerplate
+from nimble.utils import write_atomically
 
 
 class ProjectObserver:
@@ -24,6 +37,21 @@ class ProjectObserver:
     def project_changed(self):
         pass
 
+    def script_changed(self, script: str):
+        """Called when a script of the project (e.g. `player.py`) changed on
+        disk, once it has been compiled again."""
+        pass
+
+    def load_progress(self, done: int, total: int):
+        """Called while a project is loaded in the background, with the number
+        of objects created so far. `total` is 0 while its files are read."""
+        pass
+
+    def load_finished(self, loaded: bool):
+        """Called when a project was loaded, or when loading it failed or was
+        cancelled (when `loaded` is false)."""
+        pass
+
 
 class Project(QFileSystemModel):
     """A single nimble project."""
@@ -39,8 +67,18 @@ class Project(QFileSystemModel):
 
         self.observers: Dict[str, ProjectObserver] = {}
         self.file_watcher = None
+        self.script_timer = None
+        self.changed_scripts: Set[str] = set()
+        # Scripts that are being compiled in the background
+        self.script_executor: Optional[ThreadPoolExecutor] = None
+        self.compiling_scripts: List[Tuple[str, Future]] = []
         self._scene = Scene()
         self._scripts = ScriptList()
+        # Scenes are saved in the format they were loaded from
+        self.binary_scene = False
+        self.autosave = Autosave(self._scene)
+        # The project that is being loaded in the background, if any
+        self.loader: Optional[ProjectLoader] = None
 
         self.copied: Any = None
 
@@ -71,36 +109,44 @@ class Project(QFileSystemModel):
 
     def paste(self):
         if self.copied is not None:
-            _id = self.scene.add_obj(unserialize_model(self.copied))
+            _id = self.scene.journal.add_obj(unserialize_model(self.copied))
             self.scene.set_active(_id)
 
     def save_scene(self):
         """Save the current scene to the project folder."""
         scene_dict = serialize_scene(current_project.scene)
-        json.dump(scene_dict, open(self.get_scene_file(self.folder), "w"))
-
-    def _load_scene(self, filename: Path):
-        """Load the scene from the given filename."""
-        scene_dict = json.load(open(filename, "r"))
-        scene = unserialize_scene(scene_dict)
-        self._scene.replace(scene)
+        if self.binary_scene:
+            data = encode_scene(scene_dict)
+        else:
+            data = json.dumps(scene_dict)
+        write_atomically(self.get_scene_file(self.folder), data)
+        self.autosave.saved(scene_dict)
 
     def save_project(self):
         """Save the current project to the project folder."""
-        json.dump({"name": self.name}, open(self.get_project_file(self.folder), "w"))
-
-    def _load_project(self, filename: Path):
-        """Load the project from the given filename."""
-        proj_info = json.load(open(filename, "r"))
-        self.name = proj_info["name"]
+        write_atomically(
+            self.get_project_file(self.folder), json.dumps({"name": self.name})
+        )
 
     def set_folder(self, file: Path, create: bool = False):
         """Load/create a project from a new folder."""
         if self.file_watcher is None:
             self.file_watcher = QFileSystemWatcher()
             self.file_watcher.directoryChanged.connect(self.dir_changed)
+            self.file_watcher.fileChanged.connect(self.file_changed)
+
+            # Editors often write a file in a few steps, so wait for changes
+            # to settle down before reloading scripts
+            self.script_timer = QTimer()
+            self.script_timer.setSingleShot(True)
+            self.script_timer.setInterval(100)
+            self.script_timer.timeout.connect(self.scripts_changed)
 
         self.file_watcher.removePath(str(self.folder))
+        # Don't report the scripts of the previous project
+        self.compiling_scripts = []
+        if self.file_watcher.files():
+            self.file_watcher.removePaths(self.file_watcher.files())
         self.folder = file
         if create:
             self.folder.mkdir(parents=True, exist_ok=True)
@@ -113,16 +159,93 @@ class Project(QFileSystemModel):
 
     def dir_changed(self, _path: str):
         old_len = len(self._scripts)
-        for path in glob.glob(str(self.folder / "*.py")):
+        paths = glob.glob(str(self.folder / "*.py"))
+        for path in paths:
             self._scripts.add_script(Path(path).name)
         del self._scripts[:old_len]
 
-    def load_project(self, file: Path):
-        """Load a project from a `*.nimproj` file."""
-        file = Path(file)
-        self.set_folder(file.parent)
-        self._load_scene(self.get_scene_file(self.folder))
-        self._load_project(file)
+        # Watch the scripts themselves too, to recompile them when they change
+        watched = set(self.file_watcher.files())
+        new = [path for path in paths if path not in watched]
+        if new:
+            self.file_watcher.addPaths(new)
+
+    def file_changed(self, path: str):
+        if Path(path).exists() and path not in self.file_watcher.files():
+            # Editors that save by replacing the file stop it from being
+            # watched
+            self.file_watcher.addPath(path)
+
+        self.changed_scripts.add(path)
+        self.script_timer.start()
+
+    def scripts_changed(self):
+        """Compile the scripts that changed in the background, and notify the
+        observers of the ones that were compiled since the last call. Runs
+        again (with `script_timer`) until every script is compiled."""
+        paths, self.changed_scripts = self.changed_scripts, set()
+        if paths and self.script_executor is None:
+            self.script_executor = ThreadPoolExecutor(
+                1, thread_name_prefix="script-cache"
+            )
+        for path in paths:
+            future = self.script_executor.submit(ScriptCache().refresh, Path(path))
+            self.compiling_scripts.append((path, future))
+
+        compiled, pending = [], []
+        for (path, future) in self.compiling_scripts:
+            (compiled if future.done() else pending).append((path, future))
+        self.compiling_scripts = pending
+
+        for (path, _) in compiled:
+            for observer in list(self.observers.values()):
+                observer.script_changed(Path(path).name)
+
+        if self.compiling_scripts and not self.script_timer.isActive():
+            self.script_timer.start()
+
+    def load_project(self, file: Path, autosave: bool = False):
+        """Load a project from a `*.nimproj` file, and block until it's open.
+        With `autosave`, changes that were autosaved (but not saved) are
+        recovered, and the scene is autosaved from then on."""
+        self.cancel_loading()
+        ProjectLoader(self, file, autosave).run()
+
+    def load_project_async(self, file: Path, autosave: bool = False) -> ProjectLoader:
+        """Start loading a project from a `*.nimproj` file in the background
+        (see `ProjectLoader`), like `load_project`. The current project stays
+        open until it's loaded."""
+        self.cancel_loading()
+        self.loader = ProjectLoader(self, file, autosave)
+        self.loader.start()
+        return self.loader
+
+    def cancel_loading(self):
+        """Stop loading the project that is loaded in the background, if any."""
+        if self.loader is not None:
+            self.loader.cancel()
+            self.loader = None
+
+    def open_loaded_project(self, file: Path, files: ProjectFiles, scene: Scene):
+        """Switch to a project that was loaded by a `ProjectLoader`."""
+        # The changes to the open project were discarded
+        self.autosave.stop(discard=True)
+        self.set_folder(Path(file).parent)
+        self.name = files.name
+        self.binary_scene = files.binary_scene
+        self._scene.replace(scene)
+
+        if files.recover_error is not None:
+            logging.getLogger("nimble").warning(
+                f"Couldn't recover the autosaved scene: {files.recover_error}"
+            )
+        if files.recovered:
+            logging.getLogger("nimble").warning(
+                "Recovered unsaved changes to the scene after a crash, save the "
+                "project to keep them"
+            )
+        if files.data is not None:
+            self.autosave.start(self.folder, files.data, files.recovered)
 
         for observer in self.observers.values():
             observer.project_changed()
@@ -130,17 +253,26 @@ class Project(QFileSystemModel):
         for observer in self.scene.observers:
             observer.select_changed(self.scene.active_idx, self.scene.get_active())
 
+    def start_autosave(self):
+        """Autosave the scene to the project folder."""
+        self.autosave.start(self.folder)
+
     def set_project_name(self, folder: Path, name: str):
         self.set_folder(Path(folder) / f"{name}/", create=True)
         self.name = name
+        # Autosave to the new folder
+        self.start_autosave()
         for observer in self.observers.values():
             observer.project_changed()
 
     def new_project(self, folder: Path, name: str):
+        self.autosave.stop(discard=True)
         self.setRootPath(QDir.rootPath())
         self.set_folder(Path(folder) / f"{name}/", create=True)
         self.name = name
+        self.binary_scene = False
         self._scene.replace(Scene.default_scene())
+        self.start_autosave()
         self.save_project()
         self.save_scene()
         for observer in self.observers.values():
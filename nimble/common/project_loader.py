@@ -0,0 +1,277 @@
+"""Loading projects without blocking the UI thread."""
+
+from __future__ import annotations
+import gc
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional
+
+from PyQt5.QtCore import QTimer
+
+from nimble.common.autosave import Autosave
+from nimble.common.scene_file import (
+    SceneFile,
+    SceneLoader,
+    encode_scene,
+    is_binary_scene,
+    magic,
+)
+from nimble.objects.draw_primitive import Mesh
+
+if TYPE_CHECKING:
+    from nimble.common.project import Project
+
+
+class ProjectFiles(NamedTuple):
+    """The files of a project, as read by `ProjectLoader.read`."""
+
+    name: str
+    binary_scene: bool
+    scene_file: SceneFile
+    # The vertex data of the geometries of the scene (see `SceneLoader`)
+    meshes: Dict[int, Mesh]
+    # The scene in the format of `serialize_scene`, if it's autosaved
+    data: Any
+    # Whether the scene has autosaved changes, which were recovered
+    recovered: bool
+    # Why autosaved changes couldn't be recovered, if they couldn't
+    recover_error: Optional[Exception]
+
+
+class ProjectLoader:
+    """Loads a project (see `Project.load_project_async`) in two stages.
+
+    First, a background thread reads the files of the project (and recovers
+    its autosave, if `autosave` is set), and generates the meshes of the
+    scene. Scenes in the JSON format are encoded to the binary format in
+    memory, so both formats are loaded by a `SceneLoader`.
+
+    Then the UI thread creates the models, and uploads their geometries to
+    the GPU, for `time_slice` milliseconds per iteration of the event loop.
+    Once every model is created, the scene replaces the current one; until
+    then, the current project stays open.
+
+    The observers of the project are notified of the progress with
+    `load_progress`, and with `load_finished` once the project is open, or
+    the load failed (which is logged) or was cancelled with `cancel`.
+    """
+
+    # In milliseconds
+    time_slice = 8
+    poll_interval = 15
+
+    # Models created between checks of the time
+    batch_size = 32
+
+    def __init__(self, project: Project, file: Path, autosave: bool = False):
+        self.project = project
+        self.file = Path(file)
+        self.autosave = autosave
+
+        self.cancelled = threading.Event()
+        self.future: Optional[Future] = None
+        self.files: Optional[ProjectFiles] = None
+        self.scene_loader: Optional[SceneLoader] = None
+        self.timer: Optional[QTimer] = None
+        # Whether the garbage collector has to be enabled again
+        self.resume_gc = False
+
+    @property
+    def folder(self) -> Path:
+        return self.file.parent
+
+    @property
+    def running(self) -> bool:
+        return self.timer is not None
+
+    def run(self):
+        """Load the project on this thread, and block until it's open."""
+        self.files = self.read(
+            self.file,
+            self.project.get_scene_file(self.folder),
+            self.autosave,
+            self.cancelled,
+        )
+        self.scene_loader = SceneLoader(self.files.scene_file, self.files.meshes)
+        try:
+            self.scene_loader.load(len(self.files.scene_file))
+        except Exception:
+            self.discard()
+            raise
+        self.finish()
+
+    def start(self):
+        """Start loading the project in the background."""
+        executor = ThreadPoolExecutor(1, thread_name_prefix="project-loader")
+        self.future = executor.submit(
+            self.read,
+            self.file,
+            self.project.get_scene_file(self.folder),
+            self.autosave,
+            self.cancelled,
+        )
+        # The thread exits once the files are read
+        executor.shutdown(wait=False)
+
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.step)
+        self.timer.start(self.poll_interval)
+        self.notify_progress()
+
+    def cancel(self):
+        """Stop loading the project, and keep the current one open."""
+        if not self.running:
+            return
+
+        self.cancelled.set()
+        if self.future is not None:
+            # Close the scene file once the background thread is done with it
+            self.future.add_done_callback(self.close_result)
+        else:
+            self.discard()
+        self.stop(False)
+
+    def step(self):
+        """Load the project for one time slice (on the UI thread)."""
+        if self.future is not None:
+            if not self.future.done():
+                return
+            try:
+                self.files = self.future.result()
+            except Exception as e:
+                self.fail(e)
+                return
+            self.future = None
+            self.scene_loader = SceneLoader(self.files.scene_file, self.files.meshes)
+            # Keep creating models whenever the UI is idle
+            self.timer.setInterval(0)
+            # Otherwise, it would scan the models created so far over and over
+            self.resume_gc = gc.isenabled()
+            gc.disable()
+
+        deadline = time.perf_counter() + self.time_slice / 1000
+        try:
+            while not self.scene_loader.done and time.perf_counter() < deadline:
+                self.scene_loader.load(self.batch_size)
+        except Exception as e:
+            self.discard()
+            self.fail(e)
+            return
+
+        if self.scene_loader.done:
+            self.finish()
+        else:
+            self.notify_progress()
+
+    def finish(self):
+        scene = self.scene_loader.finish()
+        self.files.scene_file.close()
+        self.project.open_loaded_project(self.file, self.files, scene)
+        self.stop(True)
+
+    def fail(self, error: Exception):
+        logging.getLogger("nimble").error(
+            f"Couldn't open the project {self.file}: {error}"
+        )
+        self.stop(False)
+
+    def stop(self, loaded: bool):
+        if self.timer is not None:
+            self.timer.stop()
+            self.timer = None
+        if self.resume_gc:
+            self.resume_gc = False
+            gc.enable()
+        if self.project.loader is self:
+            self.project.loader = None
+        for observer in list(self.project.observers.values()):
+            observer.load_finished(loaded)
+
+    def discard(self):
+        """Throw away the models created so far, and the scene file."""
+        if self.scene_loader is not None:
+            self.scene_loader.release()
+        if self.files is not None:
+            self.files.scene_file.close()
+
+    def notify_progress(self):
+        done = 0 if self.scene_loader is None else len(self.scene_loader)
+        total = 0 if self.files is None else len(self.files.scene_file)
+        for observer in list(self.project.observers.values()):
+            observer.load_progress(done, total)
+
+    @staticmethod
+    def close_result(future: Future):
+        if not future.cancelled() and future.exception() is None:
+            files = future.result()
+            if files is not None:
+                files.scene_file.close()
+
+    # This runs in the background thread
+
+    @staticmethod
+    def read(
+        project_file: Path,
+        scene_path: Path,
+        autosave: bool,
+        cancelled: threading.Event,
+    ) -> Optional[ProjectFiles]:
+        """Read the files of a project, and generate the meshes of its scene.
+        Returns `None` if the load was cancelled in the meantime."""
+        with open(project_file, "r") as f:
+            name = json.load(f)["name"]
+        with open(scene_path, "rb") as f:
+            binary_scene = is_binary_scene(f.read(len(magic)))
+
+        recovered = recover_error = recovered_file = None
+        if autosave:
+            try:
+                recovered = Autosave.recover(project_file.parent, scene_path)
+                if recovered is not None:
+                    recovered_file = SceneFile(encode_scene(recovered))
+            except Exception as e:
+                # A damaged autosave can't keep the project from opening, the
+                # saved scene is opened instead
+                recovered = None
+                recover_error = e
+
+        if cancelled.is_set():
+            return None
+
+        # Only the autosave needs the scene in the JSON-compatible format
+        data = None
+        if recovered is not None:
+            data = recovered
+            scene_file = recovered_file
+        elif binary_scene:
+            scene_file = SceneFile.open(scene_path)
+        else:
+            with open(scene_path, "r") as f:
+                data = json.load(f)
+            scene_file = SceneFile(encode_scene(data))
+
+        try:
+            if autosave and data is None:
+                data = scene_file.to_json()
+            meshes = {} if cancelled.is_set() else scene_file.create_meshes()
+        except Exception:
+            scene_file.close()
+            raise
+
+        if cancelled.is_set():
+            scene_file.close()
+            return None
+
+        return ProjectFiles(
+            name,
+            binary_scene,
+            scene_file,
+            meshes,
+            data,
+            recovered is not None,
+            recover_error,
+        )
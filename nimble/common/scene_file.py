@@ -0,0 +1,496 @@
+"""
+A binary format for scene files, as an alternative to JSON:
+
+    python -m nimble convert scene.nimscn scene-binary.nimscn --to binary
+
+Both formats use the `.nimscn` extension, binary files are recognized by
+their first bytes (see `is_binary_scene`).
+
+A binary scene file starts with a header (`header_format`), followed by the
+offset and size of each of its sections (in the order of `sections`):
+
+- `tables`: a small JSON document with every distinct material, geometry and
+  component (without its id). Objects refer to them by index, so parameters
+  that many objects share are only stored once.
+- `names`: the names of the objects, as UTF-8, separated by NUL bytes.
+- `objects`: one `object_dtype` record per object, in the order of
+  `Scene.objects`.
+- `components`: one `component_dtype` record per component.
+- `transforms`: the position, rotation and scale of every object, as an
+  (N, 3, 3) array of float32.
+- `order`: `Scene.objects_list`, as indices into the objects.
+
+The file is memory-mapped by `SceneFile`, and its sections are used as numpy
+arrays without copying them, so an object can be read (or turned into a
+model) without reading the objects before it.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+import numpy as np
+
+from nimble.utils import gc_paused
+
+if TYPE_CHECKING:
+    from nimble.objects import Geometry, Material, Model, Scene
+    from nimble.objects.draw_primitive import Mesh
+
+magic = b"\x89NIMSCN\n"
+version = 1
+
+# Magic, version, number of objects, active index
+header_format = "<8sIIi"
+sections = ("tables", "names", "objects", "components", "transforms", "order")
+# The offset and size of every section
+section_format = "<" + "QQ" * len(sections)
+# Sections start at multiples of this many bytes
+alignment = 8
+
+object_dtype = np.dtype(
+    [
+        # The name is names[name_start:name_end]
+        ("name_start", "<u4"),
+        ("name_end", "<u4"),
+        ("material", "<u4"),
+        # -1 if the object has no geometry
+        ("geometry", "<i4"),
+        # The components are components[components_start:components_end]
+        ("components_start", "<u4"),
+        ("components_end", "<u4"),
+    ]
+)
+component_dtype = np.dtype(
+    [
+        ("template", "<u4"),
+        ("has_id", "u1"),
+        ("id", "<i8"),
+    ]
+)
+
+
+def is_binary_scene(data: bytes) -> bool:
+    """Whether `data` (or the start of it) is a binary scene file."""
+    return data[: len(magic)] == magic
+
+
+class _Table:
+    """Deduplicates JSON-compatible values, and gives each an index."""
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self.indices: Dict[str, int] = {}
+
+    def add(self, value: Any) -> int:
+        key = json.dumps(value, sort_keys=True)
+        index = self.indices.get(key)
+        if index is None:
+            index = self.indices[key] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+def encode_scene(data: Any) -> bytes:
+    """Encode a scene from its JSON-compatible representation (see
+    `serialize_scene`) into a binary scene file."""
+    models = list(data["objects"].values())
+    materials, geometries, templates = _Table(), _Table(), _Table()
+
+    records = []
+    components = []
+    names = bytearray()
+    for model in models:
+        if "\0" in model["name"]:
+            raise ValueError(f"object names can't contain NUL: {model['name']!r}")
+        if records:
+            names += b"\0"
+        name_start = len(names)
+        names += model["name"].encode("utf-8")
+        components_start = len(components)
+        for component in model["components"]:
+            _id = component["component_id"]
+            template = templates.add(
+                {
+                    "class_name": component["class_name"],
+                    "slot_values": component["slot_values"],
+                }
+            )
+            components.append((template, _id is not None, _id or 0))
+
+        records.append(
+            (
+                name_start,
+                len(names),
+                materials.add(model["material"]),
+                -1 if model["geometry"] is None else geometries.add(model["geometry"]),
+                components_start,
+                len(components),
+            )
+        )
+
+    transforms = np.array(
+        [(model["position"], model["rotation"], model["scale"]) for model in models],
+        dtype="<f4",
+    ).reshape(len(models), 3, 3)
+
+    indices = {name: i for (i, name) in enumerate(data["objects"])}
+    try:
+        order = np.array([indices[name] for name in data["objects_list"]], "<i4")
+    except KeyError as e:
+        raise ValueError(f"object {e} is listed, but not in the scene") from None
+
+    tables = {
+        "materials": materials.values,
+        "geometries": geometries.values,
+        "components": templates.values,
+    }
+    contents = [
+        json.dumps(tables).encode("utf-8"),
+        bytes(names),
+        np.array(records, dtype=object_dtype).tobytes(),
+        np.array(components, dtype=component_dtype).tobytes(),
+        transforms.tobytes(),
+        order.tobytes(),
+    ]
+
+    header = struct.pack(header_format, magic, version, len(models), data["active_idx"])
+    offset = len(header) + struct.calcsize(section_format)
+    layout = []
+    body = bytearray()
+    for content in contents:
+        padding = -(offset + len(body)) % alignment
+        body += bytes(padding)
+        layout += [offset + len(body), len(content)]
+        body += content
+
+    return header + struct.pack(section_format, *layout) + bytes(body)
+
+
+class SceneFile:
+    """A binary scene file, read lazily.
+
+    Only the header and the tables are parsed when the file is opened.
+    Everything else is read from the file (through a memory map, when opened
+    with `open`) when it's used. Close the file with `close`, or use it as a
+    context manager.
+    """
+
+    def __init__(self, data: Union[bytes, mmap.mmap]):
+        self._data = data
+        header_size = struct.calcsize(header_format)
+        if len(data) < header_size + struct.calcsize(section_format):
+            raise ValueError("not a binary scene file")
+        (file_magic, file_version, count, self.active_idx) = struct.unpack_from(
+            header_format, data
+        )
+        if file_magic != magic:
+            raise ValueError("not a binary scene file")
+        if file_version != version:
+            raise ValueError(f"unsupported scene file version {file_version}")
+
+        layout = struct.unpack_from(section_format, data, header_size)
+        buffer = memoryview(data)
+        views = {}
+        for (i, section) in enumerate(sections):
+            offset, size = layout[2 * i], layout[2 * i + 1]
+            if offset + size > len(data):
+                raise ValueError(f"scene file is truncated ({section})")
+            views[section] = buffer[offset : offset + size]
+
+        self._names = views["names"]
+        self.objects = np.frombuffer(views["objects"], dtype=object_dtype, count=count)
+        self.components = np.frombuffer(views["components"], dtype=component_dtype)
+        transforms = np.frombuffer(views["transforms"], dtype="<f4").reshape(-1, 3, 3)
+        # (N, 3) arrays, which are read-only views of the file
+        self.positions = transforms[:, 0]
+        self.rotations = transforms[:, 1]
+        self.scales = transforms[:, 2]
+        self.order = np.frombuffer(views["order"], dtype="<i4")
+
+        tables = json.loads(bytes(views["tables"]))
+        self.materials: List[Any] = tables["materials"]
+        self.geometries: List[Any] = tables["geometries"]
+        self.templates: List[Any] = tables["components"]
+
+        self._indices: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def open(cls, path: Path) -> SceneFile:
+        """Memory-map a binary scene file."""
+        with open(path, "rb") as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped
+                raise ValueError("not a binary scene file") from None
+        try:
+            return cls(data)
+        except ValueError:
+            data.close()
+            raise
+
+    def close(self):
+        # Views of a memory map have to go before it can be closed
+        self._names = self.objects = self.components = self.order = None
+        self.positions = self.rotations = self.scales = None
+        if isinstance(self._data, mmap.mmap):
+            try:
+                self._data.close()
+            except BufferError:
+                # Arrays from the file are still used somewhere (e.g. by a
+                # traceback), so it's closed once they're gone
+                pass
+
+    def __enter__(self) -> SceneFile:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def name(self, idx: int) -> str:
+        record = self.objects[idx]
+        return str(
+            self._names[record["name_start"] : record["name_end"]], encoding="utf-8"
+        )
+
+    @property
+    def names(self) -> List[str]:
+        """The names of all objects, in the order of `Scene.objects`."""
+        # Names may be empty, so they're sliced out rather than split on NUL
+        names = bytes(self._names)
+        return [
+            names[start:end].decode("utf-8")
+            for (start, end) in zip(
+                self.objects["name_start"].tolist(), self.objects["name_end"].tolist()
+            )
+        ]
+
+    @property
+    def objects_list(self) -> List[str]:
+        names = self.names
+        return [names[idx] for idx in self.order.tolist()]
+
+    def index(self, name: str) -> int:
+        """The index of the object called `name`."""
+        if self._indices is None:
+            self._indices = {name: idx for (idx, name) in enumerate(self.names)}
+        return self._indices[name]
+
+    def model_data(self, idx: int) -> Any:
+        """The JSON-compatible representation of an object, like
+        `serialize_model`."""
+        record = self.objects[idx]
+        geometry = record["geometry"]
+        return {
+            "material": self.materials[record["material"]],
+            "name": self.name(idx),
+            "rotation": self.rotations[idx].tolist(),
+            "position": self.positions[idx].tolist(),
+            "scale": self.scales[idx].tolist(),
+            "geometry": None if geometry < 0 else self.geometries[geometry],
+            "components": self._components_data(record),
+        }
+
+    def to_json(self) -> Any:
+        """The JSON-compatible representation of the scene, like
+        `serialize_scene`."""
+        return {
+            "objects": {
+                name: self.model_data(idx) for (idx, name) in enumerate(self.names)
+            },
+            "objects_list": self.objects_list,
+            "active_idx": self.active_idx,
+        }
+
+    def load_model(self, idx: int) -> Model:
+        """Create the model of one object."""
+        from nimble.common.serialize import unserialize_geometry, unserialize_material
+
+        record = self.objects[idx]
+        geometry = record["geometry"]
+        model = self._create_model(
+            idx,
+            unserialize_material(self.materials[record["material"]]),
+            None if geometry < 0 else unserialize_geometry(self.geometries[geometry]),
+        )
+        model.position = self.positions[idx]
+        model.rotation = self.rotations[idx]
+        model.scale = self.scales[idx]
+        return model
+
+    def load_scene(self) -> Scene:
+        """Create every model of the scene."""
+        loader = SceneLoader(self)
+        loader.load(len(self))
+        return loader.finish()
+
+    def create_meshes(self) -> Dict[int, Mesh]:
+        """Generate the vertex data of the geometries in the table (see
+        `Geometry.create_mesh`), by their index, for a `SceneLoader`. Unlike
+        loading the scene, this can run on any thread."""
+        from nimble.objects import geometry
+
+        meshes = {}
+        for (idx, data) in enumerate(self.geometries):
+            cls = getattr(geometry, data["class_name"])
+            mesh = cls.create_mesh(**data["kwargs"])
+            if mesh is not None:
+                meshes[idx] = mesh
+        return meshes
+
+    def _create_model(
+        self, idx: int, material: Material, geometry: Optional[Geometry]
+    ) -> Model:
+        """Create the model of an object, without its transform."""
+        from nimble.common.serialize import unserialize_component
+        from nimble.objects import Model
+
+        model = Model(material, geometry=geometry, name=self.name(idx))
+        for component in self._components_data(self.objects[idx]):
+            model.add_component(unserialize_component(component, model))
+        return model
+
+    def _components_data(self, record: np.void) -> List[Any]:
+        components = self.components[
+            record["components_start"] : record["components_end"]
+        ]
+        return [
+            {
+                "class_name": self.templates[template]["class_name"],
+                "component_id": _id if has_id else None,
+                "slot_values": self.templates[template]["slot_values"],
+            }
+            for (template, has_id, _id) in components.tolist()
+        ]
+
+
+class SceneLoader:
+    """Creates the models of a scene file a few at a time (with `load`), so
+    that loading a large scene doesn't have to block the UI thread all at
+    once.
+
+    Every object gets a copy of the material from the table (which is cheaper
+    than creating it again), and shares its geometry. Materials and
+    geometries are only created (and geometries uploaded to the GPU) when the
+    first object uses them, from the vertex data in `meshes` (see
+    `SceneFile.create_meshes`) if it was generated already.
+    """
+
+    def __init__(self, scene_file: SceneFile, meshes: Optional[Dict[int, Mesh]] = None):
+        self.scene_file = scene_file
+        self.meshes = {} if meshes is None else meshes
+        self.materials: List[Optional[Material]] = [None] * len(scene_file.materials)
+        self.geometries: List[Optional[Geometry]] = [None] * len(scene_file.geometries)
+        self.models: List[Model] = []
+
+    def __len__(self) -> int:
+        """The number of models that were created so far."""
+        return len(self.models)
+
+    @property
+    def done(self) -> bool:
+        return len(self.models) == len(self.scene_file)
+
+    def load(self, count: int):
+        """Create the next `count` models (or less, at the end)."""
+        from nimble.common.serialize import unserialize_geometry, unserialize_material
+        from nimble.objects import GeometryCache
+
+        scene_file = self.scene_file
+        cache = GeometryCache()
+        start = len(self.models)
+        stop = min(start + count, len(scene_file))
+        with gc_paused():
+            for idx in range(start, stop):
+                record = scene_file.objects[idx]
+                geometry = record["geometry"]
+                if geometry < 0:
+                    shared = None
+                elif self.geometries[geometry] is None:
+                    shared = self.geometries[geometry] = unserialize_geometry(
+                        scene_file.geometries[geometry], self.meshes.get(geometry)
+                    )
+                else:
+                    shared = cache.acquire(self.geometries[geometry])
+
+                material = self.materials[record["material"]]
+                if material is None:
+                    material = self.materials[record["material"]] = (
+                        unserialize_material(scene_file.materials[record["material"]])
+                    )
+                self.models.append(
+                    scene_file._create_model(idx, material.copy(), shared)
+                )
+
+    def finish(self) -> Scene:
+        """The scene, once every model was created."""
+        from nimble.objects import Scene
+        from nimble.objects.transform_store import TransformStore
+
+        assert self.done, "not every model was created"
+        scene_file = self.scene_file
+
+        # Copy the transforms into the store all at once
+        store = TransformStore()
+        slots = np.array([model.transform_slot for model in self.models], np.intp)
+        store.positions[slots] = scene_file.positions
+        store.rotations[slots] = scene_file.rotations
+        store.scales[slots] = scene_file.scales
+        store.mark_dirty(slots)
+
+        scene = Scene()
+        scene.objects = {model.name: model for model in self.models}
+        scene.objects_list = scene_file.objects_list
+        scene.active_idx = scene_file.active_idx
+        return scene
+
+    def release(self):
+        """Release the GPU resources of the models created so far, when the
+        scene won't be finished."""
+        from nimble.objects import GeometryCache
+
+        for model in self.models:
+            if model.geometry is not None:
+                GeometryCache().release(model.geometry)
+        self.models.clear()
+
+
+def read_scene_data(path: Path) -> Any:
+    """Read the JSON-compatible representation of a scene file in either
+    format."""
+    with open(path, "rb") as f:
+        binary = is_binary_scene(f.read(len(magic)))
+    if binary:
+        with SceneFile.open(path) as scene_file:
+            return scene_file.to_json()
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m nimble convert",
+        description="Convert a scene file between the JSON and binary formats.",
+    )
+    parser.add_argument("input", type=Path, help="the scene.nimscn file")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--to", choices=("binary", "json"), required=True)
+    args = parser.parse_args(argv)
+
+    try:
+        data = read_scene_data(args.input)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"couldn't read {args.input}: {e}\n")
+
+    if args.to == "binary":
+        args.output.write_bytes(encode_scene(data))
+    else:
+        with open(args.output, "w") as f:
+            json.dump(data, f)
@@ -0,0 +1,121 @@
+"""A cache of compiled scripts."""
+
+from __future__ import annotations
+import glob
+import hashlib
+import importlib.util
+import logging
+import marshal
+import os
+import threading
+from pathlib import Path
+from types import CodeType
+from typing import Dict, NamedTuple, Optional
+
+from nimble.common.singleton import Singleton
+
+
+class _Entry(NamedTuple):
+    mtime: int
+    size: int
+    digest: bytes
+    code: CodeType
+
+
+class ScriptCache(metaclass=Singleton):
+    """Caches the compiled code of scripts, so starting a game doesn't compile
+    every script again.
+
+    The code of a script is reused for as long as its modification time and
+    size stay the same. When they change, the file is read and its code is
+    looked up by the hash of its contents instead: in memory, then in the
+    cache directory of the project (`.nimblecache`, stored with `marshal` like
+    `__pycache__`). The script is only compiled if both miss.
+
+    The project calls `refresh` (on a background thread) when a script
+    changes on disk, so it is already compiled by the time it is needed.
+    Scripts are compiled one at a time, so `get` waits for a script that is
+    being compiled in the background instead of compiling it again.
+    """
+
+    directory_name = ".nimblecache"
+    # The cached files are only valid for the same version of Python
+    header = importlib.util.MAGIC_NUMBER
+
+    def __init__(self):
+        self.entries: Dict[Path, _Entry] = {}
+        self.lock = threading.Lock()
+
+    def get(self, path: Path) -> CodeType:
+        """The compiled code of a script. Raises `SyntaxError` if it doesn't
+        compile, and `OSError` if it can't be read."""
+        with self.lock:
+            return self._get(Path(path))
+
+    def _get(self, path: Path) -> CodeType:
+        stat = path.stat()
+        entry = self.entries.get(path)
+        if entry is not None and (entry.mtime, entry.size) == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            return entry.code
+
+        source = path.read_bytes()
+        digest = hashlib.sha256(source).digest()
+        if entry is not None and entry.digest == digest:
+            # Only the modification time changed
+            code = entry.code
+        else:
+            code = self.load(path, digest)
+            if code is None:
+                code = compile(source, str(path), "exec")
+                self.store(path, digest, code)
+
+        self.entries[path] = _Entry(stat.st_mtime_ns, stat.st_size, digest, code)
+        return code
+
+    def refresh(self, path: Path):
+        """Compile a script that changed (if it still compiles)."""
+        with self.lock:
+            try:
+                self._get(Path(path))
+            except (OSError, SyntaxError, ValueError):
+                # The error is shown once the script is used
+                self.entries.pop(Path(path), None)
+
+    def cache_file(self, path: Path, digest: bytes) -> Path:
+        return path.parent / self.directory_name / f"{path.name}.{digest.hex()[:16]}"
+
+    def load(self, path: Path, digest: bytes) -> Optional[CodeType]:
+        """Load the code of a script from the cache directory."""
+        try:
+            data = self.cache_file(path, digest).read_bytes()
+        except OSError:
+            return None
+
+        prefix = self.header + digest
+        if not data.startswith(prefix):
+            return None
+        try:
+            return marshal.loads(data[len(prefix) :])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def store(self, path: Path, digest: bytes, code: CodeType):
+        """Save the code of a script to the cache directory, replacing older
+        versions of it."""
+        file = self.cache_file(path, digest)
+        try:
+            file.parent.mkdir(exist_ok=True)
+            for old in file.parent.glob(f"{glob.escape(path.name)}.*"):
+                old.unlink()
+
+            # Write to a temporary file first, so a crash never leaves half a
+            # file behind
+            temporary = file.with_name(f"{file.name}.tmp")
+            temporary.write_bytes(self.header + digest + marshal.dumps(code))
+            os.replace(temporary, file)
+        except OSError as e:
+            # The cache is only an optimization
+            logging.getLogger("nimble").debug(f"Couldn't cache {path}: {e}")
@@ -2,12 +2,13 @@
 compatible representation."""
 
 from __future__ import annotations
-from typing import Any, List
+from typing import Any, List, Optional
 
 from pyrr import Vector3
 
 from nimble.objects import Geometry, Model, Scene, Material, Component
 from nimble.objects import component, geometry
+from nimble.objects.draw_primitive import Mesh
 
 
 def to_jsonable(vec: Vector3) -> List[float]:
@@ -19,7 +20,7 @@ def serialize_scene(scene: Scene) -> Any:
         "objects": {
             name: serialize_model(model) for name, model in scene.objects.items()
         },
-        "objects_list": scene.objects_list,
+        "objects_list": list(scene.objects_list),
         "active_idx": scene.active_idx,
     }
 
@@ -41,7 +42,7 @@ def serialize_model(model: Model) -> Any:
 def serialize_material(material: Material) -> Any:
     return {
         "shader": material.shader_name,
-        "material_params": material.params,
+        "material_params": dict(material.params),
     }
 
 
@@ -108,9 +109,10 @@ def unserialize_component(data: Any, model: Model) -> Component:
     return c
 
 
-def unserialize_geometry(data: Any) -> Geometry:
+def unserialize_geometry(data: Any, mesh: Optional[Mesh] = None) -> Geometry:
     geometry_class = getattr(
         geometry,
         data["class_name"],
     )
-    return geometry_class(**data["kwargs"])
+    # Identical geometries share their GPU buffers
+    return geometry.GeometryCache().get(geometry_class, data["kwargs"], mesh)
@@ -18,12 +18,14 @@ class Shaders(metaclass=Singleton):
 
     def load_defaults(self):
         self.load("viewport", shader("viewport.glsl"))
+        self.load("viewport_instanced", shader("viewport_instanced.glsl"))
         self.load("grid", shader("grid.glsl"))
         self.load("constant_color", shader("constant_color.glsl"))
         self.load("bounding_box", shader("bounding_box.glsl"))
         self.load("outline_filter", shader("outline_filter.glsl"))
         self.load("ray", shader("ray.glsl"))
         self.load("texture", shader("texture.glsl"))
+        self.load("text", shader("text.glsl"))
 
     def load(self, name: str, source: str) -> Program:
         if name in self.shaders:
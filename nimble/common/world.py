@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, Type
-from nimble.common.ecs import BaseWorld, _C
+from nimble.common.ecs import ArchetypeWorld, _C
 from nimble.objects.model import Model
 from nimble.objects.component import CameraComponent
 
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from nimble.common.overlay.overlay import OverlayComponent
 
 
-class World(BaseWorld):
+class World(ArchetypeWorld):
     """A subclass of the ECS world with some nimble specific methods."""
 
     def get_obj_component(self, obj: Model, component: Type[_C]) -> _C:
@@ -0,0 +1,161 @@
+"""
+Run a game without a window, for benchmarks and soak tests on machines
+without a display:
+
+    python -m nimble run --headless path/to/project.nimproj --frames 1000
+
+Frames are simulated with a fixed time step (instead of the time that passed),
+so every run of a project gives the same results. Geometries still need an
+OpenGL context, so a standalone (offscreen) context is created, but the game
+is only drawn (to an offscreen framebuffer) with `--render`.
+
+Prints statistics of the time taken per frame, processor, script and render
+pass (see `FrameProfiler`). `--json` saves the timings of every frame, and
+`--trace` saves a Chrome trace.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import moderngl as mgl
+import moderngl_window as mglw
+from moderngl_window.geometry import quad_fs
+from PyQt5.QtCore import QCoreApplication
+
+if TYPE_CHECKING:
+    from nimble.common.profiler import FrameProfiler
+
+
+def create_context(backend: Optional[str]) -> mgl.Context:
+    if backend:
+        ctx = mgl.create_standalone_context(require=430, backend=backend)
+    else:
+        ctx = mgl.create_standalone_context(require=430)
+    mglw.activate_context(ctx=ctx)
+    return ctx
+
+
+def run_headless(
+    project_file: Path,
+    frames: int,
+    time_step: float = 1 / 60,
+    size: Optional[Tuple[int, int]] = None,
+    backend: Optional[str] = "egl",
+) -> FrameProfiler:
+    """Load a project, and run its game for `frames` frames of `time_step`
+    seconds. The game is drawn to an offscreen framebuffer of `size` if it
+    is given. Returns the profiler with the timings of every frame."""
+    ctx = create_context(backend)
+
+    # These need an active context to import/initialize
+    import nimble.resources.resources
+    from nimble.common import current_project
+    from nimble.common.game import Game
+    from nimble.common.models.size import ViewportSize
+    from nimble.common.profiler import FrameProfiler
+    from nimble.common.shader_manager import Shaders
+    from nimble.interface.orbit_camera import OrbitCamera
+
+    # The project watches its folder for new scripts, which needs an event
+    # loop (but no GUI)
+    app = QCoreApplication.instance() or QCoreApplication([])
+
+    Shaders().load_defaults()
+    current_project.load_project(project_file)
+
+    # The same camera as the game window
+    camera = OrbitCamera(
+        ViewportSize(*(size or (1280, 720))), radius=6.0, near=0.01, far=500.0
+    )
+    frame = 0
+    game = Game(current_project.scene, camera, clock=lambda: frame * time_step)
+
+    if size is not None:
+        screen = ctx.simple_framebuffer(size)
+        active_buffer = ctx.framebuffer((ctx.texture(size, 4),))
+        overlay_vao = quad_fs()
+        game.resize(ctx, size)
+
+    profiler = FrameProfiler()
+    profiler.reset(history=frames + 1)
+    profiler.enabled = True
+    try:
+        for frame in range(1, frames + 1):
+            game.process()
+            if size is not None:
+                game.render(ctx, screen, active_buffer, overlay_vao)
+                with profiler.section("gpu"):
+                    ctx.finish()
+        # Finish the last frame
+        profiler.begin_frame()
+    finally:
+        profiler.enabled = False
+        game.close()
+
+    return profiler
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m nimble run", description="Run a nimble game."
+    )
+    parser.add_argument("project", type=Path, help="the project.nimproj file")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run without a window (currently required)",
+    )
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument(
+        "--time-step", type=float, default=1 / 60, help="seconds per frame"
+    )
+    parser.add_argument(
+        "--render",
+        type=int,
+        nargs=2,
+        metavar=("WIDTH", "HEIGHT"),
+        help="also draw every frame to an offscreen framebuffer",
+    )
+    parser.add_argument("--backend", default="egl", help="glcontext backend")
+    parser.add_argument("--json", type=Path, help="save the timings to a file")
+    parser.add_argument("--trace", type=Path, help="save a Chrome trace to a file")
+    args = parser.parse_args(argv)
+
+    if not args.headless:
+        parser.error("only --headless is supported, use the editor to play games")
+
+    # Errors in scripts are logged instead of raised
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+
+    profiler = run_headless(
+        args.project,
+        args.frames,
+        args.time_step,
+        tuple(args.render) if args.render else None,
+        args.backend or None,
+    )
+
+    print(f"{args.frames} frames of {args.project}")
+    print(profiler.report())
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    name: {
+                        "timings": profiler.timings(name).tolist(),
+                        **profiler.stats(name),
+                    }
+                    for name in profiler.names
+                },
+                f,
+            )
+    if args.trace:
+        profiler.save_chrome_trace(args.trace)
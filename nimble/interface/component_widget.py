@@ -19,9 +19,30 @@ from nimble.common.resources import load_ui
 from nimble.interface.warning_popup import WarningPopup
 from nimble.interface.editor import Editor
 from nimble.objects import Component, Slot, SlotType
+from nimble.objects.journal import SetSlot
 from nimble.common import current_project
 
 
+def record_slot(component: Component, slot: Slot, old_value, merge: bool = False):
+    """Record a change to a slot of a component of the selected object, so it
+    can be undone."""
+    if old_value == slot.get_value():
+        return
+    scene = current_project.scene
+    model = component.model
+    scene.journal.record(
+        SetSlot(
+            scene.active_idx,
+            model.name,
+            model.components.index(component),
+            component.slots().index(slot),
+            old_value,
+            slot.get_value(),
+        ),
+        merge,
+    )
+
+
 class NoScrollComboBox(QComboBox):
     """A combo box that doesn't take focus or change when the mouse wheel is used."""
 
@@ -62,6 +83,7 @@ class CreateScript(QDialog):
 class FileWidget(QWidget):
     def __init__(
         self,
+        component: Component,
         slot: Slot,
         parent: Optional[QWidget] = None,
     ):
@@ -70,6 +92,7 @@ class FileWidget(QWidget):
 
         load_ui(":/ui/file_widget_slot.ui", self)
 
+        self.component = component
         self.slot = slot
         self.options.setModel(current_project.scripts)
         self.options.currentIndexChanged.connect(self.on_index_changed)
@@ -82,7 +105,9 @@ class FileWidget(QWidget):
         self.options.setCurrentIndex(idx)
 
     def on_index_changed(self, index: int):
+        old_value = self.slot.get_value()
         self.slot.insert_in_slot(self.options.itemData(index, Qt.UserRole))
+        record_slot(self.component, self.slot, old_value)
         self.file_widget_button.setText(
             "Edit" if self.slot.get_value() is not None else "New"
         )
@@ -98,15 +123,20 @@ class FileWidget(QWidget):
             ok = dialog.exec()
             if ok == QDialog.Accepted:
                 script = current_project.create_script(dialog.script_name.text())
+                old_value = self.slot.get_value()
                 self.slot.insert_in_slot(script)
+                record_slot(self.component, self.slot, old_value)
                 idx = current_project.scripts.get_index(self.slot.get_value())
                 self.options.setCurrentIndex(idx)
 
 
 class FloatWidget(QWidget):
-    def __init__(self, slot: Slot, parent: Optional[QWidget] = None):
+    def __init__(
+        self, component: Component, slot: Slot, parent: Optional[QWidget] = None
+    ):
         super().__init__(parent)
         assert slot.ty == SlotType.FLOAT
+        self.component = component
         self.slot = slot
 
         self.frame = QVBoxLayout(self)
@@ -114,18 +144,23 @@ class FloatWidget(QWidget):
         self.number = QDoubleSpinBox(self)
         self.number.setValue(self.slot.get_value())
         self.number.valueChanged.connect(self.update)
+        # Typing a value is undone as one change
+        self.number.editingFinished.connect(current_project.scene.journal.seal)
         self.frame.addWidget(self.number)
         self.frame.addItem(
             QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Minimum)
         )
 
     def update(self) -> None:
+        old_value = self.slot.get_value()
         self.slot.insert_in_slot(self.number.value())
+        record_slot(self.component, self.slot, old_value, merge=True)
 
 
 class SlotWidget(QWidget):
     def __init__(
         self,
+        component: Component,
         slot: Slot,
         parent: Optional[QWidget] = None,
     ):
@@ -135,16 +170,19 @@ class SlotWidget(QWidget):
         self.label.setText(slot.display())
 
         if slot.ty == SlotType.FILE:
-            self.field.addWidget(FileWidget(slot, self))
+            self.field.addWidget(FileWidget(component, slot, self))
         elif slot.ty == SlotType.BOOLEAN:
-            self.field.addWidget(BooleanWidget(slot, self))
+            self.field.addWidget(BooleanWidget(component, slot, self))
         elif slot.ty == SlotType.FLOAT:
-            self.field.addWidget(FloatWidget(slot, self))
+            self.field.addWidget(FloatWidget(component, slot, self))
 
 
 class BooleanWidget(QWidget):
-    def __init__(self, slot: Slot, parent: Optional[QWidget] = None):
+    def __init__(
+        self, component: Component, slot: Slot, parent: Optional[QWidget] = None
+    ):
         super().__init__(parent)
+        self.component = component
         self.slot = slot
 
         self.frame = QVBoxLayout(self)
@@ -159,7 +197,9 @@ class BooleanWidget(QWidget):
 
     def on_state_change(self, state):
         checked = state == Qt.Checked
+        old_value = self.slot.get_value()
         self.slot.insert_in_slot(checked)
+        record_slot(self.component, self.slot, old_value)
 
 
 class ComponentWidget(QWidget):
@@ -176,5 +216,5 @@ class ComponentWidget(QWidget):
         self.component_name_title.setText(component.display_name)
         self.component_slots = cast(QVBoxLayout, self.component_slots)
         for slot in self.component.slots():
-            self.component_slots.addWidget(SlotWidget(slot, self))
+            self.component_slots.addWidget(SlotWidget(component, slot, self))
         self.show()
@@ -39,6 +39,9 @@ class EntityInspector(QWidget, SceneObserver, ModelObserver):
     ):
         super().__init__(parent)
         self.active = None
+        # Set while the view shows the active object, so that the changes to
+        # the widgets aren't written back to it
+        self.updating = False
 
         load_ui(":/ui/entity_inspector.ui", self)
 
@@ -70,9 +73,14 @@ class EntityInspector(QWidget, SceneObserver, ModelObserver):
                 spinner.valueChanged.connect(
                     lambda _, i=i, j=j: self.spinner_changed(i, j)
                 )
+                # Typing in a spinner is undone as one change
+                spinner.editingFinished.connect(current_project.scene.journal.seal)
 
         self.update_view()
         self.object_name_input.textChanged.connect(self.rename_object)
+        self.object_name_input.editingFinished.connect(
+            current_project.scene.journal.seal
+        )
 
         current_project.scene.register_observer(self)
         current_project.scene.register_active_obj_observer(self, "entity_inspector")
@@ -107,8 +115,11 @@ class EntityInspector(QWidget, SceneObserver, ModelObserver):
             QColorDialog.DontUseNativeDialog,
         )
         rgb = (color.getRgb())[:3]
-        self.active.material.set_color(tuple(f / 255 for f in rgb))
-        self.update_view()
+        old_color = self.active.material.color
+        self.active.set_color(tuple(f / 255 for f in rgb))
+        current_project.scene.journal.set_field(
+            current_project.scene.active_idx, self.active, "color", old_color
+        )
 
     def component_changed(self, idx: int):
         if self.components_types_list[idx] is None:
@@ -125,7 +136,11 @@ class EntityInspector(QWidget, SceneObserver, ModelObserver):
     def add_component_clicked(self):
         ComponentCons = self.components_types_list[self.component_type.currentIndex()]
         if ComponentCons is not None:
-            self.active.add_component(ComponentCons(self.active))
+            current_project.scene.journal.add_component(
+                current_project.scene.active_idx,
+                self.active,
+                ComponentCons(self.active),
+            )
 
     def select_changed(self, idx: int, obj: Optional[Model]) -> None:
         if obj is not self.active:
@@ -147,10 +162,22 @@ class EntityInspector(QWidget, SceneObserver, ModelObserver):
     def component_added(self, obj: Model, component_id: int) -> None:
         self.add_component_to_list(-1, obj.components[component_id])
 
+    def slots_changed(self, obj: Model, component_id: int) -> None:
+        # Show the new values
+        self.remove_component(component_id)
+        self.add_component_to_list(component_id, obj.components[component_id])
+
     def minimumSizeHint(self) -> QSize:
         return QSize(10, 100)
 
     def update_view(self):
+        self.updating = True
+        try:
+            self.show_active()
+        finally:
+            self.updating = False
+
+    def show_active(self):
         if self.active is not None:
             self.object_name_title.setText(f"Object ({self.active.name})")
             self.entity_info.show()
@@ -174,13 +201,23 @@ class EntityInspector(QWidget, SceneObserver, ModelObserver):
             self.update_view()
 
     def rename_object(self, new_name: str):
-        if self.active is not None:
-            current_project.scene.rename_obj(self.active_idx, new_name)
-            self.object_name_input.setText(new_name)
+        if self.active is not None and not self.updating:
+            current_project.scene.journal.rename_obj(
+                current_project.scene.active_idx, new_name
+            )
 
     def translation_changed(self, obj: Model) -> None:
         self.update_view()
 
+    def rotation_changed(self, obj: Model) -> None:
+        self.update_view()
+
+    def scale_changed(self, obj: Model) -> None:
+        self.update_view()
+
+    def color_changed(self, obj: Model) -> None:
+        self.update_view()
+
     @staticmethod
     def get_idx(idx: int, obj: Model) -> Vector3:
         if idx == 0:
@@ -191,14 +228,21 @@ class EntityInspector(QWidget, SceneObserver, ModelObserver):
             return obj.scale
 
     def spinner_changed(self, row_idx: int, vector_idx: int):
-        if self.active is not None:
+        if self.active is not None and not self.updating:
             new_value = self.spinners[row_idx][vector_idx].value()
-            self.get_idx(row_idx, self.active)[vector_idx] = (
-                new_value if row_idx != 1 else math.radians(new_value)
-            )
+            vector = self.get_idx(row_idx, self.active)
+            old_value = tuple(vector)
+            vector[vector_idx] = new_value if row_idx != 1 else math.radians(new_value)
             if row_idx == 0:
                 self.active.position_changed()
             elif row_idx == 1:
                 self.active.rotation_changed()
             elif row_idx == 2:
                 self.active.scale_changed()
+            current_project.scene.journal.set_field(
+                current_project.scene.active_idx,
+                self.active,
+                ("position", "rotation", "scale")[row_idx],
+                old_value,
+                merge=True,
+            )
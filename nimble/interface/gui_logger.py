@@ -18,14 +18,13 @@ def with_gui_logging_default(default=None):
         @functools.wraps(fn)
         def wrapper(*args, **kwargs):
             log = logging.getLogger("nimble")
-            new_stderr = StreamToLogger(log, logging.ERROR)
             stdout = sys.stdout
             sys.stdout = StreamToLogger(log, logging.INFO)
             res = default
             try:
                 res = fn(*args, **kwargs)
             except Exception as e:
-                traceback.print_exception(type(e), e, e.__traceback__, file=new_stderr)
+                log_exception(e)
             sys.stdout = stdout
 
             return res
@@ -38,6 +37,14 @@ def with_gui_logging_default(default=None):
 with_gui_logging = with_gui_logging_default()
 
 
+def log_exception(e: Exception, message: Optional[str] = None):
+    """Log the traceback of an exception to the GUI log."""
+    stderr = StreamToLogger(logging.getLogger("nimble"), logging.ERROR)
+    if message is not None:
+        stderr.write(message)
+    traceback.print_exception(type(e), e, e.__traceback__, file=stderr)
+
+
 class StreamToLogger(TextIOBase):
     """A custom stream to redirect stdout and stderr to a logger."""
 
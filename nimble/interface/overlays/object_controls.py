@@ -3,6 +3,7 @@ from typing import Optional, Set, Tuple, Union
 from pyrr import Vector3
 
 from nimble.objects import (
+    CommandJournal,
     Material,
     Model,
     ModelObserver,
@@ -85,7 +86,7 @@ class Axis:
 
 
 class TransformTools(SceneObserver, ModelObserver):
-    def __init__(self, scale, camera: OrbitCamera):
+    def __init__(self, scale, camera: OrbitCamera, journal: CommandJournal):
         self.x = Arrow(Vector3((1, 0, 0)), Vector3((0, 0, pi / 2), dtype="f4"), scale)
         self.y = Arrow(Vector3((0, 1, 0)), Vector3((0, 0, 0), dtype="f4"), scale)
         self.z = Arrow(Vector3((0, 0, 1)), Vector3((-pi / 2, 0, 0), dtype="f4"), scale)
@@ -95,6 +96,8 @@ class TransformTools(SceneObserver, ModelObserver):
         self.translating = False
         self.plane = None
         self.camera = camera
+        # Drags are recorded to be undone, as one change each
+        self.journal = journal
 
     def select_changed(self, idx: int, obj: Model) -> None:
         self.set_active(obj)
@@ -117,9 +120,13 @@ class TransformTools(SceneObserver, ModelObserver):
         self.translating = True
 
     def start_drag(self, axis: Union[Axis, Set[Axis]]):
+        # A drag is a change of its own, even right after another change to
+        # the position (e.g. with the inspector)
+        self.journal.seal()
         self.dragged = set(axis) if isinstance(axis, set) else {axis}
 
     def stop_drag(self):
+        self.journal.seal()
         self.dragged = None
         self.translating = False
         self.length = None
@@ -200,4 +207,12 @@ class TransformTools(SceneObserver, ModelObserver):
             self.x.translate(translate_vec)
             self.y.translate(translate_vec)
             self.z.translate(translate_vec)
+            old_position = tuple(self.active.position)
             self.active.translate(translate_vec)
+            self.journal.set_field(
+                self.journal.scene.active_idx,
+                self.active,
+                "position",
+                old_position,
+                merge=True,
+            )
@@ -0,0 +1,147 @@
+"""A panel that graphs the timings of the running game."""
+
+from typing import Optional, Sequence
+
+from PyQt5.QtCore import QPointF, QTimer, Qt
+from PyQt5.QtGui import QColor, QPainter, QPen, QPolygonF
+from PyQt5.QtWidgets import (
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from nimble.common.profiler import FrameProfiler
+
+
+class FrameGraph(QWidget):
+    """A line graph of the durations of a few sections of the last frames."""
+
+    # The sections to draw, and their colors
+    sections = (
+        ("frame", QColor(230, 230, 230)),
+        ("update", QColor(90, 170, 250)),
+        ("render", QColor(250, 170, 70)),
+    )
+    # The durations of a frame at 60 and 30 fps, in milliseconds
+    guides = (1000 / 60, 1000 / 30)
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setMinimumHeight(120)
+
+    def paintEvent(self, event):
+        profiler = FrameProfiler()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), QColor(40, 40, 40))
+
+        width, height = self.width(), self.height()
+        # Scale the graph to the slowest frames (ignoring outliers), but always
+        # show the 60 fps line
+        top = max(profiler.stats("frame")["p99"], self.guides[0]) * 1.2
+
+        def y(duration: float) -> float:
+            return height - min(duration / top, 1) * height
+
+        painter.setPen(QPen(QColor(110, 110, 110), 1, Qt.DashLine))
+        for guide in self.guides:
+            if guide < top:
+                painter.drawLine(0, int(y(guide)), width, int(y(guide)))
+                painter.drawText(4, int(y(guide)) - 2, f"{1000 / guide:.0f} fps")
+
+        for i, (name, color) in enumerate(self.sections):
+            painter.setPen(QPen(color, 1))
+            painter.drawText(width - 70, 16 * (i + 1), name)
+
+            timings = profiler.timings(name)
+            if len(timings) >= 2:
+                painter.drawPolyline(self.line(timings, width, y, profiler.history))
+
+        painter.end()
+
+    @staticmethod
+    def line(timings: Sequence[float], width: int, y, history: int) -> QPolygonF:
+        # The newest frame is on the right edge
+        step = width / max(history - 1, 1)
+        start = width - (len(timings) - 1) * step
+        return QPolygonF(
+            [
+                QPointF(start + i * step, y(duration))
+                for i, duration in enumerate(timings)
+            ]
+        )
+
+
+class ProfilerPanel(QWidget):
+    """Shows the timings recorded by the `FrameProfiler` while a game runs:
+    a graph of the last frames, and statistics for every section."""
+
+    columns = ("mean", "p50", "p95", "p99", "max")
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+
+        self.graph = FrameGraph(self)
+
+        self.table = QTableWidget(0, len(self.columns) + 1, self)
+        self.table.setHorizontalHeaderLabels(("Section",) + self.columns)
+        self.table.verticalHeader().setVisible(False)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+
+        self.clear = QPushButton("Clear", self)
+        self.clear.pressed.connect(self.clear_timings)
+        self.export = QPushButton("Export Chrome Trace...", self)
+        self.export.pressed.connect(self.export_trace)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        buttons.addWidget(self.clear)
+        buttons.addWidget(self.export)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.graph, stretch=1)
+        layout.addWidget(self.table, stretch=1)
+        layout.addLayout(buttons)
+
+        # Only redraw a few times a second, so the panel doesn't slow the
+        # game down much
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(250)
+
+    def refresh(self):
+        profiler = FrameProfiler()
+        if not profiler.enabled or not self.isVisible():
+            return
+
+        names = profiler.names
+        self.table.setRowCount(len(names))
+        for row, name in enumerate(names):
+            stats = profiler.stats(name)
+            self.table.setItem(row, 0, QTableWidgetItem(name))
+            for column, key in enumerate(self.columns, 1):
+                item = QTableWidgetItem(f"{stats[key]:.3f} ms")
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+        self.graph.update()
+
+    def clear_timings(self):
+        FrameProfiler().reset()
+        self.table.setRowCount(0)
+        self.graph.update()
+
+    def export_trace(self):
+        filename, _ = QFileDialog.getSaveFileName(
+            self, "Export Chrome Trace", "trace.json", "Chrome Trace (*.json)"
+        )
+        if filename:
+            FrameProfiler().save_chrome_trace(filename)
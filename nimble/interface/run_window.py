@@ -5,78 +5,45 @@ from PyQt5.QtWidgets import QWidget, QPushButton, QMainWindow
 from PyQtAds.QtAds import ads
 from PyQt5 import QtGui
 
-from nimble.common import current_project, Key, PressedKeys, is_key
-from nimble.common.overlay.overlay import OverlayProcessor
-from nimble.common.shader_manager import Shaders
-from nimble.common.world import World
+from nimble.common import current_project, Key, is_key, ProjectObserver
+from nimble.common.game import Game
+from nimble.common.profiler import FrameProfiler
 from nimble.common.resources import load_ui
-from nimble.common.serialize import serialize_scene, unserialize_scene
 from nimble.interface.viewport import ViewportWidget, Viewport
-from nimble.objects import PhysicsProcessor, ScriptProcessor, Scene, Geometry
-from nimble.objects.component import CameraComponent
+from nimble.objects import Scene, Geometry
+from nimble.objects.snapshot import SceneSnapshot
 
 
-class GameViewport(Viewport):
+class GameViewport(Viewport, ProjectObserver):
     """A subclass of the viewport for the actual game, without a
-    grid or active object indicator."""
+    grid or active object indicator.
+
+    Scripts that change while the game runs are swapped into it."""
 
     def __init__(self, *args):
         super().__init__(*args)
-        self.world = World()
-        camera = self.world.create_entity()
-        self.world.add_component(camera, CameraComponent(self.camera))
-
-        self.keys = PressedKeys()
-        custom_components = []
-        for model in self.scene.objects.values():
-            entity_id = self.world.create_entity()
-            model.entity_id = entity_id
-            for component in model.components:
-                self.world.add_component(
-                    entity_id, component, type_alias=component.type_alias
-                )
-                if (
-                    component.type_alias is not None
-                    and component.type_alias.startswith("custom_")
-                ):
-                    custom_components.append(component)
-
-        custom_script_processor = ScriptProcessor(custom_components)
-        self.world.add_processor(custom_script_processor, priority=1)
-        custom_script_processor.add_keys_attr(self.keys)
-
-        physics_processor = PhysicsProcessor()
-        self.world.add_processor(physics_processor)
-
-        self.overlay_buffer = None
-        self.overlay_processor = OverlayProcessor(self.overlay_buffer)
-        self.world.add_processor(self.overlay_processor)
+        self.game = Game(self.scene, self.camera)
+        self.world = self.game.world
+        self.keys = self.game.keys
+        current_project.add_observer("game", self)
+
+    def script_changed(self, script: str):
+        self.game.reload_script(script)
+
+    def close(self):
+        """Stop reloading scripts, and shut down the game's physics
+        simulation."""
+        current_project.remove_observer("game")
+        self.game.close()
 
     def regen_active_buffer(self):
         super().regen_active_buffer()
-        if self.overlay_buffer:
-            self.overlay_buffer.release()
-            self.overlay_buffer = None
-
-        self.overlay_buffer = self.ctx.texture(self.screen_size.as_tuple, 4)
-        self.overlay_processor.texture_resized(self.overlay_buffer)
+        self.game.resize(self.ctx, self.screen_size.as_tuple)
 
     def render(self, screen: mgl.Framebuffer):
-        self.ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE_MINUS_SRC_ALPHA
-        self.world.process()
+        self.game.process()
         mglw.activate_context(ctx=self.ctx)
-        self.ctx.enable(mgl.BLEND | mgl.DEPTH_TEST)
-        self.ctx.clear(0.235, 0.235, 0.235)
-        screen.use()
-
-        self.scene.render(self.camera, self.active_buffer, screen)
-        self.overlay_buffer.use(location=0)
-        self.overlay_buffer.repeat_x = False
-        self.overlay_buffer.repeat_y = False
-        texture_shader = Shaders()["texture"]
-
-        self.ctx.enable(mgl.BLEND)
-        self.overlay_vao.render(texture_shader)
+        self.game.render(self.ctx, screen, self.active_buffer, self.overlay_vao)
 
     def key_released(self, event: QtGui.QKeyEvent):
         key = event.key()
@@ -119,6 +86,10 @@ class GameWindow(QMainWindow):
         self.resize(1280, 720)
 
     def closeEvent(self, event):
+        # Stop rendering (and stepping) the game before its physics server
+        # goes away
+        self.scene.timer_update.stop()
+        self.scene.manager.close()
         self.on_close()
 
 
@@ -139,13 +110,22 @@ class RunWindow(QWidget):
     def start_game(self):
         self.run.setEnabled(False)
 
-        # Create a new copy of the scene by serializing it then unserializing it
-        self.temp_scene = unserialize_scene(serialize_scene(current_project.scene))
+        # Play in a copy of the scene, so the game never changes the editor's
+        # scene. The copy shares its geometries and shaders with it.
+        self.temp_scene = SceneSnapshot(current_project.scene).instantiate()
+
+        # Profile the game, for the profiler panel
+        FrameProfiler().reset()
+        FrameProfiler().enabled = True
 
         self.window = GameWindow(self.temp_scene, self.stop_game)
         self.window.show()
 
     def stop_game(self):
+        # Keep the timings around, so they can still be looked at or exported
+        FrameProfiler().enabled = False
         self.window = None
+        if self.temp_scene is not None:
+            self.temp_scene.release()
         self.temp_scene = None
         self.run.setEnabled(True)
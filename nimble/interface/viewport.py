@@ -15,11 +15,15 @@ from nimble.common.event_listener import InputObserver, WindowObserver
 from nimble.common.models.size import ViewportSize
 from nimble.interface.orbit_camera import OrbitCamera
 from nimble.objects import (
+    Capsule,
+    Cone,
     Cube,
     Cylinder,
     Geometry,
+    GeometryCache,
     Plane,
     Sphere,
+    Torus,
     Material,
     Model,
     Scene,
@@ -27,7 +31,15 @@ from nimble.objects import (
 from nimble.interface.overlays.grid import Grid
 from nimble.interface.overlays.object_controls import Axis, TransformTools
 
-new_obj_menu = {"Cube": Cube, "Sphere": Sphere, "Cylinder": Cylinder, "Plane": Plane}
+new_obj_menu = {
+    "Cube": Cube,
+    "Sphere": Sphere,
+    "Cylinder": Cylinder,
+    "Cone": Cone,
+    "Capsule": Capsule,
+    "Torus": Torus,
+    "Plane": Plane,
+}
 
 
 class Viewport(InputObserver, WindowObserver):
@@ -63,7 +75,9 @@ class Viewport(InputObserver, WindowObserver):
 
         # Create the transform tools (the arrows)
         self.zoom_to_axis_ratio = axis_rel_scale / self.camera.spherical.radius
-        self.active_tools = TransformTools(axis_rel_scale, self.camera)
+        self.active_tools = TransformTools(
+            axis_rel_scale, self.camera, self.scene.journal
+        )
 
         self.scene.register_active_obj_observer(self.active_tools, "active_obj_tools")
         self.scene.register_observer(self.active_tools)
@@ -151,7 +165,7 @@ class Viewport(InputObserver, WindowObserver):
             # S for scale
             pass
         elif key == Qt.Key_Delete:
-            self.scene.delete_obj(self.scene.active_idx)
+            self.scene.journal.delete_obj(self.scene.active_idx)
 
     def mouse_pressed(self, event: QtGui.QMouseEvent):
         x, y, button = event.x(), event.y(), event.button()
@@ -255,10 +269,12 @@ class Viewport(InputObserver, WindowObserver):
         delete.triggered.connect(self.delete_current)
 
     def add_obj(self, name: str, cons: Type[Geometry]):
-        self.scene.add_obj(Model(Material("viewport"), geometry=cons(), name=name))
+        self.scene.journal.add_obj(
+            Model(Material("viewport"), geometry=GeometryCache().get(cons), name=name)
+        )
 
     def delete_current(self):
-        self.scene.delete_obj(self.open_context)
+        self.scene.journal.delete_obj(self.open_context)
 
     def show_context(self, x: int, y: int, parent: QtWidgets.QWidget):
         menu = QMenu("Context Menu", parent)
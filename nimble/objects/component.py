@@ -1,19 +1,39 @@
 from __future__ import annotations
-import pybullet as p
 from abc import ABC
 from enum import Enum
 import itertools
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, TypeVar, cast
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
+import numpy as np
 
 import nimble
 from nimble.common.ecs import Processor
 from nimble.common.keys import PressedKeys
+from nimble.common.models.quaternion import euler_from_quaternion, lerp, slerp
+from nimble.common.profiler import FrameProfiler
+from nimble.common.script_cache import ScriptCache
 from nimble.interface.gui_logger import (
+    log_exception,
     with_gui_logging,
     with_gui_logging_default,
 )
+from nimble.objects.geometry import CollisionShapeCache
 from nimble.objects.model import LikeVector3, Model
+from nimble.objects.physics_context import PhysicsContext
+from nimble.objects.transform_store import TransformStore
 
 if TYPE_CHECKING:
     from nimble.interface.orbit_camera import OrbitCamera
@@ -70,6 +90,10 @@ class Component:
     def type_alias(self) -> Optional[str]:
         return None
 
+    def active_changed(self, active: bool):
+        """Called when the model of this component is enabled or disabled."""
+        pass
+
 
 class PhysicsComponent(Component):
     """A rigid-body physics component"""
@@ -83,6 +107,8 @@ class PhysicsComponent(Component):
         super().__init__()
         self._id = _id
         self.model = model
+        # Set once the component is seen by a simulation
+        self.processor: Optional[PhysicsProcessor] = None
         self.mass = Slot(
             1 if slot_params is None else slot_params[0], "Mass", SlotType.FLOAT
         )
@@ -105,18 +131,45 @@ class PhysicsComponent(Component):
         return [self.mass, self.friction, self.static]
 
     def apply_force(self, force: LikeVector3):
-        """Apply an external force to this physics body."""
-        p.applyExternalForce(
-            self._id,
-            -1,
-            list(force),
-            p.getBasePositionAndOrientation(self._id)[0],
-            p.WORLD_FRAME,
-        )
+        """Apply an external force to this physics body, for the duration of the
+        current frame."""
+        if self.processor is not None:
+            self.processor.apply_force(self, force)
+
+    def active_changed(self, active: bool):
+        if self.processor is not None:
+            # Add or remove the body on the next step
+            self.processor.bodies_changed = True
 
     def collides_with(self, other: PhysicsComponent) -> bool:
         """Check if this physics body collides with `other`."""
-        return len(p.getContactPoints(self._id, other._id)) > 0
+        if self.processor is None:
+            return False
+        return other._id in self.processor.contacts.get(self._id, ())
+
+    @property
+    def contacts(self) -> List[PhysicsComponent]:
+        """The bodies touching this body."""
+        return self._bodies_in(self.processor.contacts if self.processor else {})
+
+    @property
+    def collisions_began(self) -> List[PhysicsComponent]:
+        """The bodies that started touching this body in the last step."""
+        return self._bodies_in(self.processor.began if self.processor else {})
+
+    @property
+    def collisions_stayed(self) -> List[PhysicsComponent]:
+        """The bodies that were already touching this body, and still are."""
+        began = self.collisions_began
+        return [other for other in self.contacts if other not in began]
+
+    @property
+    def collisions_ended(self) -> List[PhysicsComponent]:
+        """The bodies that stopped touching this body in the last step."""
+        return self._bodies_in(self.processor.ended if self.processor else {})
+
+    def _bodies_in(self, table: Dict[int, Set[int]]) -> List[PhysicsComponent]:
+        return [self.processor.bodies[body] for body in table.get(self._id, ())]
 
     @property
     def body_id(self) -> Optional[int]:
@@ -128,41 +181,82 @@ class PhysicsComponent(Component):
 
 
 class PhysicsProcessor(Processor):
-    """The processor for physics."""
+    """The processor for physics.
 
-    def __init__(self):
+    The simulation runs with a fixed time step, independent of the frame rate.
+    Every frame, the elapsed time is added to an accumulator, and the
+    simulation is stepped as many times as fits into it (but at most
+    `max_substeps` times, so that a slow frame can't cause even slower
+    frames). Models are then placed between the last two simulated states,
+    depending on how much time is left in the accumulator.
+
+    The elapsed time comes from `clock`. To drive the simulation manually (e.g.
+    when running headless), call `step` instead of `process`.
+
+    The contacts of all bodies are read once after every step, into tables
+    that map a body id to the ids of the bodies it touches. Collisions that
+    began or ended are found by comparing the contacts of the frames where
+    the simulation stepped.
+
+    Every processor simulates in its own physics server (a `PhysicsContext`),
+    which is shut down by `close`.
+    """
+
+    def __init__(
+        self,
+        time_step: float = 1.0 / 120.0,
+        max_substeps: int = 8,
+        clock: Callable[[], float] = time.perf_counter,
+        physics: Optional[PhysicsContext] = None,
+    ):
         super().__init__()
 
-        self.client = p.connect(p.DIRECT)
+        self.time_step = time_step
+        self.max_substeps = max_substeps
+        self.clock = clock
+        self.last_time: Optional[float] = None
+        self.accumulator = 0.0
+
+        # Every processor simulates in its own physics server
+        self.physics = PhysicsContext() if physics is None else physics
+        p = self.physics
 
         # Reset the simulation
         p.resetSimulation()
         # Set physics parameters
         p.setPhysicsEngineParameter(
-            fixedTimeStep=1.0 / 120.0,
+            fixedTimeStep=time_step,
             numSolverIterations=100,
         )
         p.setGravity(0, -9.81, 0)
 
+        # Bodies with the same geometry and scale share their collision shape
+        self.collision_shapes = CollisionShapeCache(p)
+
     def add_rigid_body(self, component: PhysicsComponent, eid: int):
         """Add a rigid body to the physics simulation."""
-        collider = component.model.geometry.create_collision_shape(
-            component.model.scale, p
+        p = self.physics
+        collider = self.collision_shapes.get(
+            component.model.geometry, component.model.scale
+        )
+        position = tuple(component.model.position.tolist())
+        # Encode euler angles as quaternion
+        orientation = p.getQuaternionFromEuler(
+            tuple(-r for r in component.model.rotation.tolist())
         )
         body_id = p.createMultiBody(
             0
             if component.static.get_value()
             else component.mass.get_value(),  # Note: mass = 0 means static
             collider,
-            basePosition=tuple(component.model.position.tolist()),
-            # Encode euler angles as quaternion
-            baseOrientation=p.getQuaternionFromEuler(
-                tuple(-r for r in component.model.rotation.tolist())
-            ),
+            basePosition=position,
+            baseOrientation=orientation,
         )
 
         # Remember that we added this entity
-        self.added_entities[eid] = (body_id, component.model)
+        self.added_entities[eid] = component
+        self.bodies[body_id] = component
+        self.body_shapes[body_id] = collider
 
         friction = component.friction.get_value()
         p.changeDynamics(
@@ -170,42 +264,244 @@ class PhysicsProcessor(Processor):
         )
         component.body_id = body_id
 
+        if not component.static.get_value():
+            # The body starts at rest, so both states are the same
+            self.dynamic_bodies.append(eid)
+            self.dynamic_body_ids.append(body_id)
+            self.dynamic_models.append(component.model)
+            self.dynamic_slots = np.append(
+                self.dynamic_slots, component.model.transform_slot
+            )
+            state = (np.array([position]), np.array([orientation]))
+            self.previous_state = self._append_state(self.previous_state, state)
+            self.current_state = self._append_state(self.current_state, state)
+
+    def remove_rigid_body(self, eid: int):
+        """Remove a rigid body from the physics simulation."""
+        component = self.added_entities.pop(eid)
+        body_id = component.body_id
+        self.physics.removeBody(body_id)
+        del self.bodies[body_id]
+        self.collision_shapes.release(self.body_shapes.pop(body_id))
+        self.forces.pop(body_id, None)
+        self.impulses.pop(body_id, None)
+        component.body_id = None
+
+        # pybullet reuses body ids, so forget the contacts of the removed body
+        # right away
+        if body_id in self.contacts:
+            self.set_contacts(
+                {pair for pair in self.contact_pairs if body_id not in pair}
+            )
+
+        if eid in self.dynamic_bodies:
+            i = self.dynamic_bodies.index(eid)
+            del self.dynamic_bodies[i]
+            del self.dynamic_body_ids[i]
+            del self.dynamic_models[i]
+            self.dynamic_slots = np.delete(self.dynamic_slots, i)
+            self.previous_state = tuple(np.delete(a, i, 0) for a in self.previous_state)
+            self.current_state = tuple(np.delete(a, i, 0) for a in self.current_state)
+
+    @staticmethod
+    def _append_state(state, new_state):
+        return tuple(np.concatenate((a, b)) for a, b in zip(state, new_state))
+
     def init(self):
-        self.added_entities: Dict[int, int] = {}
+        self.added_entities: Dict[int, PhysicsComponent] = {}
+        self.bodies: Dict[int, PhysicsComponent] = {}
+        # The (shared) collision shape of every body, by body id
+        self.body_shapes: Dict[int, Optional[int]] = {}
         self.world: World = self.world
 
-        # Loop through each physics component and add it to the physics simulation
-        for (eid, component) in self.world.get_component(PhysicsComponent):
-            if eid not in self.added_entities:
-                self.add_rigid_body(component, eid)
+        # Pairs of touching body ids (smallest id first), and tables of the
+        # bodies each body touches, started touching, and stopped touching
+        self.contact_pairs: Set[Tuple[int, int]] = set()
+        self.contacts: Dict[int, Set[int]] = {}
+        self.began: Dict[int, Set[int]] = {}
+        self.ended: Dict[int, Set[int]] = {}
+
+        # The entities of non-static bodies, their body ids, models, transform
+        # slots, and their (positions, orientations) after the last two
+        # simulation steps, all in the same order. Static bodies never move,
+        # so they are never read back.
+        self.dynamic_bodies: List[int] = []
+        self.dynamic_body_ids: List[int] = []
+        self.dynamic_models: List[Model] = []
+        self.dynamic_slots = np.zeros(0, dtype=np.intp)
+        self.previous_state = (np.zeros((0, 3)), np.zeros((0, 4)))
+        self.current_state = (np.zeros((0, 3)), np.zeros((0, 4)))
+
+        # Forces applied during the current frame, and the impulses from the
+        # frames that haven't been simulated yet, by body id
+        self.forces: Dict[int, np.ndarray] = {}
+        self.impulses: Dict[int, np.ndarray] = {}
+
+        # Set when a model is enabled or disabled. Physics components added to
+        # or removed from the world are noticed by the number of components.
+        self.bodies_changed = False
+        self.component_count = 0
+
+        # Add each physics component to the physics simulation
+        self.sync_bodies()
+
+    def sync_bodies(self):
+        """Add bodies of new (or enabled) models to the simulation, and remove
+        the bodies of deleted or disabled models."""
+        components = self.world.get_component(PhysicsComponent)
+        self.bodies_changed = False
+        self.component_count = len(components)
+
+        seen = set()
+        for (eid, component) in components:
+            seen.add(eid)
+            component.processor = self
 
-    def process(self):
-        for (eid, component) in self.world.get_component(PhysicsComponent):
             if not component.model.active:
                 # If the model is disabled (inactive), remove it from the physics simulation
                 if eid in self.added_entities:
-                    p.removeBody(component.body_id)
-                    del self.added_entities[eid]
+                    self.remove_rigid_body(eid)
                 continue
 
             if eid not in self.added_entities:
                 # Add new bodies to the physics simulation
                 self.add_rigid_body(component, eid)
 
+        for eid in self.added_entities.keys() - seen:
+            self.remove_rigid_body(eid)
+
+    def apply_force(self, component: PhysicsComponent, force: LikeVector3):
+        """Apply a force to a body, until the end of the current frame."""
+        if component.body_id is None:
+            return
+
+        force = np.array(force, dtype=float)
+        total = self.forces.get(component.body_id)
+        self.forces[component.body_id] = force if total is None else total + force
+
+    def read_state(self):
+        """Get the positions and orientations of all non-static bodies."""
+        count = len(self.dynamic_body_ids)
+        get_state = self.physics.getBasePositionAndOrientation
+        states = np.fromiter(
+            itertools.chain.from_iterable(
+                position + orientation
+                for position, orientation in map(get_state, self.dynamic_body_ids)
+            ),
+            dtype=float,
+            count=count * 7,
+        ).reshape(count, 7)
+        return (states[:, :3], states[:, 3:])
+
+    def process(self):
+        now = self.clock()
+        frame_time = 0.0 if self.last_time is None else now - self.last_time
+        self.last_time = now
+        self.step(frame_time)
+
+    def step(self, frame_time: float) -> int:
+        """Advance the simulation by `frame_time` seconds, and return the
+        number of simulation steps that were taken."""
+        if (
+            self.bodies_changed
+            or len(self.world.get_component(PhysicsComponent)) != self.component_count
+        ):
+            self.sync_bodies()
+
+        # Forces are applied over the whole frame
+        for body_id, force in self.forces.items():
+            self.impulses[body_id] = self.impulses.get(body_id, 0) + force * frame_time
+        self.forces.clear()
+
+        self.accumulator += frame_time
+        # (with a little tolerance for rounding errors)
+        substeps = int(self.accumulator / self.time_step + 1e-6)
+        if substeps > self.max_substeps:
+            # Too far behind to catch up, so drop the extra time (the game
+            # slows down instead of freezing)
+            substeps = self.max_substeps
+            self.accumulator = substeps * self.time_step
+        self.accumulator = max(self.accumulator - substeps * self.time_step, 0.0)
+
         # Run the simulation
-        p.stepSimulation()
+        p = self.physics
+        contact_pairs = set()
+        for i in range(substeps):
+            if i == substeps - 1:
+                self.previous_state = self.read_state()
+
+            for body_id, impulse in self.impulses.items():
+                p.applyExternalForce(
+                    body_id,
+                    -1,
+                    list(impulse / (substeps * self.time_step)),
+                    p.getBasePositionAndOrientation(body_id)[0],
+                    p.WORLD_FRAME,
+                )
+            p.stepSimulation()
+            # Keep contacts that only lasted for some of the steps
+            contact_pairs |= self.read_contacts()
+
+        if substeps > 0:
+            self.current_state = self.read_state()
+            self.impulses.clear()
+            self.set_contacts(contact_pairs)
+        else:
+            # Nothing moved, so nothing began or ended
+            self.began = {}
+            self.ended = {}
+
+        self.interpolate(self.accumulator / self.time_step)
+
+        return substeps
 
-        for (eid, component) in self.world.get_component(PhysicsComponent):
-            if not component.static.get_value():
-                # Update the model position and rotation from the physics simulation
-                pos, rot = p.getBasePositionAndOrientation(component.body_id)
-                component.model.set_position(pos)
-                x, y, z = p.getEulerFromQuaternion(rot)
-                component.model.set_rotation((-x, -y, -z))
+    def close(self):
+        """Shut down the physics server of the processor."""
+        self.physics.disconnect()
 
-        # Perform collision detection before next step to allow for custom scripts to
-        # react to collisions
-        p.performCollisionDetection()
+    def read_contacts(self) -> Set[Tuple[int, int]]:
+        """Get every pair of bodies in contact after the last step."""
+        return {
+            (a, b) if a < b else (b, a)
+            for (_, a, b, *_) in self.physics.getContactPoints()
+        }
+
+    @staticmethod
+    def _contact_table(pairs: Set[Tuple[int, int]]) -> Dict[int, Set[int]]:
+        table: Dict[int, Set[int]] = {}
+        for a, b in pairs:
+            table.setdefault(a, set()).add(b)
+            table.setdefault(b, set()).add(a)
+        return table
+
+    def set_contacts(self, pairs: Set[Tuple[int, int]]):
+        """Replace the contacts, and find the collisions that began and ended."""
+        self.began = self._contact_table(pairs - self.contact_pairs)
+        self.ended = self._contact_table(self.contact_pairs - pairs)
+        self.contact_pairs = pairs
+        self.contacts = self._contact_table(pairs)
+
+    def interpolate(self, alpha: float):
+        """Place the models of non-static bodies between the last two states
+        of the simulation (0 is the previous state, 1 is the current one)."""
+        if len(self.dynamic_slots) == 0:
+            return
+
+        positions = lerp(self.previous_state[0], self.current_state[0], alpha)
+        orientations = slerp(self.previous_state[1], self.current_state[1], alpha)
+
+        # Update the model positions and rotations from the physics simulation,
+        # straight in the transform store
+        store = TransformStore()
+        store.positions[self.dynamic_slots] = positions
+        store.rotations[self.dynamic_slots] = -euler_from_quaternion(orientations)
+        store.mark_dirty(self.dynamic_slots)
+
+        for model in self.dynamic_models:
+            # Only the selected model has observers
+            if model.observers:
+                model.position_changed()
+                model.rotation_changed()
 
 
 def CustomComponentQuery(id) -> str:
@@ -247,8 +543,89 @@ class CustomComponent(Component):
         return f"custom_{self.script_slot.get_value()}"
 
 
+class ModelBatch:
+    """Every model a script is attached to, passed to the script's
+    `process_batch` method.
+
+    `positions`, `rotations` and `scales` are (N, 3) arrays with the
+    transforms of the models, in the same order as `models`. They are read
+    from the transform store in one go, so they are copies: assign to them
+    (or use `translate`/`rotate`) to update every model at once.
+    """
+
+    def __init__(self, models: List[Model]):
+        self.models = models
+        self.slots = np.fromiter(
+            (model.transform_slot for model in models), dtype=np.intp, count=len(models)
+        )
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def __iter__(self):
+        return iter(self.models)
+
+    @property
+    def positions(self) -> np.ndarray:
+        return TransformStore().positions[self.slots]
+
+    @positions.setter
+    def positions(self, value: np.ndarray):
+        TransformStore().positions[self.slots] = value
+        self.transforms_changed()
+
+    @property
+    def rotations(self) -> np.ndarray:
+        return TransformStore().rotations[self.slots]
+
+    @rotations.setter
+    def rotations(self, value: np.ndarray):
+        TransformStore().rotations[self.slots] = value
+        self.transforms_changed()
+
+    @property
+    def scales(self) -> np.ndarray:
+        return TransformStore().scales[self.slots]
+
+    @scales.setter
+    def scales(self, value: np.ndarray):
+        TransformStore().scales[self.slots] = value
+        self.transforms_changed()
+
+    def translate(self, translation: np.ndarray):
+        """Move every model, by one (3,) vector or by one vector per model."""
+        self.positions = self.positions + translation
+
+    def rotate(self, rotation: np.ndarray):
+        """Rotate every model, by one (3,) vector of euler angles or by one
+        vector per model."""
+        self.rotations = self.rotations + rotation
+
+    def transforms_changed(self):
+        TransformStore().mark_dirty(self.slots)
+        for model in self.models:
+            # Only the selected model has observers
+            if model.observers:
+                model.position_changed()
+                model.rotation_changed()
+                model.scale_changed()
+
+
 class ScriptProcessor(Processor):
-    """The processor for custom scripts."""
+    """The processor for custom scripts.
+
+    A script's `Component` either defines `process(obj)`, which is called
+    once for every model the script is attached to, or `process_batch(models)`,
+    which is called once per frame with a `ModelBatch` of all of them.
+
+    Errors are logged (once per script and kind of error) instead of raised,
+    so a failing script or model doesn't stop the others from running.
+
+    Scripts can be reloaded while the game runs (see `reload`). The new
+    `Component` gets `init` called as usual, unless it defines
+    `migrate(old)`, which gets the old `Component` instead, to carry its
+    state over.
+    """
 
     def __init__(self, components: List[CustomComponent]):
         is_inited = set()
@@ -263,6 +640,25 @@ class ScriptProcessor(Processor):
             )
             is_inited.add(component.type_alias)
 
+        self.update_dispatch()
+        # The batch of every script, and the version of the world's query it
+        # was built from
+        self.batches: Dict[str, Tuple[int, ModelBatch]] = {}
+        self.reported: Set[Tuple[str, str, str]] = set()
+
+    def update_dispatch(self):
+        # (type alias, profiler section, processor, whether it is batched),
+        # worked out once instead of every frame
+        self.dispatch = [
+            (
+                pid,
+                f"ScriptProcessor/{pid[len('custom_'):]}",
+                processor,
+                callable(getattr(processor, "process_batch", None)),
+            )
+            for pid, processor in self.processors.items()
+        ]
+
     @staticmethod
     def get_processor_from_script(path: Optional[str]) -> Processor:
         """Get a processor from a script file."""
@@ -271,13 +667,11 @@ class ScriptProcessor(Processor):
         if path is None:
             return BaseComponent()
 
-        with open(current_project.folder / path, "r") as f:
-            script_file_contents = f.read()
-
         @with_gui_logging_default({})  # Route errors to the GUI logger
         def run():
+            code = ScriptCache().get(current_project.folder / path)
             module = {"nimble": nimble}
-            exec(script_file_contents, module)
+            exec(code, module)
             return module
 
         module = run()
@@ -293,19 +687,100 @@ class ScriptProcessor(Processor):
 
     @with_gui_logging
     def init(self):
-        for processor in self.processors.values():
+        for pid, processor in self.processors.items():
             processor.world = self.world
 
             if hasattr(processor, "init"):
                 # Only run init if it exists
-                processor.init()
+                try:
+                    processor.init()
+                except Exception as e:
+                    self.report(pid, e)
 
     @with_gui_logging
     def process(self):
-        for pid, processor in self.processors.items():
-            for (_, component) in self.world.get_component(pid):
-                # Process every custom component and pass in it's model
-                processor.process(component.model)
+        profiler = FrameProfiler()
+        for (pid, section, processor, batched) in self.dispatch:
+            with profiler.section(section):
+                batch = self.batch(pid)
+                if batched:
+                    try:
+                        processor.process_batch(batch)
+                    except Exception as e:
+                        self.report(pid, e)
+                    continue
+
+                process = processor.process
+                for model in batch.models:
+                    # Process every custom component and pass in it's model
+                    try:
+                        process(model)
+                    except Exception as e:
+                        self.report(pid, e, model)
+
+    def batch(self, pid: str) -> ModelBatch:
+        """The models with the script `pid`, rebuilt only when they changed."""
+        version = self.world.get_component_version(pid)
+        cached = self.batches.get(pid)
+        if cached is None or cached[0] != version:
+            batch = ModelBatch(
+                [component.model for _, component in self.world.get_component(pid)]
+            )
+            cached = self.batches[pid] = (version, batch)
+        return cached[1]
+
+    def report(self, pid: str, e: Exception, model: Optional[Model] = None):
+        """Log an error from a script, unless the same error was already
+        logged (it would likely happen again every frame)."""
+        key = (pid, type(e).__name__, str(e))
+        if key in self.reported:
+            return
+
+        self.reported.add(key)
+        script = pid[len("custom_") :]
+        where = f" (on {model.name})" if model is not None else ""
+        log_exception(
+            e,
+            f"Error in {script}{where}, the same error won't be logged again:",
+        )
+
+    @with_gui_logging
+    def reload(self, script: str) -> bool:
+        """Replace the `Component` of a script that changed with a new one,
+        keeping the game running. Returns whether it was replaced: if the new
+        version of the script fails to load, the old one keeps running."""
+        pid = f"custom_{script}"
+        old = self.processors.get(pid)
+        if old is None:
+            return False
+
+        new = self.get_processor_from_script(script)
+        if isinstance(new, NoProcessor):
+            logging.getLogger("nimble").error(
+                f"Couldn't reload {script}, the previous version is still running."
+            )
+            return False
+
+        new.world = self.world
+        if hasattr(old, "keys"):
+            new.keys = old.keys
+
+        self.processors[pid] = new
+        self.update_dispatch()
+        # Errors of the new version should be shown, even if the old version
+        # had the same ones
+        self.reported = {key for key in self.reported if key[0] != pid}
+
+        try:
+            if hasattr(new, "migrate"):
+                new.migrate(old)
+            elif hasattr(new, "init"):
+                new.init()
+        except Exception as e:
+            self.report(pid, e)
+
+        logging.getLogger("nimble").info(f"Reloaded {script}")
+        return True
 
     def add_keys_attr(self, keys: PressedKeys):
         """Add the pressed keys attribute to the processors."""
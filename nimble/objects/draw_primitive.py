@@ -1,19 +1,420 @@
 """
-Code taken from moderngl-window source (licensed under the MIT).
+Vectorized builders for primitive meshes.
 
-I've made a few changes to make it work with nimble, which is why 
-I'm not importing it directly.
+Every `*_mesh` function builds the whole vertex grid of a primitive at once
+with numpy, and returns a `Mesh` that can be uploaded with
+`GeometryBuffers.from_mesh` (or `create_vao`).
+
+`sphere` was originally taken from the moderngl-window source (licensed under
+the MIT), which is why it isn't imported directly.
 """
-import math
-from typing import List, Tuple
 
-import numpy
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
 
 import moderngl as mlg
+import moderngl_window as mglw
 from moderngl_window.opengl.vao import VAO
 from moderngl_window.geometry import AttributeNames
 
 
+class Mesh(NamedTuple):
+    """The vertex data of a primitive."""
+
+    # (N, 3) float32 arrays
+    positions: np.ndarray
+    normals: np.ndarray
+    # (N, 2) float32 array
+    uvs: np.ndarray
+    # Flat uint32 array, three indices per triangle
+    indices: np.ndarray
+
+
+def grid_indices(rows: int, columns: int) -> np.ndarray:
+    """Indices of two triangles per cell, for a grid of (rows + 1) x
+    (columns + 1) vertices stored row by row.
+
+    The triangles are counter-clockwise when the rows run "down" and the
+    columns run "right" as seen from the front face."""
+    row, column = np.meshgrid(np.arange(rows), np.arange(columns), indexing="ij")
+    a = (row * (columns + 1) + column).ravel()
+    b = a + columns + 1
+
+    return np.stack((a, b, a + 1, b, b + 1, a + 1), axis=-1).ravel().astype(np.uint32)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    lengths = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(lengths == 0, 1, lengths)
+
+
+def _mesh(positions, normals, uvs, indices) -> Mesh:
+    return Mesh(
+        np.ascontiguousarray(positions, dtype="f4").reshape(-1, 3),
+        np.ascontiguousarray(normals, dtype="f4").reshape(-1, 3),
+        np.ascontiguousarray(uvs, dtype="f4").reshape(-1, 2),
+        np.ascontiguousarray(indices, dtype=np.uint32).ravel(),
+    )
+
+
+def concatenate_meshes(*meshes: Mesh) -> Mesh:
+    """Combine several meshes into one, offsetting their indices."""
+    offsets = np.cumsum([0] + [len(mesh.positions) for mesh in meshes[:-1]])
+    return Mesh(
+        np.concatenate([mesh.positions for mesh in meshes]),
+        np.concatenate([mesh.normals for mesh in meshes]),
+        np.concatenate([mesh.uvs for mesh in meshes]),
+        np.concatenate(
+            [mesh.indices + offset for mesh, offset in zip(meshes, offsets)]
+        ).astype(np.uint32),
+    )
+
+
+def unique_vertices(vertices: np.ndarray, decimals: int = 5) -> np.ndarray:
+    """Remove duplicate vertices (up to `decimals` decimal places)."""
+    _, first = np.unique(np.round(vertices, decimals), axis=0, return_index=True)
+    return vertices[np.sort(first)]
+
+
+def weld_mesh(mesh: Mesh, decimals: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge the duplicate vertices of a mesh (e.g. along uv seams), and drop
+    the triangles that collapse. Returns the positions and the indices."""
+    _, first, inverse = np.unique(
+        np.round(mesh.positions, decimals),
+        axis=0,
+        return_index=True,
+        return_inverse=True,
+    )
+    # Keep the vertices in the order they first appear
+    order = np.argsort(first)
+    remap = np.empty_like(order)
+    remap[order] = np.arange(len(order))
+
+    triangles = remap[inverse.ravel()][mesh.indices].reshape(-1, 3)
+    degenerate = (
+        (triangles[:, 0] == triangles[:, 1])
+        | (triangles[:, 1] == triangles[:, 2])
+        | (triangles[:, 0] == triangles[:, 2])
+    )
+    return (
+        mesh.positions[first[order]],
+        triangles[~degenerate].ravel().astype(np.uint32),
+    )
+
+
+class GeometryBuffers:
+    """The GPU buffers of a geometry. Its `VAO` is created from them, and so
+    are the vertex arrays of other shaders that draw it (e.g. instanced ones,
+    see `InstanceBatch`). Every vertex buffer holds a single attribute."""
+
+    def __init__(
+        self,
+        vertex_buffers: List[Tuple[mlg.Buffer, str, str]],
+        index_buffer: Optional[mlg.Buffer] = None,
+        index_element_size: int = 4,
+    ):
+        # (buffer, format, attribute name)
+        self.vertex_buffers = vertex_buffers
+        self.index_buffer = index_buffer
+        self.index_element_size = index_element_size
+
+    @classmethod
+    def from_mesh(
+        cls, mesh: Mesh, normals=True, uvs=True, attr_names=AttributeNames
+    ) -> "GeometryBuffers":
+        """Upload a mesh to the GPU."""
+        ctx: mlg.Context = mglw.ctx()
+        vertex_buffers = [(ctx.buffer(mesh.positions), "3f", attr_names.POSITION)]
+
+        if normals:
+            vertex_buffers.append((ctx.buffer(mesh.normals), "3f", attr_names.NORMAL))
+
+        if uvs:
+            vertex_buffers.append((ctx.buffer(mesh.uvs), "2f", attr_names.TEXCOORD_0))
+
+        return cls(vertex_buffers, ctx.buffer(mesh.indices), 4)
+
+    def create_vao(self, name: str = "", mode: int = mlg.TRIANGLES) -> VAO:
+        vao = VAO(name, mode=mode)
+        for (buffer, buffer_format, attribute) in self.vertex_buffers:
+            vao.buffer(buffer, buffer_format, [attribute])
+        if self.index_buffer is not None:
+            vao.index_buffer(self.index_buffer, self.index_element_size)
+        return vao
+
+    def content(self, attributes: Iterable[str]) -> List[Tuple[mlg.Buffer, str, str]]:
+        """The vertex buffers of the given attributes, as the content of a
+        `moderngl.VertexArray`."""
+        attributes = set(attributes)
+        return [
+            buffer_content
+            for buffer_content in self.vertex_buffers
+            if buffer_content[2] in attributes
+        ]
+
+
+def create_vao(
+    mesh: Mesh,
+    name: str = "",
+    normals=True,
+    uvs=True,
+    attr_names=AttributeNames,
+) -> VAO:
+    """Upload a mesh to the GPU."""
+    return GeometryBuffers.from_mesh(mesh, normals, uvs, attr_names).create_vao(name)
+
+
+def cube_mesh(size=(1.0, 1.0, 1.0), center=(0.0, 0.0, 0.0)) -> Mesh:
+    """A box of `size` around `center`, with four vertices (sharing the
+    normal of the face) per face."""
+    axes = np.eye(3)
+    # The normal of each face, and two tangents with u x v = normal
+    normals = np.concatenate((axes, -axes))
+    us = np.concatenate((np.roll(axes, -1, axis=0), -np.roll(axes, -1, axis=0)))
+    vs = np.tile(np.roll(axes, -2, axis=0), (2, 1))
+
+    corners = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)])
+    positions = (
+        normals[:, np.newaxis]
+        + corners[np.newaxis, :, 0, np.newaxis] * us[:, np.newaxis]
+        + corners[np.newaxis, :, 1, np.newaxis] * vs[:, np.newaxis]
+    ) / 2
+
+    return _mesh(
+        positions * np.asarray(size) + np.asarray(center),
+        np.repeat(normals, 4, axis=0),
+        np.tile((corners + 1) / 2, (6, 1)),
+        np.arange(6)[:, np.newaxis] * 4 + (0, 1, 2, 0, 2, 3),
+    )
+
+
+def sphere_mesh(radius=0.5, sectors=32, rings=16) -> Mesh:
+    """A UV sphere, with `rings` rows of `sectors` vertices from the bottom
+    pole to the top pole."""
+    ring, sector = np.meshgrid(np.arange(rings), np.arange(sectors), indexing="ij")
+    v = ring / (rings - 1)
+    u = sector / (sectors - 1)
+
+    phi = np.pi * v
+    theta = 2 * np.pi * u
+    normals = np.stack(
+        (
+            np.cos(theta) * np.sin(phi),
+            np.sin(-np.pi / 2 + phi),
+            np.sin(theta) * np.sin(phi),
+        ),
+        axis=-1,
+    )
+
+    first = (ring[:-1, :-1] * sectors + sector[:-1, :-1]).ravel()
+    indices = np.stack(
+        (
+            first,
+            first + sectors + 1,
+            first + 1,
+            first,
+            first + sectors,
+            first + sectors + 1,
+        ),
+        axis=-1,
+    )
+
+    return _mesh(normals * radius, normals, np.stack((u, v), axis=-1), indices)
+
+
+def cylinder_mesh(
+    radial_segments: int = 32,
+    height_segments: int = 1,
+    height: float = 1.0,
+    radius_top: float = 0.5,
+    radius_bottom: float = 0.5,
+    theta_start: float = 0.0,
+    theta_length: float = 2 * np.pi,
+    height_offset: float = 0.0,
+) -> Mesh:
+    """A cylinder (or a cone, if one of the radii is 0) along the y axis.
+    Reference: http://www.songho.ca/opengl/gl_cylinder.html"""
+    half_height = height / 2
+    slope = (radius_bottom - radius_top) / height
+
+    # Create torso verticies, uvs, and normals
+    v, u = np.meshgrid(
+        np.arange(height_segments + 1) / height_segments,
+        np.arange(radial_segments + 1) / radial_segments,
+        indexing="ij",
+    )
+    theta = u * theta_length + theta_start
+    sin_theta = np.sin(theta)
+    cos_theta = np.cos(theta)
+    radius = v * (radius_bottom - radius_top) + radius_top
+
+    torso = _mesh(
+        np.stack(
+            (
+                radius * sin_theta,
+                -v * height + half_height + height_offset,
+                radius * cos_theta,
+            ),
+            axis=-1,
+        ),
+        _normalize(
+            np.stack((sin_theta, np.full_like(theta, slope), cos_theta), axis=-1)
+        ),
+        np.stack((u, 1 - v), axis=-1),
+        grid_indices(height_segments, radial_segments),
+    )
+
+    def cap(top: bool) -> Mesh:
+        radius = radius_top if top else radius_bottom
+        sign = 1 if top else -1
+        y = sign * half_height + height_offset
+
+        theta = np.arange(radial_segments + 1) / radial_segments
+        theta = theta * theta_length + theta_start
+        sin_theta = np.sin(theta)
+        cos_theta = np.cos(theta)
+
+        # A center vertex per segment, then the vertices around the rim
+        centers = np.tile((0, y, 0), (radial_segments + 1, 1))
+        rim = np.stack(
+            (radius * sin_theta, np.full_like(theta, y), radius * cos_theta), axis=-1
+        )
+        uvs = np.concatenate(
+            (
+                np.full((radial_segments + 1, 2), 0.5),
+                np.stack((cos_theta * 0.5 + 0.5, sin_theta * 0.5 * sign + 0.5), -1),
+            )
+        )
+
+        center = np.arange(radial_segments)
+        i = center + radial_segments + 1
+        indices = (i, i + 1, center) if top else (i + 1, i, center)
+
+        return _mesh(
+            np.concatenate((centers, rim)),
+            np.tile((0, sign, 0), (2 * (radial_segments + 1), 1)),
+            uvs,
+            np.stack(indices, axis=-1),
+        )
+
+    meshes = [torso]
+    if radius_top != 0:
+        meshes.append(cap(True))
+    if radius_bottom != 0:
+        meshes.append(cap(False))
+
+    return concatenate_meshes(*meshes)
+
+
+def cone_mesh(
+    radius: float = 0.5,
+    height: float = 1.0,
+    radial_segments: int = 32,
+    height_segments: int = 1,
+) -> Mesh:
+    """A cone along the y axis, with its tip at the top."""
+    return cylinder_mesh(
+        radial_segments=radial_segments,
+        height_segments=height_segments,
+        height=height,
+        radius_top=0,
+        radius_bottom=radius,
+    )
+
+
+def torus_mesh(
+    radius: float = 0.5,
+    tube_radius: float = 0.2,
+    radial_segments: int = 32,
+    tubular_segments: int = 16,
+) -> Mesh:
+    """A torus lying on the xz plane. `radius` is the distance from the center
+    of the torus to the center of the tube."""
+    phi, theta = np.meshgrid(
+        np.linspace(0, 2 * np.pi, tubular_segments + 1),
+        np.linspace(0, 2 * np.pi, radial_segments + 1),
+        indexing="ij",
+    )
+
+    normals = np.stack(
+        (np.cos(phi) * np.cos(theta), np.sin(phi), np.cos(phi) * np.sin(theta)),
+        axis=-1,
+    )
+    centers = np.stack(
+        (radius * np.cos(theta), np.zeros_like(theta), radius * np.sin(theta)),
+        axis=-1,
+    )
+    uvs = np.stack(
+        (theta / (2 * np.pi), phi / (2 * np.pi)),
+        axis=-1,
+    )
+
+    return _mesh(
+        centers + normals * tube_radius,
+        normals,
+        uvs,
+        grid_indices(tubular_segments, radial_segments),
+    )
+
+
+def capsule_mesh(
+    radius: float = 0.25,
+    height: float = 1.0,
+    sectors: int = 32,
+    rings: int = 8,
+) -> Mesh:
+    """A capsule along the y axis. `height` includes the two hemispheres, and
+    `rings` is the number of rings per hemisphere."""
+    half_length = max(height / 2 - radius, 0)
+    height = 2 * (half_length + radius)
+
+    # Top hemisphere (pole to equator), then the bottom one (equator to pole).
+    # The two equators are separate rows, and the cylinder spans between them.
+    latitude = np.concatenate(
+        (np.linspace(np.pi / 2, 0, rings + 1), np.linspace(0, -np.pi / 2, rings + 1))
+    )
+    offset = np.repeat((half_length, -half_length), rings + 1)
+
+    latitude, theta = np.meshgrid(
+        latitude, np.linspace(0, 2 * np.pi, sectors + 1), indexing="ij"
+    )
+    normals = np.stack(
+        (
+            np.cos(latitude) * np.sin(theta),
+            np.sin(latitude),
+            np.cos(latitude) * np.cos(theta),
+        ),
+        axis=-1,
+    )
+    positions = normals * radius
+    positions[..., 1] += offset[:, np.newaxis]
+
+    uvs = np.stack(
+        (theta / (2 * np.pi), positions[..., 1] / height + 0.5),
+        axis=-1,
+    )
+
+    return _mesh(positions, normals, uvs, grid_indices(2 * rings + 1, sectors))
+
+
+def plane_mesh(subdivisions: int = 1) -> Mesh:
+    """A 1x1 plane on the xz plane, with normals pointing up, split into
+    `subdivisions` x `subdivisions` quads."""
+    z, x = np.meshgrid(
+        np.linspace(-0.5, 0.5, subdivisions + 1),
+        np.linspace(-0.5, 0.5, subdivisions + 1),
+        indexing="ij",
+    )
+
+    return _mesh(
+        np.stack((x, np.zeros_like(x), z), axis=-1),
+        np.tile((0, 1, 0), (x.size, 1)),
+        np.stack((x + 0.5, 0.5 - z), axis=-1),
+        grid_indices(subdivisions, subdivisions),
+    )
+
+
 def sphere(
     radius=0.5,
     sectors=32,
@@ -22,7 +423,7 @@ def sphere(
     uvs=True,
     name: str = None,
     attr_names=AttributeNames,
-) -> Tuple[VAO, numpy.ndarray, List[int]]:
+) -> Tuple[VAO, np.ndarray, np.ndarray]:
     """Creates a sphere.
 
     Keyword Args:
@@ -34,64 +435,8 @@ def sphere(
         name (str): An optional name for the VAO
         attr_names (AttributeNames): Attribute names
     Returns:
-        A :py:class:`VAO` instance
+        A :py:class:`VAO` instance, the vertex positions and the indices
     """
-    R = 1.0 / (rings - 1)
-    S = 1.0 / (sectors - 1)
-
-    vertices = [0] * (rings * sectors * 3)
-    normals = [0] * (rings * sectors * 3)
-    uvs = [0] * (rings * sectors * 2)
-
-    v, n, t = 0, 0, 0
-    for r in range(rings):
-        for s in range(sectors):
-            y = math.sin(-math.pi / 2 + math.pi * r * R)
-            x = math.cos(2 * math.pi * s * S) * math.sin(math.pi * r * R)
-            z = math.sin(2 * math.pi * s * S) * math.sin(math.pi * r * R)
-
-            uvs[t] = s * S
-            uvs[t + 1] = r * R
-
-            vertices[v] = x * radius
-            vertices[v + 1] = y * radius
-            vertices[v + 2] = z * radius
-
-            normals[n] = x
-            normals[n + 1] = y
-            normals[n + 2] = z
-
-            t += 2
-            v += 3
-            n += 3
-
-    indices = [0] * rings * sectors * 6
-    i = 0
-    for r in range(rings - 1):
-        for s in range(sectors - 1):
-            indices[i] = r * sectors + s
-            indices[i + 1] = (r + 1) * sectors + (s + 1)
-            indices[i + 2] = r * sectors + (s + 1)
-
-            indices[i + 3] = r * sectors + s
-            indices[i + 4] = (r + 1) * sectors + s
-            indices[i + 5] = (r + 1) * sectors + (s + 1)
-            i += 6
-
-    vao = VAO(name or "sphere", mode=mlg.TRIANGLES)
-
-    vbo_vertices = numpy.array(vertices, dtype=numpy.float32)
-    vao.buffer(vbo_vertices, "3f", [attr_names.POSITION])
-
-    if normals:
-        vbo_normals = numpy.array(normals, dtype=numpy.float32)
-        vao.buffer(vbo_normals, "3f", [attr_names.NORMAL])
-
-    if uvs:
-        vbo_uvs = numpy.array(uvs, dtype=numpy.float32)
-        vao.buffer(vbo_uvs, "2f", [attr_names.TEXCOORD_0])
-
-    vbo_elements = numpy.array(indices, dtype=numpy.uint32)
-    vao.index_buffer(vbo_elements, index_element_size=4)
-
-    return (vao, vbo_vertices.reshape((-1, 3)), indices)
+    mesh = sphere_mesh(radius, sectors, rings)
+    vao = create_vao(mesh, name or "sphere", normals, uvs, attr_names)
+    return (vao, mesh.positions, mesh.indices)
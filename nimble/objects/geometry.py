@@ -1,12 +1,12 @@
 from __future__ import annotations
-from typing import Optional
+import json
+from typing import Any, Dict, Optional, Tuple, Type
 from pyrr import Vector3
 import moderngl_window as mglw
 import moderngl as mgl
-from math import pi, sin, cos
+from math import pi
 import numpy as np
 from moderngl_window.geometry.attributes import AttributeNames
-from moderngl_window.opengl.vao import VAO
 from pyrr.objects.matrix44 import Matrix44
 
 from nimble.common.models.bounding_box import (
@@ -14,18 +14,48 @@ from nimble.common.models.bounding_box import (
     apply_world_transform,
     vao2bounding_box,
 )
-from nimble.objects.draw_primitive import sphere
+from nimble.objects.draw_primitive import (
+    GeometryBuffers,
+    Mesh,
+    capsule_mesh,
+    cone_mesh,
+    cube_mesh,
+    cylinder_mesh,
+    plane_mesh,
+    sphere_mesh,
+    torus_mesh,
+    unique_vertices,
+    weld_mesh,
+)
+from nimble.common.singleton import Singleton
+
+GeometryKey = Tuple[str, str]
+
+
+def geometry_key(class_name: str, kwargs: Dict[str, Any]) -> GeometryKey:
+    """Create a key from a geometry class name and its (serialized) kwargs."""
+    kwargs = {
+        k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in kwargs.items()
+    }
+    return (class_name, json.dumps(kwargs, sort_keys=True))
 
 
 class Geometry:
     """The geometry (bounding box + verticies + collision shape) of an object."""
 
+    # If true, the world bounding box is only scaled and translated, not rotated
+    fixed_bounding_box = False
+
     def __init__(
         self,
-        vao: mgl.VertexArray,
+        buffers: GeometryBuffers,
         bounding_box: BoundingBox = None,
+        name: str = "",
     ):
-        self.vao = vao
+        # The GPU buffers, which other vertex arrays (e.g. for instancing) can
+        # be created from, and the vertex array to render them with
+        self.buffers = buffers
+        self.vao = buffers.create_vao(name)
 
         if bounding_box is None:
             # Create bounding box from vertices
@@ -33,6 +63,39 @@ class Geometry:
 
         self.bounding_box = bounding_box
 
+    @property
+    def key(self) -> GeometryKey:
+        """A key that is the same for geometries with the same vertex data."""
+        try:
+            return self._key
+        except AttributeError:
+            self._key = geometry_key(type(self).__name__, getattr(self, "kwargs", {}))
+            return self._key
+
+    @property
+    def hull_vertices(self) -> np.ndarray:
+        """The vertices that span the convex hull of the geometry, for convex
+        mesh colliders. Computed once, since every collider of the geometry
+        only scales them."""
+        try:
+            return self._hull_vertices
+        except AttributeError:
+            self._hull_vertices = self.create_hull_vertices()
+            return self._hull_vertices
+
+    def create_hull_vertices(self) -> np.ndarray:
+        # Render meshes repeat vertices along seams and at poles, which don't
+        # change the hull
+        return unique_vertices(self.verts)
+
+    @staticmethod
+    def create_mesh(**kwargs) -> Optional[Mesh]:
+        """The vertex data of the geometry created with `kwargs`, which can be
+        passed to the constructor as `mesh`. It only uses numpy, so (unlike the
+        constructor, which uploads it to the GPU) it can run on any thread.
+        `None` for geometries that create their vertex data themselves."""
+        return None
+
     def get_world_bounding_box(self, model: Matrix44) -> BoundingBox:
         return apply_world_transform(
             self.bounding_box,
@@ -46,21 +109,27 @@ class Geometry:
 class Cube(Geometry):
     """A cube."""
 
-    def __init__(self, **kwargs):
+    def __init__(self, mesh: Optional[Mesh] = None, **kwargs):
         if "size" not in kwargs:
             kwargs["size"] = (1, 1, 1)
 
         size = kwargs["size"]
         self.kwargs = kwargs
 
+        if mesh is None:
+            mesh = self.create_mesh(**kwargs)
         super().__init__(
-            mglw.geometry.cube(**kwargs),
+            GeometryBuffers.from_mesh(mesh),
             bounding_box=(
                 Vector3(tuple(-a / 2 for a in size), dtype="f4"),
                 Vector3(tuple(a / 2 for a in size), dtype="f4"),
             ),
         )
 
+    @staticmethod
+    def create_mesh(**kwargs) -> Mesh:
+        return cube_mesh(**kwargs)
+
     def create_collision_shape(self, scale: Vector3, p) -> Optional[int]:
         return p.createCollisionShape(
             p.GEOM_BOX,
@@ -73,20 +142,26 @@ class Cube(Geometry):
 class Sphere(Geometry):
     """A sphere."""
 
-    def __init__(self, **kwargs):
+    fixed_bounding_box = True
+
+    def __init__(self, mesh: Optional[Mesh] = None, **kwargs):
         if "radius" not in kwargs:
             kwargs["radius"] = 0.5
 
         radius = kwargs["radius"]
         self.kwargs = kwargs
 
-        vao, self.verts, self.idx = sphere(**kwargs)
+        if mesh is None:
+            mesh = self.create_mesh(**kwargs)
+        self.verts = mesh.positions
+        self.idx = mesh.indices
         super().__init__(
-            vao,
+            GeometryBuffers.from_mesh(mesh),
             bounding_box=(
                 Vector3((-radius,) * 3, dtype="f4"),
                 Vector3((radius,) * 3, dtype="f4"),
             ),
+            name="sphere",
         )
 
     def get_world_bounding_box(self, model: Matrix44) -> BoundingBox:
@@ -103,6 +178,10 @@ class Sphere(Geometry):
             new.T,
         )
 
+    @staticmethod
+    def create_mesh(**kwargs) -> Mesh:
+        return sphere_mesh(**kwargs)
+
     def create_collision_shape(self, scale: Vector3, p) -> Optional[int]:
         if np.all(np.isclose(scale, scale[0])):
             # If the scale is uniform, use a sphere collider...
@@ -112,7 +191,7 @@ class Sphere(Geometry):
 
         # ...otherwise, use a convex hull collider (p.GEOM_MESH)
         return p.createCollisionShape(
-            p.GEOM_MESH, vertices=self.verts * scale[np.newaxis, :], indices=self.idx
+            p.GEOM_MESH, vertices=self.hull_vertices * scale[np.newaxis, :]
         )
 
 
@@ -127,13 +206,12 @@ class Ray(Geometry):
 
         self.ray = ray
         self.kwargs = {"start": start, "ray": ray}
-        vao = VAO()
-        vao.buffer(
-            np.array([start, start + ray]),
-            "3f",
-            [AttributeNames.POSITION],
+        positions = np.array([start, start + ray], dtype="f4")
+        super().__init__(
+            GeometryBuffers(
+                [(mglw.ctx().buffer(positions), "3f", AttributeNames.POSITION)]
+            )
         )
-        super().__init__(vao)
 
 
 class Cylinder(Geometry):
@@ -149,6 +227,7 @@ class Cylinder(Geometry):
         theta_start: float = 0.0,
         theta_length: float = 2 * pi,
         height_offset: float = 0.0,
+        mesh: Optional[Mesh] = None,
     ):
         self.kwargs = {
             "radial_segments": radial_segments,
@@ -161,115 +240,23 @@ class Cylinder(Geometry):
             "height_offset": height_offset,
         }
 
-        half_height = height / 2
-
-        slope = (radius_bottom - radius_top) / height
-        verticies = []
-        normals = []
-        uvs = []
-
-        # Create torso verticies, uvs, and normals
-        # Reference: http://www.songho.ca/opengl/gl_cylinder.html
-        index_array = []
-        index = 0
-        for y in range(height_segments + 1):
-            index_row = []
-            v = y / height_segments
-            radius = v * (radius_bottom - radius_top) + radius_top
-
-            for x in range(radial_segments + 1):
-                u = x / radial_segments
-                theta = u * theta_length + theta_start
-                sin_theta = sin(theta)
-                cos_theta = cos(theta)
-                verticies.append(
-                    [
-                        radius * sin_theta,
-                        -v * height + half_height + height_offset,
-                        radius * cos_theta,
-                    ]
-                )
-                normals.append(
-                    Vector3((sin_theta, slope, cos_theta), dtype="f4").normalized
-                )
-                uvs.append([u, 1 - v])
-                index_row.append(index)
-                index += 1
-
-            index_array.append(index_row)
-
-        indicies = []
-        for x in range(radial_segments):
-            for y in range(height_segments):
-                a = index_array[y][x]
-                b = index_array[y + 1][x]
-                c = index_array[y + 1][x + 1]
-                d = index_array[y][x + 1]
-
-                indicies.extend([a, b, d, b, c, d])
-
-        def generate_cap(index, top, verticies, normals, uvs, indicies) -> int:
-            center_index_start = index
-            radius = radius_top if top else radius_bottom
-            sign = 1 if top else -1
-            for x in range(radial_segments + 1):
-                verticies.append([0, half_height * sign + height_offset, 0])
-                normals.append([0, sign, 0])
-                uvs.append([0.5, 0.5])
-                index += 1
-
-            center_index_end = index
-
-            for x in range(radial_segments + 1):
-                u = x / radial_segments
-                theta = u * theta_length + theta_start
-                cos_theta = cos(theta)
-                sin_theta = sin(theta)
-                verticies.append(
-                    [
-                        radius * sin_theta,
-                        sign * half_height + height_offset,
-                        radius * cos_theta,
-                    ]
-                )
-                normals.append([0, sign, 0])
-                uvs.append([cos_theta * 0.5 + 0.5, sin_theta * 0.5 * sign + 0.5])
-                index += 1
-
-            # Gernerate indicies
-            for x in range(radial_segments):
-                c = center_index_start + x
-                i = center_index_end + x
-                if top:
-                    indicies.extend([i, i + 1, c])
-                else:
-                    indicies.extend([i + 1, i, c])
-
-            return index
-
-        if radius_top != 0:
-            index = generate_cap(index, True, verticies, normals, uvs, indicies)
-        if radius_bottom != 0:
-            index = generate_cap(index, False, verticies, normals, uvs, indicies)
-
-        np_indicies = np.array(indicies, dtype="i4")
-        np_verts = np.array(verticies, dtype="f4")
-        normals = np.array(normals, dtype="f4")
-        uvs = np.array(uvs, dtype="f4")
-
-        vao = VAO()
-        vao.buffer(np_verts, "3f", [AttributeNames.POSITION])
-        vao.buffer(normals, "3f", [AttributeNames.NORMAL])
-        vao.buffer(uvs, "2f", [AttributeNames.TEXCOORD_0])
-
-        vao.index_buffer(np_indicies)
+        if mesh is None:
+            mesh = cylinder_mesh(**self.kwargs)
+        self.verts = mesh.positions
+        self.idx = mesh.indices
+
+        # The rows of the torso between the two ends lie on the hull's surface,
+        # so the collider only needs the same cylinder with one height segment.
+        # It keeps its triangles, since pybullet's contacts with a vertex-only
+        # hull make tall cylinders tip over.
+        self.hull_verts, self.hull_idx = weld_mesh(
+            cylinder_mesh(**{**self.kwargs, "height_segments": 1})
+        )
 
+        half_height = height / 2
         max_radius = max(radius_top, radius_bottom)
-        self.verts = verticies
-        self.idx = indicies
-
         super().__init__(
-            vao,
+            GeometryBuffers.from_mesh(mesh),
             (
                 Vector3(
                     (-max_radius, -half_height + height_offset, -max_radius), dtype="f4"
@@ -280,47 +267,296 @@ class Cylinder(Geometry):
             ),
         )
 
+    @staticmethod
+    def create_mesh(**kwargs) -> Mesh:
+        return cylinder_mesh(**kwargs)
+
+    def create_collision_shape(self, scale: Vector3, p) -> Optional[int]:
+        return p.createCollisionShape(
+            p.GEOM_MESH,
+            vertices=self.hull_verts * scale[np.newaxis, :],
+            indices=self.hull_idx,
+        )
+
+
+class Cone(Cylinder):
+    """A cone, with its tip at the top."""
+
+    def __init__(
+        self,
+        radius: float = 0.5,
+        height: float = 1.0,
+        radial_segments: int = 32,
+        height_segments: int = 1,
+        mesh: Optional[Mesh] = None,
+    ):
+        super().__init__(
+            radial_segments=radial_segments,
+            height_segments=height_segments,
+            height=height,
+            radius_top=0,
+            radius_bottom=radius,
+            mesh=mesh,
+        )
+        self.kwargs = {
+            "radius": radius,
+            "height": height,
+            "radial_segments": radial_segments,
+            "height_segments": height_segments,
+        }
+
+    @staticmethod
+    def create_mesh(**kwargs) -> Mesh:
+        return cone_mesh(**kwargs)
+
+
+class Torus(Geometry):
+    """A torus (donut) lying flat on the xz plane."""
+
+    def __init__(
+        self,
+        radius: float = 0.5,
+        tube_radius: float = 0.2,
+        radial_segments: int = 32,
+        tubular_segments: int = 16,
+        mesh: Optional[Mesh] = None,
+    ):
+        self.kwargs = {
+            "radius": radius,
+            "tube_radius": tube_radius,
+            "radial_segments": radial_segments,
+            "tubular_segments": tubular_segments,
+        }
+
+        if mesh is None:
+            mesh = torus_mesh(**self.kwargs)
+        self.verts = mesh.positions
+        self.idx = mesh.indices
+
+        outer = radius + tube_radius
+        super().__init__(
+            GeometryBuffers.from_mesh(mesh),
+            (
+                Vector3((-outer, -tube_radius, -outer), dtype="f4"),
+                Vector3((outer, tube_radius, outer), dtype="f4"),
+            ),
+        )
+
+    @staticmethod
+    def create_mesh(**kwargs) -> Mesh:
+        return torus_mesh(**kwargs)
+
+    def create_hull_vertices(self) -> np.ndarray:
+        # The inner half of the tube is inside the hull of the outer half
+        distance = np.linalg.norm(self.verts[:, (0, 2)], axis=1)
+        return unique_vertices(self.verts[distance >= self.kwargs["radius"] - 1e-6])
+
+    def create_collision_shape(self, scale: Vector3, p) -> Optional[int]:
+        # Without indices, pybullet uses the convex hull of the vertices, so
+        # the hole in the middle isn't part of the collider
+        return p.createCollisionShape(
+            p.GEOM_MESH, vertices=self.hull_vertices * scale[np.newaxis, :]
+        )
+
+
+class Capsule(Geometry):
+    """A capsule (a cylinder with hemispheres on both ends) along the y axis."""
+
+    def __init__(
+        self,
+        radius: float = 0.25,
+        height: float = 1.0,
+        sectors: int = 32,
+        rings: int = 8,
+        mesh: Optional[Mesh] = None,
+    ):
+        self.kwargs = {
+            "radius": radius,
+            "height": height,
+            "sectors": sectors,
+            "rings": rings,
+        }
+
+        if mesh is None:
+            mesh = capsule_mesh(**self.kwargs)
+        self.verts = mesh.positions
+        self.idx = mesh.indices
+
+        half_height = max(height / 2, radius)
+        super().__init__(
+            GeometryBuffers.from_mesh(mesh),
+            (
+                Vector3((-radius, -half_height, -radius), dtype="f4"),
+                Vector3((radius, half_height, radius), dtype="f4"),
+            ),
+        )
+
+    @staticmethod
+    def create_mesh(**kwargs) -> Mesh:
+        return capsule_mesh(**kwargs)
+
     def create_collision_shape(self, scale: Vector3, p) -> Optional[int]:
+        if np.all(np.isclose(scale, scale[0])):
+            # If the scale is uniform, use a capsule collider (which pybullet
+            # aligns with the z axis, so rotate it onto the y axis)...
+            radius = self.kwargs["radius"]
+            length = max(self.kwargs["height"] - 2 * radius, 0)
+            return p.createCollisionShape(
+                p.GEOM_CAPSULE,
+                radius=scale[0] * radius,
+                height=scale[0] * length,
+                collisionFrameOrientation=p.getQuaternionFromEuler((pi / 2, 0, 0)),
+            )
+
+        # ...otherwise, use a convex hull collider (p.GEOM_MESH)
         return p.createCollisionShape(
-            p.GEOM_MESH, vertices=self.verts * scale[np.newaxis, :], indices=self.idx
+            p.GEOM_MESH, vertices=self.hull_vertices * scale[np.newaxis, :]
         )
 
 
 class Plane(Geometry):
     """A plane, with normals pointing up."""
 
-    def __init__(self):
-        self.kwargs = {}
-
-        vao = VAO()
-        # fmt: off
-        verticies = np.array([
-            -0.5, 0, -0.5,
-            -0.5, 0, 0.5,
-            0.5, 0, 0.5,
-            0.5, 0, -0.5,
-        ], dtype="f4")
-        normals = np.array([0, 1, 0] * 4, dtype="f4")
-        uvs = np.array([
-            0, 1,
-            0, 0,
-            1, 0,
-            1, 1,
-        ], dtype="f4")
-        # fmt: on
-
-        vao.buffer(verticies, "3f", [AttributeNames.POSITION])
-        vao.buffer(normals, "3f", [AttributeNames.NORMAL])
-        vao.buffer(uvs, "2f", [AttributeNames.TEXCOORD_0])
-
-        vao.index_buffer(np.array([0, 1, 2, 0, 2, 3], dtype="i4"))
+    def __init__(self, subdivisions: int = 1, mesh: Optional[Mesh] = None):
+        self.kwargs = {"subdivisions": subdivisions}
 
+        if mesh is None:
+            mesh = plane_mesh(subdivisions)
         super().__init__(
-            vao,
+            GeometryBuffers.from_mesh(mesh),
             (Vector3((-0.5, 0, -0.5), dtype="f4"), Vector3((0.5, 0, 0.5), dtype="f4")),
         )
 
+    @staticmethod
+    def create_mesh(**kwargs) -> Mesh:
+        return plane_mesh(**kwargs)
+
     def create_collision_shape(self, scale: Vector3, p) -> Optional[int]:
         return p.createCollisionShape(
             p.GEOM_BOX, halfExtents=[scale[0] / 2, 0.005, scale[2] / 2]
         )
+
+
+class GeometryCache(metaclass=Singleton):
+    """A reference counted cache of geometries, so that models with identical
+    primitives share one set of GPU buffers."""
+
+    def __init__(self):
+        self.geometries: Dict[GeometryKey, Geometry] = {}
+        self.references: Dict[GeometryKey, int] = {}
+        # Maps the key of the requested kwargs to the key of the geometry, which
+        # can differ when defaults were filled in (e.g. `Cube()` vs `Cube(size=...)`)
+        self.aliases: Dict[GeometryKey, GeometryKey] = {}
+
+    def get(
+        self,
+        cls: Type[Geometry],
+        kwargs: Optional[Dict[str, Any]] = None,
+        mesh: Optional[Mesh] = None,
+    ):
+        """Get a shared geometry of class `cls`, created with `kwargs`. If it
+        has to be created, `mesh` is its vertex data (from `cls.create_mesh`),
+        if it was already generated. Every call must be paired with a call to
+        `release`."""
+        kwargs = {} if kwargs is None else kwargs
+        requested = geometry_key(cls.__name__, kwargs)
+        key = self.aliases.get(requested)
+
+        if key is None:
+            geometry = cls(**kwargs) if mesh is None else cls(mesh=mesh, **kwargs)
+            key = geometry.key
+            self.aliases[requested] = key
+            if key in self.geometries:
+                # Same as an existing geometry, so throw the new one away
+                geometry.vao.release()
+            else:
+                self.geometries[key] = geometry
+                self.references[key] = 0
+
+        self.references[key] += 1
+        return self.geometries[key]
+
+    def acquire(self, geometry: Geometry) -> Geometry:
+        """Get another reference to a geometry that is already in use (e.g. for
+        a copy of a model). Every call must be paired with a call to
+        `release`."""
+        key = geometry.key
+        shared = self.geometries.get(key)
+        if shared is None:
+            # Not shared through the cache yet, so its current user keeps the
+            # first reference
+            shared = self.geometries[key] = geometry
+            self.references[key] = 1
+
+        self.references[key] += 1
+        return shared
+
+    def release(self, geometry: Geometry):
+        """Release a reference to a geometry, and its GPU buffers once nothing
+        uses it anymore."""
+        key = geometry.key
+        if self.geometries.get(key) is not geometry:
+            # Not shared through the cache, so it only belongs to one model
+            geometry.vao.release()
+            return
+
+        self.references[key] -= 1
+        if self.references[key] <= 0:
+            del self.geometries[key]
+            del self.references[key]
+            self.aliases = {
+                alias: target for alias, target in self.aliases.items() if target != key
+            }
+            geometry.vao.release()
+
+
+CollisionShapeKey = Tuple[GeometryKey, Tuple[float, float, float]]
+
+
+class CollisionShapeCache:
+    """A reference counted cache of pybullet collision shapes, so that bodies
+    with the same geometry and (almost) the same scale share one shape,
+    instead of every body creating (and leaking) its own.
+
+    Collision shapes belong to a physics client, so every physics processor
+    has its own cache. Scales are rounded to `decimals` decimal places, and
+    the shared shape is created with the rounded scale.
+    """
+
+    def __init__(self, p, decimals: int = 4):
+        self.p = p
+        self.decimals = decimals
+        self.shapes: Dict[CollisionShapeKey, int] = {}
+        self.references: Dict[CollisionShapeKey, int] = {}
+        self.keys: Dict[int, CollisionShapeKey] = {}
+
+    def get(self, geometry: Geometry, scale: Vector3) -> Optional[int]:
+        """Get a collision shape for `geometry` with `scale`. Every call must be
+        paired with a call to `release`."""
+        scale = np.round(np.asarray(scale, dtype=np.float64), self.decimals)
+        if not hasattr(geometry, "kwargs"):
+            # Without kwargs, the key doesn't describe the vertex data
+            return geometry.create_collision_shape(scale, self.p)
+
+        key = (geometry.key, tuple(scale.tolist()))
+        shape = self.shapes.get(key)
+        if shape is None:
+            shape = geometry.create_collision_shape(scale, self.p)
+            if shape is None or shape < 0:
+                return shape
+            self.shapes[key] = shape
+            self.references[key] = 0
+            self.keys[shape] = key
+
+        self.references[key] += 1
+        return shape
+
+    def release(self, shape: Optional[int]):
+        """Release a reference to a collision shape.
+
+        pybullet can't remove a collision shape once a body used it, so shapes
+        without references stay in the cache, ready for the next body with the
+        same geometry and scale."""
+        key = self.keys.get(shape)
+        if key is not None:
+            self.references[key] -= 1
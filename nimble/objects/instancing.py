@@ -0,0 +1,141 @@
+"""Instanced rendering of objects that share the same geometry and shader."""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import moderngl as mgl
+import moderngl_window as mglw
+
+from nimble.common.shader_manager import Shaders
+from nimble.interface.orbit_camera import OrbitCamera
+from nimble.objects.draw_primitive import GeometryBuffers
+from nimble.objects.material import instanced_shaders
+from nimble.objects.transform_store import TransformStore
+
+if TYPE_CHECKING:
+    from nimble.objects.model import Model
+
+
+# Every instance gets a model matrix and a color
+instance_format = "16f 3f/i"
+instance_attributes = ("in_model", "in_color")
+instance_floats = 16 + 3
+
+BatchKey = Tuple[Tuple[str, str], str]
+
+
+class InstanceBatch:
+    """The GPU buffers used to draw every instance of one geometry + shader."""
+
+    def __init__(self, program: mgl.Program):
+        self.program = program
+        self.buffers: Optional[GeometryBuffers] = None
+        self.vertex_array: Optional[mgl.VertexArray] = None
+        self.instance_buffer: Optional[mgl.Buffer] = None
+
+    def prepare(self, buffers: GeometryBuffers, data: np.ndarray):
+        """Upload the instance data, and (re)build the vertex array if the
+        geometry or the size of the instance buffer changed."""
+        ctx: mgl.Context = mglw.ctx()
+        rebuild = buffers is not self.buffers
+
+        if self.instance_buffer is None or self.instance_buffer.size < data.nbytes:
+            if self.instance_buffer is not None:
+                self.instance_buffer.release()
+            # Leave some room to grow, to avoid reallocating every frame
+            self.instance_buffer = ctx.buffer(reserve=data.nbytes * 2)
+            rebuild = True
+
+        self.instance_buffer.write(data)
+
+        if rebuild:
+            if self.vertex_array is not None:
+                self.vertex_array.release()
+            self.buffers = buffers
+            self.vertex_array = self.create_vertex_array(ctx, buffers)
+
+    def create_vertex_array(
+        self, ctx: mgl.Context, buffers: GeometryBuffers
+    ) -> mgl.VertexArray:
+        # Per vertex attributes come from the geometry's own buffers
+        attributes = [
+            name
+            for name in self.program
+            if isinstance(self.program[name], mgl.Attribute)
+            and not name.startswith("gl_")
+            and name not in instance_attributes
+        ]
+        content = buffers.content(attributes)
+        content.append((self.instance_buffer, instance_format, *instance_attributes))
+
+        return ctx.vertex_array(
+            self.program,
+            content,
+            buffers.index_buffer,
+            buffers.index_element_size,
+        )
+
+    def render(self, count: int):
+        self.vertex_array.render(mgl.TRIANGLES, instances=count)
+
+    def release(self):
+        if self.vertex_array is not None:
+            self.vertex_array.release()
+        if self.instance_buffer is not None:
+            self.instance_buffer.release()
+
+
+class InstancedRenderer:
+    """Groups objects by geometry and shader, and draws each group with a
+    single instanced draw call. Objects whose material can't be instanced are
+    drawn one by one, as usual."""
+
+    def __init__(self):
+        self.batches: Dict[BatchKey, InstanceBatch] = {}
+
+    def render(self, camera: OrbitCamera, models: Iterable[Model]):
+        groups: Dict[BatchKey, List[Model]] = {}
+
+        for model in models:
+            if model.geometry is None or not model.material.instanceable:
+                model.render(camera)
+                continue
+
+            key = (model.geometry.key, model.material.shader_name)
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [model]
+            else:
+                group.append(model)
+
+        for key, group in groups.items():
+            self.render_group(camera, key, group)
+
+        # Release batches that weren't needed this frame
+        for key in self.batches.keys() - groups.keys():
+            self.batches.pop(key).release()
+
+    def render_group(self, camera: OrbitCamera, key: BatchKey, group: List[Model]):
+        batch = self.batches.get(key)
+        if batch is None:
+            batch = InstanceBatch(Shaders()[instanced_shaders[key[1]]])
+            self.batches[key] = batch
+
+        store = TransformStore()
+        slots = np.fromiter(
+            (model.transform_slot for model in group), dtype=np.intp, count=len(group)
+        )
+
+        data = np.empty((len(group), instance_floats), dtype="f4")
+        data[:, :16] = store.matrices[slots].reshape(-1, 16)
+        data[:, 16:] = [model.material.color for model in group]
+
+        batch.prepare(group[0].geometry.buffers, data)
+        batch.program["view"].write(camera.view)
+        batch.program["proj"].write(camera.proj)
+        batch.render(len(group))
+
+    def release(self):
+        for batch in self.batches.values():
+            batch.release()
+        self.batches.clear()
@@ -0,0 +1,426 @@
+"""Undo and redo in the editor, with a journal of the changes to a scene."""
+
+from __future__ import annotations
+import json
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from nimble.objects.model import Model
+    from nimble.objects.scene import Scene
+
+
+class Command:
+    """A change to a scene, which can be undone and redone.
+
+    Commands refer to objects by their index in `Scene.objects_list`. Every
+    change to the objects of the scene is recorded, so when a command is
+    undone (or redone), the scene is the same as right after (or before) it
+    was recorded, and the index still refers to the same object. The name of
+    the object is kept to check that.
+
+    Changes go through the methods of the scene and its models, so their
+    observers are notified like for any other change.
+    """
+
+    __slots__ = ()
+
+    # A rough estimate of the memory used by a command, in bytes
+    base_size = 128
+
+    @property
+    def size(self) -> int:
+        return self.base_size
+
+    def undo(self, scene: Scene):
+        raise NotImplementedError("Command.undo not implemented")
+
+    def redo(self, scene: Scene):
+        raise NotImplementedError("Command.redo not implemented")
+
+    def merge(self, other: Command) -> bool:
+        """Fold a command recorded right after this one into it (e.g. for
+        the steps of a drag), if they change the same thing."""
+        return False
+
+
+def get_object(scene: Scene, idx: int, name: str) -> Model:
+    obj = scene.get_obj_from_idx(idx)
+    if obj is None or obj.name != name:
+        raise JournalError(f"object {idx} isn't {name!r} anymore")
+    return obj
+
+
+class JournalError(Exception):
+    """The scene was changed without recording it in the journal."""
+
+
+def _set_position(model: Model, value: Any):
+    model.position = value
+    model.position_changed()
+
+
+def _set_rotation(model: Model, value: Any):
+    model.rotation = value
+    model.rotation_changed()
+
+
+def _set_scale(model: Model, value: Any):
+    model.scale = value
+    model.scale_changed()
+
+
+def _set_color(model: Model, value: Any):
+    model.set_color(value)
+
+
+class SetField(Command):
+    """A change to the position, rotation, scale or color of an object."""
+
+    __slots__ = ("idx", "name", "field", "old", "new")
+
+    setters: Dict[str, Callable[[Model, Any], None]] = {
+        "position": _set_position,
+        "rotation": _set_rotation,
+        "scale": _set_scale,
+        "color": _set_color,
+    }
+
+    def __init__(self, idx: int, name: str, field: str, old: Any, new: Any):
+        self.idx = idx
+        self.name = name
+        self.field = field
+        # As tuples, which are much smaller than vectors
+        self.old = tuple(float(v) for v in old)
+        self.new = tuple(float(v) for v in new)
+
+    def set(self, scene: Scene, value: Any):
+        model = get_object(scene, self.idx, self.name)
+        # Select the object, so that it's clear what changed
+        scene.set_active(self.idx)
+        self.setters[self.field](model, value)
+
+    def undo(self, scene: Scene):
+        self.set(scene, self.old)
+
+    def redo(self, scene: Scene):
+        self.set(scene, self.new)
+
+    def merge(self, other: Command) -> bool:
+        if (
+            isinstance(other, SetField)
+            and other.idx == self.idx
+            and other.field == self.field
+        ):
+            self.new = other.new
+            return True
+        return False
+
+
+class SetSlot(Command):
+    """A change to a slot of a component."""
+
+    __slots__ = ("idx", "name", "component_idx", "slot_idx", "old", "new")
+
+    def __init__(
+        self,
+        idx: int,
+        name: str,
+        component_idx: int,
+        slot_idx: int,
+        old: Any,
+        new: Any,
+    ):
+        self.idx = idx
+        self.name = name
+        self.component_idx = component_idx
+        self.slot_idx = slot_idx
+        self.old = old
+        self.new = new
+
+    def set(self, scene: Scene, value: Any):
+        model = get_object(scene, self.idx, self.name)
+        scene.set_active(self.idx)
+        model.components[self.component_idx].slots()[self.slot_idx].insert_in_slot(
+            value
+        )
+        model.slots_changed(self.component_idx)
+
+    def undo(self, scene: Scene):
+        self.set(scene, self.old)
+
+    def redo(self, scene: Scene):
+        self.set(scene, self.new)
+
+    def merge(self, other: Command) -> bool:
+        if (
+            isinstance(other, SetSlot)
+            and other.idx == self.idx
+            and other.component_idx == self.component_idx
+            and other.slot_idx == self.slot_idx
+        ):
+            self.new = other.new
+            return True
+        return False
+
+
+class Rename(Command):
+    """A change to the name of an object."""
+
+    __slots__ = ("idx", "old", "new")
+
+    def __init__(self, idx: int, old: str, new: str):
+        self.idx = idx
+        self.old = old
+        self.new = new
+
+    def undo(self, scene: Scene):
+        get_object(scene, self.idx, self.new)
+        scene.rename_obj(self.idx, self.old)
+
+    def redo(self, scene: Scene):
+        get_object(scene, self.idx, self.old)
+        scene.rename_obj(self.idx, self.new)
+
+    def merge(self, other: Command) -> bool:
+        # Renaming while typing the new name
+        if isinstance(other, Rename) and (other.idx, other.old) == (
+            self.idx,
+            self.new,
+        ):
+            self.new = other.new
+            return True
+        return False
+
+
+class _ObjectCommand(Command):
+    """Adds or deletes an object. The deleted object is kept in the format of
+    `serialize_model`, to create it again."""
+
+    __slots__ = ("idx", "name", "data", "data_size")
+
+    def __init__(self, idx: int, name: str, data: Any = None):
+        self.idx = idx
+        self.name = name
+        self.data = None
+        self.data_size = 0
+        if data is not None:
+            self.set_data(data)
+
+    @property
+    def size(self) -> int:
+        return self.base_size + self.data_size
+
+    def set_data(self, data: Any):
+        self.data = data
+        self.data_size = len(json.dumps(data))
+
+    def add(self, scene: Scene):
+        from nimble.common.serialize import unserialize_model
+
+        scene.add_obj(unserialize_model(self.data), self.idx)
+        scene.set_active(self.idx)
+
+    def delete(self, scene: Scene):
+        from nimble.common.serialize import serialize_model
+
+        self.set_data(serialize_model(get_object(scene, self.idx, self.name)))
+        scene.delete_obj(self.idx)
+
+
+class AddObject(_ObjectCommand):
+    """An object that was added to the scene. It's serialized when the
+    command is undone."""
+
+    __slots__ = ()
+
+    def undo(self, scene: Scene):
+        self.delete(scene)
+
+    def redo(self, scene: Scene):
+        self.add(scene)
+
+
+class DeleteObject(_ObjectCommand):
+    """An object that was deleted from the scene. It has to be serialized
+    before it's deleted, see `CommandJournal.delete_obj`."""
+
+    __slots__ = ()
+
+    def undo(self, scene: Scene):
+        self.add(scene)
+
+    def redo(self, scene: Scene):
+        self.delete(scene)
+
+
+class AddComponent(Command):
+    """A component that was added to an object. It's serialized when the
+    command is undone."""
+
+    __slots__ = ("idx", "name", "component_idx", "data")
+
+    def __init__(self, idx: int, name: str, component_idx: int):
+        self.idx = idx
+        self.name = name
+        self.component_idx = component_idx
+        self.data: Any = None
+
+    def undo(self, scene: Scene):
+        from nimble.common.serialize import serialize_component
+
+        model = get_object(scene, self.idx, self.name)
+        self.data = serialize_component(model.components[self.component_idx])
+        model.remove_component_at(self.component_idx)
+
+    def redo(self, scene: Scene):
+        from nimble.common.serialize import unserialize_component
+
+        model = get_object(scene, self.idx, self.name)
+        model.add_component(unserialize_component(self.data, model))
+
+
+class CommandJournal:
+    """The changes made to a scene in the editor, which can be undone and
+    redone one at a time.
+
+    Every change has to be recorded with `record` (or a helper like
+    `delete_obj`), after it's made. Only what changed is recorded (see
+    `Command`), so recording, undoing and redoing a change take time in
+    proportion to the change, not to the scene.
+
+    A command recorded with `merge` is folded into the one before it if they
+    change the same thing, until `seal` is called. This turns the steps of a
+    drag (or typing a value) into one change.
+
+    The recorded commands use up to `budget` bytes (roughly); once there are
+    more, the oldest ones are forgotten. Changes that weren't recorded break
+    the journal, which is cleared if that's noticed.
+    """
+
+    budget = 4 * 1024 * 1024
+
+    def __init__(self, scene: Scene, budget: Optional[int] = None):
+        self.scene = scene
+        if budget is not None:
+            self.budget = budget
+
+        self.undo_stack: Deque[Command] = deque()
+        self.redo_stack: List[Command] = []
+        # The memory used by the commands in both stacks
+        self.used = 0
+        # Whether the last command can still be merged with
+        self.open = False
+        # Changes made while undoing or redoing aren't recorded
+        self.applying = False
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+
+    def record(self, command: Command, merge: bool = False):
+        """Record a change that was made to the scene."""
+        if self.applying:
+            return
+
+        if self.redo_stack:
+            self.used -= sum(redo.size for redo in self.redo_stack)
+            self.redo_stack.clear()
+
+        last = self.undo_stack[-1] if self.undo_stack else None
+        if merge and self.open and last is not None:
+            before = last.size
+            if last.merge(command):
+                self.used += last.size - before
+                return
+
+        self.undo_stack.append(command)
+        self.used += command.size
+        self.open = merge
+        while self.used > self.budget and len(self.undo_stack) > 1:
+            self.used -= self.undo_stack.popleft().size
+
+    def seal(self):
+        """Stop merging commands into the last one, e.g. once a drag ends."""
+        self.open = False
+
+    def undo(self) -> bool:
+        """Undo the last change, if there is one."""
+        if not self.undo_stack:
+            return False
+        command = self.undo_stack.pop()
+        self.apply(command, command.undo)
+        self.redo_stack.append(command)
+        return True
+
+    def redo(self) -> bool:
+        """Redo the last change that was undone, if there is one."""
+        if not self.redo_stack:
+            return False
+        command = self.redo_stack.pop()
+        self.apply(command, command.redo)
+        self.undo_stack.append(command)
+        return True
+
+    def apply(self, command: Command, fn: Callable[[Scene], None]):
+        self.open = False
+        before = command.size
+        self.applying = True
+        try:
+            fn(self.scene)
+        except JournalError:
+            self.clear()
+            raise
+        finally:
+            self.applying = False
+        self.used += command.size - before
+
+    def clear(self):
+        """Forget every change, e.g. when the scene is replaced."""
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.used = 0
+        self.open = False
+
+    # Helpers for recording changes
+
+    def set_field(
+        self, idx: int, model: Model, field: str, old: Any, merge: bool = False
+    ):
+        """Record a change of the position, rotation, scale or color of the
+        model at `idx`, from `old` to its current value."""
+        new = model.material.color if field == "color" else getattr(model, field)
+        if tuple(old) != tuple(new):
+            self.record(SetField(idx, model.name, field, old, new), merge)
+
+    def rename_obj(self, idx: int, new_name: str):
+        """Rename an object, and record it."""
+        old_name = self.scene.get_obj_name(idx)
+        if old_name is not None and old_name != new_name:
+            self.scene.rename_obj(idx, new_name)
+            self.record(Rename(idx, old_name, new_name), merge=True)
+
+    def add_obj(self, obj: Model) -> int:
+        """Add an object to the scene, and record it."""
+        idx = self.scene.add_obj(obj)
+        self.record(AddObject(idx, obj.name))
+        return idx
+
+    def delete_obj(self, idx: int):
+        """Delete an object from the scene, and record it."""
+        from nimble.common.serialize import serialize_model
+
+        obj = self.scene.get_obj_from_idx(idx)
+        if obj is not None:
+            command = DeleteObject(idx, obj.name, serialize_model(obj))
+            self.scene.delete_obj(idx)
+            self.record(command)
+
+    def add_component(self, idx: int, model: Model, component: Any):
+        """Add a component to the model at `idx`, and record it."""
+        component_idx = model.add_component(component)
+        self.record(AddComponent(idx, model.name, component_idx))
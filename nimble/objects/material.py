@@ -1,3 +1,4 @@
+from __future__ import annotations
 from typing import Optional, Tuple
 import moderngl as mgl
 from pyrr.objects.matrix44 import Matrix44
@@ -9,6 +10,9 @@ from nimble.objects.geometry import Geometry
 
 default_color = (0.2, 0.2, 0.2)
 
+# Shaders that have a variant which draws many objects in one instanced call
+instanced_shaders = {"viewport": "viewport_instanced"}
+
 
 class Material:
     """A material storing an OpenGL shader and parameters for it."""
@@ -42,6 +46,14 @@ class Material:
         self.pass_mvp = pass_mvp
         self.pass_model_matrix = pass_model_matrix
 
+    def copy(self) -> Material:
+        """A copy of this material, with its own parameters but the same
+        shaders."""
+        material = Material.__new__(Material)
+        material.__dict__.update(self.__dict__)
+        material.params = dict(self.params)
+        return material
+
     def write_matrix(self, camera: OrbitCamera, model: Optional[Matrix44] = None):
         """Write the MVP (model view projection) matrix to the shader."""
 
@@ -55,6 +67,17 @@ class Material:
         if self.pass_model_matrix and model is not None:
             self.shader["model"].write(model)
 
+    @property
+    def instanceable(self) -> bool:
+        """Whether objects with this material can be drawn with instancing."""
+        return (
+            self.shader_name in instanced_shaders
+            and self.pass_model_matrix
+            and not self.pass_mvp
+            and not self.wireframe
+            and not self.draw_bounding_box
+        )
+
     def set_color(self, color: Tuple[float, float, float] = default_color):
         self.color = tuple(color)
         self.params["color"] = self.color
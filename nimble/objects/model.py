@@ -1,4 +1,5 @@
 from __future__ import annotations
+import weakref
 import numpy as np
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 import moderngl_window as mglw
@@ -9,6 +10,7 @@ from nimble.interface.orbit_camera import OrbitCamera
 from nimble.common.models.bounding_box import BoundingBox
 from nimble.objects.material import Material
 from .geometry import Geometry
+from .transform_store import TransformStore
 from nimble.common.shader_manager import Shaders
 from nimble.utils import custom_index
 
@@ -35,6 +37,14 @@ class ModelObserver:
     def component_removed(self, obj: Model, component_id: int) -> None:
         pass
 
+    def color_changed(self, obj: Model) -> None:
+        pass
+
+    def slots_changed(self, obj: Model, component_id: int) -> None:
+        """Called when the slots of a component were changed, other than by
+        the widgets of the component."""
+        pass
+
 
 def to_vec3(v: LikeVector3) -> Vector3:
     if isinstance(v, Vector3):
@@ -61,9 +71,11 @@ class Model:
         self.material = material
         self.name = name
 
-        self.rotation = Vector3((0, 0, 0), dtype="f4")
-        self.position = Vector3((0, 0, 0), dtype="f4")
-        self.scale = Vector3((1, 1, 1), dtype="f4")
+        # The transform lives in a slot of the shared transform store, which is
+        # released once this model is garbage collected
+        self._transforms = TransformStore()
+        self._slot = self._transforms.allocate()
+        weakref.finalize(self, self._transforms.free, self._slot)
 
         if rotation is not None:
             self.rotation = rotation
@@ -72,22 +84,12 @@ class Model:
         if scale is not None:
             self.scale = scale
 
-        self.model_matrix: Optional[Matrix44] = None
-
-        self.bounding_box_world: BoundingBox = None
         self.bounding_box_buffer = None
         self.vbo_vert = None
+        self.verts = None
 
         self.geometry = geometry
 
-        indicies = np.array(
-            [0, 1, 2, 3, 0, 7, 6, 1, 6, 5, 2, 5, 4, 3, 4, 7], dtype="i4"
-        )
-
-        ctx: mgl.Context = mglw.ctx()
-        self.verts = ctx.buffer(indicies)
-        self.transform_changed()
-
         self.observers: Dict[str, ModelObserver] = {}
 
         self.components: List[Component] = []
@@ -97,8 +99,74 @@ class Model:
         self._entity_id = None
         self.active = True
 
+    @property
+    def position(self) -> Vector3:
+        """The position of this model, as a view into the transform store."""
+        return self._transforms.positions[self._slot].view(Vector3)
+
+    @position.setter
+    def position(self, value: LikeVector3):
+        self._transforms.positions[self._slot] = value
+        self._transforms.mark_dirty(self._slot)
+
+    @property
+    def rotation(self) -> Vector3:
+        """The euler angles of this model, as a view into the transform store."""
+        return self._transforms.rotations[self._slot].view(Vector3)
+
+    @rotation.setter
+    def rotation(self, value: LikeVector3):
+        self._transforms.rotations[self._slot] = value
+        self._transforms.mark_dirty(self._slot)
+
+    @property
+    def scale(self) -> Vector3:
+        """The scale of this model, as a view into the transform store."""
+        return self._transforms.scales[self._slot].view(Vector3)
+
+    @scale.setter
+    def scale(self, value: LikeVector3):
+        self._transforms.scales[self._slot] = value
+        self._transforms.mark_dirty(self._slot)
+
+    @property
+    def transform_slot(self) -> int:
+        """The index of this model in the transform store."""
+        return self._slot
+
+    @property
+    def geometry(self) -> Optional[Geometry]:
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry: Optional[Geometry]):
+        self._geometry = geometry
+        self._transforms.set_bounds(
+            self._slot,
+            None if geometry is None else geometry.bounding_box,
+            fixed=geometry is not None and geometry.fixed_bounding_box,
+        )
+
+    @property
+    def model_matrix(self) -> Matrix44:
+        if self._transforms.dirty[self._slot]:
+            self._transforms.update()
+        return self._transforms.matrices[self._slot].view(Matrix44)
+
+    @property
+    def bounding_box_world(self) -> Optional[BoundingBox]:
+        if self._geometry is None:
+            return None
+        if self._transforms.dirty[self._slot]:
+            self._transforms.update()
+        bounds = self._transforms.world_bounds[self._slot]
+        return (bounds[0].view(Vector3), bounds[1].view(Vector3))
+
     def set_active(self, value: bool):
-        self.active = value
+        if value != self.active:
+            self.active = value
+            for component in self.components:
+                component.active_changed(value)
 
     def add_component(self, component: Component) -> int:
         insert_idx = len(self.components)
@@ -109,12 +177,23 @@ class Model:
 
     def remove_component(self, component_id: ComponentId):
         idx = custom_index(self.components, lambda c: c.id == component_id)
+        self.remove_component_at(idx)
 
+    def remove_component_at(self, idx: int):
         del self.components[idx]
 
         for observer in self.observers.values():
             observer.component_removed(self, idx)
 
+    def slots_changed(self, component_idx: int):
+        for observer in self.observers.values():
+            observer.slots_changed(self, component_idx)
+
+    def set_color(self, color: Tuple[float, float, float]):
+        self.material.set_color(color)
+        for observer in self.observers.values():
+            observer.color_changed(self)
+
     def set_name(self, new_name: str):
         self.name = new_name
 
@@ -131,8 +210,7 @@ class Model:
         self.observers = {}
 
     def update_bounding_render(self):
-        i = self.bounding_box_world[0]
-        a = self.bounding_box_world[1]
+        i, a = self.bounding_box_world
 
         # fmt: off
         verts = np.array([
@@ -148,6 +226,12 @@ class Model:
         # fmt: on
 
         ctx: mgl.Context = mglw.ctx()
+        if self.verts is None:
+            indicies = np.array(
+                [0, 1, 2, 3, 0, 7, 6, 1, 6, 5, 2, 5, 4, 3, 4, 7], dtype="i4"
+            )
+            self.verts = ctx.buffer(indicies)
+
         if self.vbo_vert is None:
             self.vbo_vert = ctx.buffer(verts)
         else:
@@ -201,21 +285,14 @@ class Model:
         self.transform_changed()
 
     def transform_changed(self):
-        # Recalculate model matrix
-        self.model_matrix = (
-            Matrix44.from_translation(self.position, dtype="f4")
-            * Matrix44.from_eulers(self.rotation[[0, 2, 1]], dtype="f4")
-            * Matrix44.from_scale(self.scale, dtype="f4")
-        )
+        # The model matrix and bounding box are recalculated lazily, together
+        # with every other changed model
+        self._transforms.mark_dirty(self._slot)
 
-        if self.geometry is not None:
-            # Recalculate bounding box
-            self.bounding_box_world = self.geometry.get_world_bounding_box(
-                self.model_matrix
-            )
+    def render(self, camera: OrbitCamera):
+        if self.material.draw_bounding_box and self.geometry is not None:
             self.update_bounding_render()
 
-    def render(self, camera: OrbitCamera):
         self.material.render(
             camera, self.geometry, self.model_matrix, self.bounding_box_buffer
         )
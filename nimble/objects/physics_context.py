@@ -0,0 +1,62 @@
+"""A pybullet physics server that isn't shared with the rest of the process."""
+
+from functools import partial
+from typing import Any
+
+import pybullet
+
+
+class PhysicsContext:
+    """A connection to a pybullet physics server, which can be used in place
+    of the `pybullet` module.
+
+    Module level pybullet calls go to the most recently connected server, so
+    two simulations in the same process would share it. Functions looked up
+    on a context get the context's `physicsClientId` passed in, and constants
+    are returned as is, so `physics.createCollisionShape(physics.GEOM_BOX, ...)`
+    always goes to this context's server.
+
+    Every context owns its own server, and `DIRECT` servers run inside the
+    calling process, so separate processes (e.g. headless playtests started
+    with `multiprocessing`) each get independent simulations.
+    """
+
+    def __init__(self, mode: int = pybullet.DIRECT):
+        self.client = pybullet.connect(mode)
+        if self.client < 0:
+            raise RuntimeError("Could not connect to a physics server")
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that aren't set on the instance yet, so every
+        # function is only bound to the client once
+        attr = getattr(pybullet, name)
+        if callable(attr):
+            if name == "connect":
+                raise AttributeError("A physics context is already connected")
+            attr = partial(attr, physicsClientId=self.client)
+            setattr(self, name, attr)
+        return attr
+
+    @property
+    def connected(self) -> bool:
+        return self.client >= 0 and bool(
+            pybullet.isConnected(physicsClientId=self.client)
+        )
+
+    def disconnect(self):
+        """Shut down the physics server. Does nothing if it is already shut
+        down."""
+        if self.connected:
+            pybullet.disconnect(physicsClientId=self.client)
+        self.client = -1
+
+        # pybullet reuses client ids, so forget the functions bound to this one
+        for name, attr in list(vars(self).items()):
+            if isinstance(attr, partial):
+                delattr(self, name)
+
+    def __enter__(self) -> "PhysicsContext":
+        return self
+
+    def __exit__(self, *_):
+        self.disconnect()
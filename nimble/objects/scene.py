@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Any, List, Optional, Dict, Tuple
+import numpy as np
 from PyQt5 import QtCore
 
 from PyQt5.QtCore import QAbstractListModel, Qt
@@ -12,7 +13,19 @@ from pyrr import Vector3
 from nimble.common.event_listener import InputObserver
 from nimble.common.models.size import Size
 import nimble.common.models.ray_cast as ray_cast
-from nimble.objects import Cube, Plane, Ray, Material, Model, ModelObserver
+from nimble.common.models.bvh import BVH
+from nimble.objects import (
+    Cube,
+    GeometryCache,
+    Plane,
+    Ray,
+    Material,
+    Model,
+    ModelObserver,
+)
+from nimble.objects.instancing import InstancedRenderer
+from nimble.objects.journal import CommandJournal
+from nimble.objects.transform_store import TransformStore
 
 
 class SceneObserver:
@@ -40,13 +53,24 @@ class Scene(InputObserver, QAbstractListModel):
         self.observers: List[SceneObserver] = []
         self.active_obj_observers: Dict[str, ModelObserver] = {}
 
+        self.renderer = InstancedRenderer()
+
+        # Used to pick objects with rays, rebuilt when objects are added or
+        # deleted (and refit when they move)
+        self.bvh = BVH()
+        self.bvh_indices: Dict[int, int] = {}
+        self.bvh_outdated = True
+
+        # The changes made in the editor, to undo them
+        self.journal = CommandJournal(self)
+
     @classmethod
     def default_scene(cls):
         """Create a default scene, with a cube and a plane."""
         scene = cls()
         cube = Model(
             Material("viewport"),
-            geometry=Cube(),
+            geometry=GeometryCache().get(Cube),
             name="Cube",
             position=Vector3((0, 0.5, 0)),
         )
@@ -54,7 +78,7 @@ class Scene(InputObserver, QAbstractListModel):
         scene.add_obj(
             Model(
                 Material("viewport"),
-                geometry=Plane(),
+                geometry=GeometryCache().get(Plane),
                 name="Plane",
                 scale=Vector3((7, 1, 7)),
                 position=Vector3((0, -0.001, 0)),
@@ -71,15 +95,25 @@ class Scene(InputObserver, QAbstractListModel):
                 observer.obj_deleted(i)
 
         # Delete all objects
+        self.release()
         self.objects = new_model.objects
         self.objects_list = new_model.objects_list
         self.active_idx = new_model.active_idx
+        self.bvh_outdated = True
+        self.journal.clear()
 
         self.emit_changed(0, len(self.objects_list))
 
         for observer in self.observers:
             observer.select_changed(self.active_idx, self.get_active())
 
+    def release(self):
+        """Release the GPU resources used by the objects in this scene."""
+        for obj in self.objects.values():
+            if obj.geometry is not None:
+                GeometryCache().release(obj.geometry)
+        self.renderer.release()
+
     def register_observer(self, observer: SceneObserver):
         self.observers.append(observer)
 
@@ -91,7 +125,7 @@ class Scene(InputObserver, QAbstractListModel):
 
     def set_active(self, idx: int):
         """Change the active object to the object at the given index."""
-        old_obj = self.get_actikve()
+        old_obj = self.get_active()
         new_obj = self.get_obj_from_idx(idx)
 
         if old_obj is not new_obj:
@@ -136,9 +170,10 @@ class Scene(InputObserver, QAbstractListModel):
                 self.active_idx = -1
             elif idx < self.active_idx:
                 self.active_idx -= 1
-            self.objects[self.objects_list[idx]].geometry.vao.release()
+            GeometryCache().release(self.objects[self.objects_list[idx]].geometry)
             del self.objects[self.objects_list[idx]]
             del self.objects_list[idx]
+            self.bvh_outdated = True
             self.emit_changed(idx)
 
             for observer in self.observers:
@@ -159,15 +194,23 @@ class Scene(InputObserver, QAbstractListModel):
         if self.active in self.objects:
             return self.objects[self.active]
 
-    def add_obj(self, obj: Model) -> int:
-        """Add an object to the scene, and return the index it was inserted at."""
+    def add_obj(self, obj: Model, idx: Optional[int] = None) -> int:
+        """Add an object to the scene (at the end, or at the given index), and
+        return the index it was inserted at."""
         name = obj.name
         object_name = name if name not in self.objects else self.get_new_name(name)
         obj.set_name(object_name)
         self.objects[object_name] = obj
-        idx = len(self.objects_list)
-        self.objects_list.append(object_name)
-        self.emit_changed(idx)
+        if idx is None or idx >= len(self.objects_list):
+            idx = len(self.objects_list)
+            self.objects_list.append(object_name)
+            self.emit_changed(idx)
+        else:
+            self.objects_list.insert(idx, object_name)
+            if idx <= self.active_idx:
+                self.active_idx += 1
+            self.emit_changed(idx, len(self.objects_list))
+        self.bvh_outdated = True
         return idx
 
     def emit_changed(self, start: int, end: Optional[int] = None):
@@ -196,9 +239,13 @@ class Scene(InputObserver, QAbstractListModel):
     ) -> None:
         """Render the scene to a `screen`, and the active object (if any) to
         the `active_fbo`."""
-        for obj in self.objects.values():
-            if obj.active:
-                obj.render(camera)
+        # Recalculate every changed model matrix in one go
+        TransformStore().update()
+
+        # Objects that share a geometry and shader are drawn in one call
+        self.renderer.render(
+            camera, (obj for obj in self.objects.values() if obj.active)
+        )
         active_fbo.clear()
         active = self.get_active()
         if active:
@@ -206,23 +253,44 @@ class Scene(InputObserver, QAbstractListModel):
             active.render(camera)
         screen.use()
 
-    def cast_ray(self, ray: Ray) -> Optional[Tuple[str, int]]:
+    def update_bvh(self):
+        """Rebuild the BVH if objects were added or deleted, otherwise refit it
+        around the objects that moved."""
+        if not self.bvh_outdated:
+            self.bvh.refit()
+            return
+
+        self.bvh_outdated = False
+        models = [self.objects[name] for name in self.objects_list]
+        # Maps slots in the transform store back to indices in `objects_list`
+        self.bvh_indices = {
+            model.transform_slot: i
+            for i, model in enumerate(models)
+            if model.geometry is not None
+        }
+        self.bvh.build(np.fromiter(self.bvh_indices, dtype=np.intp))
+
+    def cast_ray_all(self, ray: ray_cast.Ray) -> List[Tuple[str, int, float]]:
+        """Cast a ray into the scene, and return the name, index and distance
+        of every object it hit, sorted by distance."""
+        self.update_bvh()
+        slots, near, _ = self.bvh.intersect(ray)
+        indices = np.fromiter(
+            (self.bvh_indices[slot] for slot in slots), dtype=np.intp, count=len(slots)
+        )
+        # Objects at the same distance are sorted in the order of the scene
+        order = np.lexsort((indices, near))
+        return [
+            (self.objects_list[indices[i]], int(indices[i]), float(near[i]))
+            for i in order
+        ]
+
+    def cast_ray(self, ray: ray_cast.Ray) -> Optional[Tuple[str, int]]:
         """Cast a ray into the scene, and return the name and the index of the
         object it hit."""
-        min_dist = float("inf")
-        min_dist_obj = None
-        for i, obj_str in enumerate(self.objects_list):
-            obj = self.objects[obj_str]
-            dist = ray_cast.ray_intersect(
-                obj.bounding_box_world,
-                ray,
-            )
-            if dist is not None:
-                if dist[0] < min_dist:
-                    min_dist_obj = (obj_str, i)
-                    min_dist = dist[0]
-
-        return min_dist_obj
+        hits = self.cast_ray_all(ray)
+        if hits:
+            return hits[0][:2]
 
     def mouse_pressed(self, event: QtGui.QMouseEvent, size: Size):
         if event.button() == Qt.LeftButton:
@@ -235,7 +303,7 @@ class Scene(InputObserver, QAbstractListModel):
 
     def key_pressed(self, event: QtGui.QKeyEvent, size: Size):
         if event.key() == Qt.Key_Delete:
-            self.delete_obj(self.active_idx)
+            self.journal.delete_obj(self.active_idx)
 
     def rowCount(self, parent: QtCore.QModelIndex) -> int:
         return len(self.objects_list)
@@ -0,0 +1,105 @@
+"""Snapshots of scenes, for copying them without serializing them."""
+
+from __future__ import annotations
+from typing import Any, List, Tuple, Type
+import numpy as np
+
+from nimble.objects.component import Component
+from nimble.objects.geometry import GeometryCache
+from nimble.objects.material import Material
+from nimble.objects.model import Model
+from nimble.objects.scene import Scene
+from nimble.objects.transform_store import TransformStore
+from nimble.utils import gc_paused
+
+
+class _ModelState:
+    __slots__ = ("name", "material", "geometry", "active", "components")
+
+    def __init__(self, model: Model):
+        self.name = model.name
+        self.material = model.material.copy()
+        self.geometry = model.geometry
+        self.active = model.active
+        # The class, id and slot values of every component
+        self.components: List[Tuple[Type[Component], Any, List[Any]]] = [
+            (
+                type(component),
+                component._id,
+                [slot.get_jsonable() for slot in component.slots()],
+            )
+            for component in model.components
+        ]
+
+
+class SceneSnapshot:
+    """The state of a scene at one point in time, which can be turned into
+    any number of copies of the scene with `instantiate`.
+
+    Transforms are copied out of (and back into) the transform store as whole
+    arrays. Materials and components are copied, but the copies share the
+    GPU resources of the original scene: materials keep using the same
+    shaders, and geometries are shared through the `GeometryCache`, so a
+    copy doesn't upload any buffers. Releasing a copy only releases its
+    references to them.
+
+    This is much cheaper than a round trip through `serialize_scene` and
+    `unserialize_scene`, which is how the game used to get its copy of the
+    scene.
+
+    Geometries aren't referenced by the snapshot itself, so it has to be
+    instantiated while they are still used by the original scene.
+    """
+
+    def __init__(self, scene: Scene):
+        models = list(scene.objects.values())
+        self.names = list(scene.objects.keys())
+        self.objects_list = list(scene.objects_list)
+        self.active_idx = scene.active_idx
+        self.models = [_ModelState(model) for model in models]
+
+        store = TransformStore()
+        slots = np.array([model.transform_slot for model in models], dtype=np.intp)
+        # Indexing with an array copies
+        self.positions = store.positions[slots]
+        self.rotations = store.rotations[slots]
+        self.scales = store.scales[slots]
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def instantiate(self) -> Scene:
+        """Create a new scene with the state of this snapshot. Call `release`
+        on it once it isn't needed anymore."""
+        scene = Scene()
+        cache = GeometryCache()
+        with gc_paused():
+            models = [self._create_model(state, cache) for state in self.models]
+
+        # The slots are only known once every model was created (and the
+        # store might have grown in between)
+        store = TransformStore()
+        slots = np.array([model.transform_slot for model in models], dtype=np.intp)
+        store.positions[slots] = self.positions
+        store.rotations[slots] = self.rotations
+        store.scales[slots] = self.scales
+        store.mark_dirty(slots)
+
+        scene.objects = dict(zip(self.names, models))
+        scene.objects_list = list(self.objects_list)
+        scene.active_idx = self.active_idx
+        return scene
+
+    @staticmethod
+    def _create_model(state: _ModelState, cache: GeometryCache) -> Model:
+        model = Model(
+            state.material.copy(),
+            geometry=None if state.geometry is None else cache.acquire(state.geometry),
+            name=state.name,
+        )
+        model.active = state.active
+        for (component_class, _id, values) in state.components:
+            model.add_component(
+                component_class(model=model, _id=_id, slot_params=list(values))
+            )
+        return model
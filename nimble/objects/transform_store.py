@@ -0,0 +1,251 @@
+"""Struct-of-arrays storage for the transforms of every model."""
+
+from typing import Any, List, Tuple, Union
+import numpy as np
+
+from nimble.common.singleton import Singleton
+
+
+# Which corner of a bounding box takes the max (1) or min (0) on each axis
+_CORNERS = np.array(
+    [[(i >> axis) & 1 for axis in range(3)] for i in range(8)], dtype=bool
+)
+_IDENTITY = np.eye(4, dtype="f4")
+
+class _Chunk:
+    """A block of consecutive slots, starting at `start`. Its arrays are never
+    reallocated, so views into them stay valid."""
+
+    def __init__(self, start: int, capacity: int):
+        self.start = start
+        self.positions = np.zeros((capacity, 3), dtype="f4")
+        self.rotations = np.zeros((capacity, 3), dtype="f4")
+        self.scales = np.ones((capacity, 3), dtype="f4")
+
+        self.matrices = np.tile(np.eye(4, dtype="f4"), (capacity, 1, 1))
+        self.local_bounds = np.zeros((capacity, 2, 3), dtype="f4")
+        self.world_bounds = np.zeros((capacity, 2, 3), dtype="f4")
+        # Slots without a geometry have no bounding box
+        self.has_bounds = np.zeros(capacity, dtype=bool)
+        # Bounding boxes that don't rotate with the model (e.g. spheres)
+        self.fixed_bounds = np.zeros(capacity, dtype=bool)
+        self.dirty = np.zeros(capacity, dtype=bool)
+        # Incremented every time a slot is recalculated, so that other
+        # structures (e.g. the scene's BVH) can tell which slots moved
+        self.versions = np.zeros(capacity, dtype=np.uint32)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def update(self):
+        idx = np.flatnonzero(self.dirty)
+        if len(idx) == 0:
+            return
+        self.dirty[idx] = False
+        self.versions[idx] += 1
+
+        # Same as Matrix44.from_eulers(rotation[[0, 2, 1]]), for every slot
+        rotation = self.rotations[idx]
+        s_r, s_y, s_p = np.sin(rotation).T
+        c_r, c_y, c_p = np.cos(rotation).T
+
+        linear = np.empty((len(idx), 3, 3), dtype="f4")
+        linear[:, 0, 0] = c_y * c_p
+        linear[:, 0, 1] = -c_y * s_p * c_r + s_y * s_r
+        linear[:, 0, 2] = c_y * s_p * s_r + s_y * c_r
+        linear[:, 1, 0] = s_p
+        linear[:, 1, 1] = c_p * c_r
+        linear[:, 1, 2] = -c_p * s_r
+        linear[:, 2, 0] = -s_y * c_p
+        linear[:, 2, 1] = s_y * s_p * c_r + c_y * s_r
+        linear[:, 2, 2] = -s_y * s_p * s_r + c_y * c_r
+
+        # Scale, then rotate, then translate (row vectors, like pyrr)
+        scale = self.scales[idx]
+        linear *= scale[:, :, np.newaxis]
+        translation = self.positions[idx]
+        self.matrices[idx, :3, :3] = linear
+        self.matrices[idx, 3, :3] = translation
+
+        bounded = self.has_bounds[idx]
+        if not bounded.any():
+            return
+
+        idx = idx[bounded]
+        linear = linear[bounded]
+        translation = translation[bounded]
+
+        # Fixed bounding boxes ignore the rotation
+        fixed = self.fixed_bounds[idx]
+        if fixed.any():
+            linear[fixed] = np.abs(scale[bounded][fixed])[:, :, np.newaxis] * np.eye(
+                3, dtype="f4"
+            )
+
+        local = self.local_bounds[idx]
+        corners = np.where(_CORNERS, local[:, np.newaxis, 1], local[:, np.newaxis, 0])
+        world = np.einsum("nij,njk->nik", corners, linear)
+        world += translation[:, np.newaxis, :]
+
+        self.world_bounds[idx, 0] = world.min(axis=1)
+        self.world_bounds[idx, 1] = world.max(axis=1)
+
+
+class _Column:
+    """One of the arrays of the store (e.g. `positions`), indexed by slot
+    across its chunks.
+
+    Indexing with one slot gives a view of its row, like a numpy array; an
+    array of slots gives a copy of their rows, in the same shape.
+    """
+
+    def __init__(self, store: "TransformStore", name: str):
+        self.store = store
+        self.name = name
+
+    def __getitem__(self, slots: Any) -> Any:
+        if isinstance(slots, (int, np.integer)):
+            chunk, offset = self.store._locate(slots)
+            return getattr(chunk, self.name)[offset]
+
+        slots = np.asarray(slots, dtype=np.intp)
+        chunks = self.store._chunks
+        if len(chunks) == 1:
+            return getattr(chunks[0], self.name)[slots]
+
+        first = getattr(chunks[0], self.name)
+        out = np.empty(slots.shape + first.shape[1:], dtype=first.dtype)
+        for (chunk, mask) in self.store._split(slots):
+            out[mask] = getattr(chunk, self.name)[slots[mask] - chunk.start]
+        return out
+
+    def __setitem__(self, slots: Any, value: Any):
+        if isinstance(slots, (int, np.integer)):
+            chunk, offset = self.store._locate(slots)
+            getattr(chunk, self.name)[offset] = value
+            return
+
+        slots = np.asarray(slots, dtype=np.intp)
+        chunks = self.store._chunks
+        if len(chunks) == 1:
+            getattr(chunks[0], self.name)[slots] = value
+            return
+
+        first = getattr(chunks[0], self.name)
+        value = np.broadcast_to(
+            np.asarray(value, dtype=first.dtype), slots.shape + first.shape[1:]
+        )
+        for (chunk, mask) in self.store._split(slots):
+            getattr(chunk, self.name)[slots[mask] - chunk.start] = value[mask]
+
+
+class TransformStore(metaclass=Singleton):
+    """A store for the positions, rotations (euler angles) and scales of
+    models, kept in (N, 3) arrays.
+
+    The arrays are split into chunks, which are never reallocated: when the
+    store is full, it adds a chunk as big as itself. So the row of a slot
+    (e.g. `positions[slot]`, a view) stays valid for as long as its model
+    exists. Each array (see `_Column`) is indexed by slot like a numpy array.
+
+    Changing a transform only marks its slot as dirty. The model matrices and
+    world space bounding boxes of all dirty slots are then recomputed together
+    in one vectorized pass by `update`, which runs once per frame (or earlier,
+    whenever a dirty matrix or bounding box is read).
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._size = 0
+        self._free: List[int] = []
+        self._any_dirty = False
+        self._chunks = [_Chunk(0, capacity)]
+        self._starts = np.array([0], dtype=np.intp)
+
+        self.positions = _Column(self, "positions")
+        self.rotations = _Column(self, "rotations")
+        self.scales = _Column(self, "scales")
+        self.matrices = _Column(self, "matrices")
+        self.local_bounds = _Column(self, "local_bounds")
+        self.world_bounds = _Column(self, "world_bounds")
+        self.has_bounds = _Column(self, "has_bounds")
+        self.fixed_bounds = _Column(self, "fixed_bounds")
+        self.dirty = _Column(self, "dirty")
+        self.versions = _Column(self, "versions")
+
+    @property
+    def capacity(self) -> int:
+        last = self._chunks[-1]
+        return last.start + len(last)
+
+    def _grow(self):
+        # Add a chunk as big as the store so far, instead of moving the rows
+        # that are in use
+        capacity = self.capacity
+        self._chunks.append(_Chunk(capacity, capacity))
+        self._starts = np.append(self._starts, capacity)
+
+    def _locate(self, slot: int) -> Tuple[_Chunk, int]:
+        """The chunk of a slot, and its index in the chunk."""
+        # Every chunk after the first doubles the capacity
+        chunk = self._chunks[(int(slot) // len(self._chunks[0])).bit_length()]
+        return chunk, slot - chunk.start
+
+    def _split(self, slots: np.ndarray):
+        """The chunks of an array of slots, each with a mask of its slots."""
+        which = np.searchsorted(self._starts, slots, "right") - 1
+        for i in np.unique(which):
+            yield self._chunks[i], which == i
+
+    def allocate(self) -> int:
+        """Reserve a slot with an identity transform, and return its index."""
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._size == self.capacity:
+                self._grow()
+            slot = self._size
+            self._size += 1
+
+        chunk, offset = self._locate(slot)
+        chunk.positions[offset] = 0
+        chunk.rotations[offset] = 0
+        chunk.scales[offset] = 1
+        chunk.matrices[offset] = _IDENTITY
+        chunk.has_bounds[offset] = False
+        chunk.fixed_bounds[offset] = False
+        self.mark_dirty(slot)
+        return slot
+
+    def free(self, slot: int):
+        """Give a slot back to the store, so it can be reused."""
+        self.dirty[slot] = False
+        self.has_bounds[slot] = False
+        self._free.append(slot)
+
+    def mark_dirty(self, slot: Union[int, np.ndarray]):
+        """Mark one slot (or an array of slots) to be recalculated."""
+        self.dirty[slot] = True
+        self._any_dirty = True
+
+    def set_bounds(self, slot: int, bounds, fixed: bool = False):
+        """Set the local (model space) bounding box of a slot. `fixed` bounding
+        boxes are only scaled and translated, never rotated."""
+        chunk, offset = self._locate(slot)
+        if bounds is None:
+            chunk.has_bounds[offset] = False
+        else:
+            chunk.local_bounds[offset, 0] = bounds[0]
+            chunk.local_bounds[offset, 1] = bounds[1]
+            chunk.has_bounds[offset] = True
+            chunk.fixed_bounds[offset] = fixed
+        self.mark_dirty(slot)
+
+    def update(self):
+        """Recalculate the model matrix and world bounding box of every dirty
+        slot."""
+        if not self._any_dirty:
+            return
+
+        self._any_dirty = False
+        for chunk in self._chunks:
+            chunk.update()
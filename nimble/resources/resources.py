@@ -27566,43 +27566,46 @@ qt_resource_data = b"\
 \x3e\x0d\x0a\x20\x20\x3c\x2f\x63\x6f\x6e\x6e\x65\x63\x74\x69\x6f\
 \x6e\x3e\x0d\x0a\x20\x3c\x2f\x63\x6f\x6e\x6e\x65\x63\x74\x69\x6f\
 \x6e\x73\x3e\x0d\x0a\x3c\x2f\x75\x69\x3e\x0d\x0a\
-\x00\x00\x02\x28\
+\x00\x00\x02\x52\
 \x00\
-\x00\x0a\xc4\x78\x9c\xad\x56\xcb\x6e\xdb\x30\x10\xbc\x17\xe8\x3f\
-\x10\xba\x16\x35\xdd\x22\x28\x72\xa0\x15\xa0\x46\x73\x6a\xfa\x48\
-\xd2\xe6\x18\xb0\xd2\xc2\x26\x20\x93\x02\x49\xc5\xd6\xdf\x97\x0f\
-\xc9\x92\xf5\x64\x62\x9f\x2c\x2e\x67\x77\x66\x87\x5c\xc2\xe4\xe6\
-\xb0\xcb\xd0\x0b\x48\xc5\x04\x5f\x45\x9f\x16\xcb\x08\x01\x4f\x44\
-\xca\xf8\x66\x15\xfd\x79\xbc\xfd\x78\x1d\xdd\xc4\xef\xdf\x91\x82\
-\x35\xa8\x2b\x83\x32\x31\x44\x92\x8c\x2a\x15\xdf\x51\xc6\x9f\x18\
-\x4f\xc5\x9e\x60\x1f\xb1\x7b\x7b\x96\x6e\x40\x23\x17\x58\x45\xbf\
-\x1b\x50\x84\x38\xdd\xc1\x2a\x6a\x45\x6c\x02\x22\xb9\x14\x39\x48\
-\x5d\x56\xfb\x1b\x10\x3b\xd0\xb2\xf4\xbb\x88\x48\x48\xb4\xff\x44\
-\xe4\x10\x2f\x09\x3e\xd4\xab\xd2\xae\xca\x7a\x65\x88\xf5\x36\xbe\
-\x5e\x9a\x98\xff\xac\xe2\x5b\x60\x9b\xad\x8e\xbf\xd8\x8d\xea\xdb\
-\x17\xc6\xc7\xca\x04\xd7\x1a\x06\x15\xed\x9d\xda\x47\xa6\x33\xa8\
-\x45\x29\x2d\x8d\x53\x27\x16\x54\xa1\xa1\x7a\x1d\x4f\x9e\xdc\xb2\
-\xf6\x23\x01\xae\x25\xcd\x3c\x26\xc2\x83\x19\x77\xc0\x8b\xaf\x54\
-\xd6\x29\x3b\xb3\xfc\x67\x96\x95\x98\x69\x03\x4f\x1c\xec\x58\xd8\
-\xf1\x70\xd4\xc4\xa3\x8b\x9f\xaf\x4e\x4d\x6c\xbb\xd8\x6d\x7b\xb0\
-\x8b\x76\x0b\xed\x5b\xd0\x6f\x43\xb7\xfc\x6e\x1c\x1f\x70\xbb\x4f\
-\x8c\x08\x4d\x53\x9a\x68\x73\x6b\xab\x62\x7e\x71\x0f\x0a\xf4\xf3\
-\x77\x5a\x8a\xa2\x76\x7a\x14\xfb\x40\x5f\x60\x16\xaa\x20\xa7\x92\
-\x6a\x21\x6b\x88\xb3\xcd\xf4\x1c\x66\xc0\x2d\x6b\x3a\x0c\x6b\xdf\
-\x66\xcc\x36\x3f\xc3\xfa\x33\x07\xfe\x7c\x0f\xf6\xde\x35\xf5\x27\
-\xd9\x8f\xf4\x36\x15\xf9\xd4\x8e\x8a\xbe\x8c\x00\xb7\x3a\x76\x8d\
-\x1d\xc5\x0f\xd8\x87\x9c\xd6\x1c\xc6\x8a\x1f\xc7\x74\x9d\x79\xd3\
-\x81\x7e\x4b\x99\x7e\xdd\x81\xda\x8c\x37\xde\xe6\xb5\xc8\xcb\xb9\
-\x9e\x7f\x51\xa5\x61\xa4\x97\x21\x07\xdc\x8d\xc4\x13\x00\xd7\xe1\
-\x14\xa0\x1a\xea\xea\x1d\x6b\x33\x92\xb9\x89\x1c\x7e\xce\x34\x1c\
-\x1a\x4f\x2b\xa3\x5c\x1a\xf2\x69\xa7\xee\x75\x9f\x5e\xec\x79\x46\
-\x05\xb4\xc7\x3c\x9c\xdf\x66\x5d\x84\xde\x5e\xed\x70\x5a\x83\x5e\
-\x2c\x16\xe7\x31\xba\x29\x08\xa7\xb4\xf0\xb3\x39\xdd\x74\xbe\xce\
-\xdd\x49\xc2\x5e\x15\xb5\x15\x52\x27\x45\xaf\xd2\x5a\xcb\xec\xc3\
-\xc3\x79\xe2\xdd\x98\x85\x8b\xb7\xf0\x0b\x8a\x5f\x9f\x27\xde\xcf\
-\x7f\xb8\x7a\x87\xbf\xa0\xfc\xbf\xc1\xf2\xdb\x4f\x85\xf9\xc7\xa2\
-\x44\x21\x13\x50\xd8\xff\xdf\x14\x9c\x83\x43\xba\x00\xc1\x05\x33\
-\x3f\xff\x01\x57\x2b\x4c\x97\
+\x00\x0c\xaf\x78\x9c\xad\x57\xc9\x6e\xdb\x30\x10\xbd\x17\xe8\x3f\
+\x10\xba\x16\xb5\xdc\x22\x28\x72\xa0\x15\x20\x46\x73\x6a\xba\xd8\
+\x59\x80\x5e\x02\x56\x9a\x58\x04\x64\x52\xa0\xa8\xd8\xfa\xfb\x72\
+\x91\x2c\x59\xbb\x23\x9d\xa2\x19\xbe\x99\x79\xf3\x86\x1c\x38\xf8\
+\xe6\xb8\x8f\xd0\x1b\x88\x84\x72\xb6\x72\xbe\x2c\x96\x0e\x02\xe6\
+\xf3\x80\xb2\xdd\xca\x79\x7c\xb8\xfb\x7c\xed\xdc\x78\x1f\x3f\xe0\
+\x94\x96\xa8\x2b\x85\x52\x3e\x84\xfd\x88\x24\x89\x77\x4f\x28\x7b\
+\xa6\x2c\xe0\x07\xec\x5a\x8f\x3e\x3b\xd0\x60\x07\x12\x19\xc7\xca\
+\xf9\x53\x82\x1c\xc4\xc8\x1e\x56\x4e\xc5\xa3\x03\x10\x8e\x05\x8f\
+\x41\xc8\x2c\x3f\xdf\x01\xdf\x83\x14\x99\x3d\x45\x58\x80\x2f\xed\
+\x27\xc2\x47\x6f\x89\xdd\x63\x61\x65\xda\xca\x0a\x4b\x15\x96\xa1\
+\x77\xbd\x54\x3e\xfb\x99\xfb\x43\xa0\xbb\x50\x7a\xdf\xf4\x41\xfe\
+\x6d\x13\xbb\xa7\xcc\xd8\x2d\x38\xb4\x32\x3a\x18\xb6\x0f\x54\x46\
+\x50\x90\x4a\xa4\x50\x4a\x9d\x49\x90\xbb\xda\xf2\xd5\x34\x79\x36\
+\x66\xa1\x87\x0f\x4c\x0a\x12\x59\x8c\xe3\xb6\x46\xdc\x03\x4b\x6f\
+\x89\x28\x42\xf6\xca\xfc\xa7\xcc\x9c\x4c\xbf\x80\x67\x0a\xd6\x24\
+\xac\x69\xd8\x29\xe2\x49\xc5\xaf\x57\xe7\x22\x56\x55\xac\xb7\xdd\
+\xda\x45\xb5\x85\xea\x2d\x68\xb6\x21\x2b\x7a\x97\x8a\xb7\xa8\xdd\
+\x2c\x8c\x30\x09\x02\xe2\x4b\x75\x6b\xf3\x64\xd6\xd8\x40\x02\xf2\
+\xe5\x07\xc9\x78\x5a\x28\xdd\x89\xdd\x92\x37\x18\x84\x26\x10\x13\
+\x41\x24\x17\x05\xc4\xc8\xa6\x7a\x1e\x27\xc0\x1d\x2d\x3b\x1c\xd7\
+\xbe\x8e\x18\x6c\x7e\xa0\xea\xaf\x18\xd8\xcb\x06\xf4\xbd\x2b\xf3\
+\xf7\x56\x3f\x95\xd7\xa1\xc8\x86\xd6\x58\x34\x69\x8c\x50\xab\x26\
+\x57\xd7\x28\x7e\xc2\x61\xcc\xb4\x86\x30\x9a\x7c\x37\xa6\xae\xcc\
+\xbb\x06\xfa\x3d\xa0\xf2\xb2\x81\xea\x88\x77\xde\xe6\x47\xf5\x12\
+\x86\x7a\xde\x40\x1f\xa6\x65\x20\xed\x69\xd6\x3c\xce\x86\x30\xbf\
+\x49\x22\xa1\x43\xb6\x36\xb1\xcd\xe5\x77\x7b\x00\x46\xcc\x3e\x40\
+\xbe\x3f\xf2\x95\x59\xad\x88\x87\x1e\x7f\xfb\xe6\x94\x70\x2c\xc7\
+\x97\xcf\xc4\x84\x21\x1b\x76\x3e\xa8\xfa\x96\x77\x6d\x9d\x4e\x02\
+\xd5\x8d\x32\xbe\xbe\x8e\x9a\xa5\xbc\x7e\x45\xe3\xcb\x2a\xf4\x62\
+\xb1\x98\x56\xd1\x3c\xb8\xf1\x25\x35\x7c\x72\x4d\xb3\x08\x2e\x53\
+\xb7\xb7\x60\x23\x4b\x12\x72\x21\xfd\xb4\x91\x69\x2d\x45\xf4\x69\
+\x3b\x8d\xbc\x79\x66\xe3\xc9\x6b\xf8\x8c\xe4\xd7\xd3\xc8\xdb\xf7\
+\x3f\x9e\xbd\xc1\xcf\x48\xff\x69\x1a\x7d\xb3\x4d\xc7\xb3\xd7\xf0\
+\x19\xc9\xff\x9d\x46\xde\xac\xf9\x4b\x76\xda\xac\xe4\xb7\x21\x7d\
+\x95\x17\xb4\x50\x5d\xd5\xea\xc7\x69\xc2\x53\xe1\x43\xe2\xda\x7f\
+\x2d\x38\x63\x60\x90\xc6\x81\xdd\x94\xaa\x3f\xff\x01\x23\x71\xe5\
+\x4c\
 \x00\x00\x05\xb6\
 \x3c\
 \x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
@@ -28435,7 +28438,7 @@ qt_resource_data = b"\
 \x20\x20\x20\x66\x72\x61\x67\x5f\x63\x6f\x6c\x6f\x72\x2e\x77\x20\
 \x3d\x20\x31\x2e\x30\x3b\x0d\x0a\x7d\x20\x0d\x0a\x0d\x0a\x23\x65\
 \x6e\x64\x69\x66\x0d\x0a\
-\x00\x00\x07\xea\
+\x00\x00\x07\xec\
 \x23\
 \x76\x65\x72\x73\x69\x6f\x6e\x20\x33\x33\x30\x20\x63\x6f\x72\x65\
 \x0d\x0a\x0d\x0a\x23\x69\x66\x20\x64\x65\x66\x69\x6e\x65\x64\x20\
@@ -28512,58 +28515,58 @@ qt_resource_data = b"\
 \x61\x67\x5f\x75\x76\x2c\x20\x67\x72\x69\x64\x5f\x73\x71\x75\x61\
 \x72\x65\x5f\x73\x69\x7a\x65\x20\x2a\x20\x72\x61\x64\x69\x75\x73\
 \x5f\x74\x6f\x5f\x6f\x72\x69\x67\x69\x6e\x61\x6c\x29\x3b\x0d\x0a\
-\x20\x20\x20\x20\x2f\x2f\x20\x4d\x61\x6b\x65\x20\x6c\x61\x72\x67\
-\x65\x72\x20\x67\x72\x69\x64\x20\x6d\x6f\x72\x65\x20\x62\x6f\x6c\
-\x64\x20\x62\x61\x73\x65\x64\x20\x6f\x6e\x20\x7a\x6f\x6f\x6d\x67\
-\x72\x69\x64\x0d\x0a\x20\x20\x20\x20\x62\x69\x67\x67\x65\x72\x5f\
-\x63\x6f\x6c\x6f\x72\x2e\x77\x20\x2a\x3d\x20\x28\x31\x20\x2b\x20\
-\x7a\x6f\x6f\x6d\x5f\x73\x65\x67\x6d\x65\x6e\x74\x5f\x70\x65\x72\
-\x63\x65\x6e\x74\x61\x67\x65\x29\x3b\x0d\x0a\x0d\x0a\x20\x20\x20\
-\x20\x76\x65\x63\x34\x20\x73\x6d\x61\x6c\x6c\x65\x72\x5f\x63\x6f\
-\x6c\x6f\x72\x20\x3d\x20\x67\x72\x69\x64\x28\x66\x72\x61\x67\x5f\
-\x75\x76\x2c\x20\x67\x72\x69\x64\x5f\x73\x71\x75\x61\x72\x65\x5f\
-\x73\x69\x7a\x65\x20\x2a\x20\x31\x30\x20\x2a\x20\x72\x61\x64\x69\
-\x75\x73\x5f\x74\x6f\x5f\x6f\x72\x69\x67\x69\x6e\x61\x6c\x29\x3b\
-\x0d\x0a\x20\x20\x20\x20\x2f\x2f\x20\x4d\x61\x6b\x65\x20\x73\x6d\
-\x61\x6c\x6c\x65\x72\x20\x67\x72\x69\x64\x20\x6c\x65\x73\x73\x20\
-\x62\x6f\x6c\x64\x20\x62\x61\x73\x65\x64\x20\x6f\x6e\x20\x7a\x6f\
-\x6f\x6d\x0d\x0a\x20\x20\x20\x20\x73\x6d\x61\x6c\x6c\x65\x72\x5f\
-\x63\x6f\x6c\x6f\x72\x2e\x77\x20\x2a\x3d\x20\x31\x2d\x7a\x6f\x6f\
-\x6d\x5f\x73\x65\x67\x6d\x65\x6e\x74\x5f\x70\x65\x72\x63\x65\x6e\
-\x74\x61\x67\x65\x2f\x28\x35\x2d\x7a\x6f\x6f\x6d\x5f\x73\x74\x61\
-\x67\x65\x29\x3b\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x66\x72\x61\x67\
-\x5f\x63\x6f\x6c\x6f\x72\x20\x3d\x20\x62\x69\x67\x67\x65\x72\x5f\
-\x63\x6f\x6c\x6f\x72\x20\x2b\x20\x73\x6d\x61\x6c\x6c\x65\x72\x5f\
-\x63\x6f\x6c\x6f\x72\x3b\x0d\x0a\x20\x20\x20\x20\x0d\x0a\x20\x20\
-\x20\x20\x76\x65\x63\x33\x20\x64\x69\x66\x66\x20\x3d\x20\x63\x61\
-\x6d\x65\x72\x61\x5f\x74\x61\x72\x67\x65\x74\x20\x2d\x20\x6d\x6f\
-\x64\x65\x6c\x5f\x70\x6f\x73\x3b\x0d\x0a\x20\x20\x20\x20\x66\x6c\
-\x6f\x61\x74\x20\x66\x61\x64\x65\x5f\x66\x61\x63\x74\x6f\x72\x20\
-\x3d\x20\x6c\x65\x6e\x67\x74\x68\x28\x64\x69\x66\x66\x2e\x78\x7a\
-\x29\x3b\x0d\x0a\x20\x20\x20\x20\x66\x61\x64\x65\x5f\x66\x61\x63\
-\x74\x6f\x72\x20\x3d\x20\x63\x6c\x61\x6d\x70\x28\x31\x20\x2d\x20\
-\x66\x61\x64\x65\x5f\x66\x61\x63\x74\x6f\x72\x20\x2f\x20\x67\x72\
-\x69\x64\x5f\x72\x61\x64\x69\x75\x73\x2c\x20\x30\x2e\x30\x2c\x20\
-\x30\x2e\x35\x29\x3b\x0d\x0a\x20\x20\x20\x20\x66\x72\x61\x67\x5f\
-\x63\x6f\x6c\x6f\x72\x2e\x77\x20\x2a\x3d\x20\x66\x61\x64\x65\x5f\
-\x66\x61\x63\x74\x6f\x72\x3b\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x69\
-\x66\x20\x28\x66\x72\x61\x67\x5f\x75\x76\x2e\x78\x20\x3e\x20\x2d\
-\x30\x2e\x30\x30\x30\x34\x20\x26\x26\x20\x66\x72\x61\x67\x5f\x75\
-\x76\x2e\x78\x20\x3c\x20\x30\x2e\x30\x30\x30\x34\x29\x20\x7b\x0d\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x2f\x2f\x20\x5a\x20\x61\x78\
-\x69\x73\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x72\x61\x67\
-\x5f\x63\x6f\x6c\x6f\x72\x20\x3d\x20\x76\x65\x63\x34\x28\x30\x2e\
-\x31\x2c\x20\x30\x2e\x31\x2c\x20\x31\x2e\x30\x2c\x20\x31\x2e\x30\
-\x29\x3b\x0d\x0a\x20\x20\x20\x20\x7d\x20\x65\x6c\x73\x65\x20\x69\
-\x66\x20\x28\x66\x72\x61\x67\x5f\x75\x76\x2e\x79\x20\x3e\x20\x2d\
-\x30\x2e\x30\x30\x30\x34\x20\x26\x26\x20\x66\x72\x61\x67\x5f\x75\
-\x76\x2e\x79\x20\x3c\x20\x30\x2e\x30\x30\x30\x34\x29\x20\x7b\x0d\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x2f\x2f\x20\x58\x20\x61\x78\
-\x69\x73\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x72\x61\x67\
-\x5f\x63\x6f\x6c\x6f\x72\x20\x3d\x20\x76\x65\x63\x34\x28\x31\x2e\
-\x30\x2c\x20\x30\x2e\x31\x2c\x20\x30\x2e\x31\x2c\x20\x31\x2e\x30\
-\x29\x3b\x0d\x0a\x20\x20\x20\x20\x7d\x0d\x0a\x7d\x20\x0d\x0a\x0d\
-\x0a\x23\x65\x6e\x64\x69\x66\x0d\x0a\
+\x0d\x0a\x20\x20\x20\x20\x2f\x2f\x20\x4d\x61\x6b\x65\x20\x6c\x61\
+\x72\x67\x65\x72\x20\x67\x72\x69\x64\x20\x6d\x6f\x72\x65\x20\x62\
+\x6f\x6c\x64\x20\x62\x61\x73\x65\x64\x20\x6f\x6e\x20\x7a\x6f\x6f\
+\x6d\x67\x72\x69\x64\x0d\x0a\x20\x20\x20\x20\x62\x69\x67\x67\x65\
+\x72\x5f\x63\x6f\x6c\x6f\x72\x2e\x77\x20\x2a\x3d\x20\x28\x31\x20\
+\x2b\x20\x7a\x6f\x6f\x6d\x5f\x73\x65\x67\x6d\x65\x6e\x74\x5f\x70\
+\x65\x72\x63\x65\x6e\x74\x61\x67\x65\x29\x3b\x0d\x0a\x0d\x0a\x20\
+\x20\x20\x20\x76\x65\x63\x34\x20\x73\x6d\x61\x6c\x6c\x65\x72\x5f\
+\x63\x6f\x6c\x6f\x72\x20\x3d\x20\x67\x72\x69\x64\x28\x66\x72\x61\
+\x67\x5f\x75\x76\x2c\x20\x67\x72\x69\x64\x5f\x73\x71\x75\x61\x72\
+\x65\x5f\x73\x69\x7a\x65\x20\x2a\x20\x31\x30\x20\x2a\x20\x72\x61\
+\x64\x69\x75\x73\x5f\x74\x6f\x5f\x6f\x72\x69\x67\x69\x6e\x61\x6c\
+\x29\x3b\x0d\x0a\x20\x20\x20\x20\x2f\x2f\x20\x4d\x61\x6b\x65\x20\
+\x73\x6d\x61\x6c\x6c\x65\x72\x20\x67\x72\x69\x64\x20\x6c\x65\x73\
+\x73\x20\x62\x6f\x6c\x64\x20\x62\x61\x73\x65\x64\x20\x6f\x6e\x20\
+\x7a\x6f\x6f\x6d\x0d\x0a\x20\x20\x20\x20\x73\x6d\x61\x6c\x6c\x65\
+\x72\x5f\x63\x6f\x6c\x6f\x72\x2e\x77\x20\x2a\x3d\x20\x31\x2d\x7a\
+\x6f\x6f\x6d\x5f\x73\x65\x67\x6d\x65\x6e\x74\x5f\x70\x65\x72\x63\
+\x65\x6e\x74\x61\x67\x65\x2f\x28\x35\x2d\x7a\x6f\x6f\x6d\x5f\x73\
+\x74\x61\x67\x65\x29\x3b\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x66\x72\
+\x61\x67\x5f\x63\x6f\x6c\x6f\x72\x20\x3d\x20\x62\x69\x67\x67\x65\
+\x72\x5f\x63\x6f\x6c\x6f\x72\x20\x2b\x20\x73\x6d\x61\x6c\x6c\x65\
+\x72\x5f\x63\x6f\x6c\x6f\x72\x3b\x0d\x0a\x20\x20\x20\x20\x0d\x0a\
+\x20\x20\x20\x20\x76\x65\x63\x33\x20\x64\x69\x66\x66\x20\x3d\x20\
+\x63\x61\x6d\x65\x72\x61\x5f\x74\x61\x72\x67\x65\x74\x20\x2d\x20\
+\x6d\x6f\x64\x65\x6c\x5f\x70\x6f\x73\x3b\x0d\x0a\x20\x20\x20\x20\
+\x66\x6c\x6f\x61\x74\x20\x66\x61\x64\x65\x5f\x66\x61\x63\x74\x6f\
+\x72\x20\x3d\x20\x6c\x65\x6e\x67\x74\x68\x28\x64\x69\x66\x66\x2e\
+\x78\x7a\x29\x3b\x0d\x0a\x20\x20\x20\x20\x66\x61\x64\x65\x5f\x66\
+\x61\x63\x74\x6f\x72\x20\x3d\x20\x63\x6c\x61\x6d\x70\x28\x31\x20\
+\x2d\x20\x66\x61\x64\x65\x5f\x66\x61\x63\x74\x6f\x72\x20\x2f\x20\
+\x67\x72\x69\x64\x5f\x72\x61\x64\x69\x75\x73\x2c\x20\x30\x2e\x30\
+\x2c\x20\x30\x2e\x35\x29\x3b\x0d\x0a\x20\x20\x20\x20\x66\x72\x61\
+\x67\x5f\x63\x6f\x6c\x6f\x72\x2e\x77\x20\x2a\x3d\x20\x66\x61\x64\
+\x65\x5f\x66\x61\x63\x74\x6f\x72\x3b\x0d\x0a\x0d\x0a\x20\x20\x20\
+\x20\x69\x66\x20\x28\x66\x72\x61\x67\x5f\x75\x76\x2e\x78\x20\x3e\
+\x20\x2d\x30\x2e\x30\x30\x30\x34\x20\x26\x26\x20\x66\x72\x61\x67\
+\x5f\x75\x76\x2e\x78\x20\x3c\x20\x30\x2e\x30\x30\x30\x34\x29\x20\
+\x7b\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x2f\x2f\x20\x5a\x20\
+\x61\x78\x69\x73\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x72\
+\x61\x67\x5f\x63\x6f\x6c\x6f\x72\x20\x3d\x20\x76\x65\x63\x34\x28\
+\x30\x2e\x31\x2c\x20\x30\x2e\x31\x2c\x20\x31\x2e\x30\x2c\x20\x31\
+\x2e\x30\x29\x3b\x0d\x0a\x20\x20\x20\x20\x7d\x20\x65\x6c\x73\x65\
+\x20\x69\x66\x20\x28\x66\x72\x61\x67\x5f\x75\x76\x2e\x79\x20\x3e\
+\x20\x2d\x30\x2e\x30\x30\x30\x34\x20\x26\x26\x20\x66\x72\x61\x67\
+\x5f\x75\x76\x2e\x79\x20\x3c\x20\x30\x2e\x30\x30\x30\x34\x29\x20\
+\x7b\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x2f\x2f\x20\x58\x20\
+\x61\x78\x69\x73\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x72\
+\x61\x67\x5f\x63\x6f\x6c\x6f\x72\x20\x3d\x20\x76\x65\x63\x34\x28\
+\x31\x2e\x30\x2c\x20\x30\x2e\x31\x2c\x20\x30\x2e\x31\x2c\x20\x31\
+\x2e\x30\x29\x3b\x0d\x0a\x20\x20\x20\x20\x7d\x0d\x0a\x7d\x20\x0d\
+\x0a\x0d\x0a\x23\x65\x6e\x64\x69\x66\x0d\x0a\
 \x00\x00\x01\x66\
 \x23\
 \x76\x65\x72\x73\x69\x6f\x6e\x20\x33\x33\x30\x20\x63\x6f\x72\x65\
@@ -28589,7 +28592,7 @@ qt_resource_data = b"\
 \x72\x20\x3d\x20\x76\x65\x63\x34\x28\x63\x6f\x6c\x6f\x72\x2c\x20\
 \x31\x2e\x30\x29\x3b\x0d\x0a\x7d\x20\x0d\x0a\x0d\x0a\x23\x65\x6e\
 \x64\x69\x66\x0d\x0a\
-\x00\x00\x01\x49\
+\x00\x00\x01\x60\
 \x23\
 \x76\x65\x72\x73\x69\x6f\x6e\x20\x33\x33\x30\x20\x63\x6f\x72\x65\
 \x0d\x0a\x0d\x0a\x23\x69\x66\x20\x64\x65\x66\x69\x6e\x65\x64\x20\
@@ -28608,10 +28611,11 @@ qt_resource_data = b"\
 \x2c\x20\x30\x2e\x32\x2c\x20\x30\x2e\x32\x29\x3b\x0d\x0a\x6f\x75\
 \x74\x20\x76\x65\x63\x34\x20\x66\x72\x61\x67\x5f\x63\x6f\x6c\x6f\
 \x72\x3b\x0d\x0a\x0d\x0a\x76\x6f\x69\x64\x20\x6d\x61\x69\x6e\x28\
-\x29\x0d\x0a\x7b\x0d\x0a\x20\x20\x20\x20\x66\x72\x61\x67\x5f\x63\
-\x6f\x6c\x6f\x72\x20\x3d\x20\x76\x65\x63\x34\x28\x63\x6f\x6c\x6f\
-\x72\x2c\x20\x31\x2e\x30\x29\x3b\x0d\x0a\x7d\x20\x0d\x0a\x0d\x0a\
-\x23\x65\x6e\x64\x69\x66\x0d\x0a\
+\x29\x0d\x0a\x7b\x0d\x0a\x20\x20\x20\x20\x2f\x2f\x20\x43\x6f\x6e\
+\x73\x74\x61\x6e\x74\x20\x63\x6f\x6c\x6f\x72\x0d\x0a\x20\x20\x20\
+\x20\x66\x72\x61\x67\x5f\x63\x6f\x6c\x6f\x72\x20\x3d\x20\x76\x65\
+\x63\x34\x28\x63\x6f\x6c\x6f\x72\x2c\x20\x31\x2e\x30\x29\x3b\x0d\
+\x0a\x7d\x20\x0d\x0a\x0d\x0a\x23\x65\x6e\x64\x69\x66\x0d\x0a\
 \x00\x00\x01\xbf\
 \x23\
 \x76\x65\x72\x73\x69\x6f\x6e\x20\x34\x33\x30\x20\x63\x6f\x72\x65\
@@ -28642,7 +28646,7 @@ qt_resource_data = b"\
 \x3d\x20\x74\x65\x78\x74\x75\x72\x65\x28\x74\x65\x78\x74\x75\x72\
 \x65\x30\x2c\x20\x54\x65\x78\x43\x6f\x6f\x72\x64\x73\x29\x3b\x0d\
 \x0a\x7d\x20\x20\x0d\x0a\x23\x65\x6e\x64\x69\x66\x0d\x0a\
-\x00\x00\x01\x37\
+\x00\x00\x01\x58\
 \x23\
 \x76\x65\x72\x73\x69\x6f\x6e\x20\x33\x33\x30\x20\x63\x6f\x72\x65\
 \x0d\x0a\x0d\x0a\x23\x69\x66\x20\x64\x65\x66\x69\x6e\x65\x64\x20\
@@ -28660,10 +28664,121 @@ qt_resource_data = b"\
 \x65\x63\x33\x20\x63\x6f\x6c\x6f\x72\x3b\x0d\x0a\x6f\x75\x74\x20\
 \x76\x65\x63\x34\x20\x66\x72\x61\x67\x5f\x63\x6f\x6c\x6f\x72\x3b\
 \x0d\x0a\x0d\x0a\x76\x6f\x69\x64\x20\x6d\x61\x69\x6e\x28\x29\x0d\
-\x0a\x7b\x0d\x0a\x20\x20\x20\x20\x66\x72\x61\x67\x5f\x63\x6f\x6c\
-\x6f\x72\x20\x3d\x20\x76\x65\x63\x34\x28\x63\x6f\x6c\x6f\x72\x2c\
-\x20\x31\x2e\x30\x29\x3b\x0d\x0a\x7d\x20\x0d\x0a\x0d\x0a\x23\x65\
-\x6e\x64\x69\x66\x0d\x0a\
+\x0a\x7b\x0d\x0a\x20\x20\x20\x20\x2f\x2f\x20\x47\x69\x76\x65\x20\
+\x69\x74\x20\x61\x20\x63\x6f\x6e\x73\x74\x61\x6e\x74\x20\x63\x6f\
+\x6c\x6f\x72\x0d\x0a\x20\x20\x20\x20\x66\x72\x61\x67\x5f\x63\x6f\
+\x6c\x6f\x72\x20\x3d\x20\x76\x65\x63\x34\x28\x63\x6f\x6c\x6f\x72\
+\x2c\x20\x31\x2e\x30\x29\x3b\x0d\x0a\x7d\x20\x0d\x0a\x0d\x0a\x23\
+\x65\x6e\x64\x69\x66\x0d\x0a\
+\x00\x00\x03\x46\
+\x23\
+\x76\x65\x72\x73\x69\x6f\x6e\x20\x34\x33\x30\x20\x63\x6f\x72\x65\
+\x0d\x0a\x0d\x0a\x23\x69\x66\x20\x64\x65\x66\x69\x6e\x65\x64\x20\
+\x56\x45\x52\x54\x45\x58\x5f\x53\x48\x41\x44\x45\x52\x0d\x0a\x0d\
+\x0a\x2f\x2f\x20\x49\x6e\x20\x70\x69\x78\x65\x6c\x73\x2c\x20\x66\
+\x72\x6f\x6d\x20\x74\x68\x65\x20\x74\x6f\x70\x20\x6c\x65\x66\x74\
+\x20\x6f\x66\x20\x74\x68\x65\x20\x73\x63\x72\x65\x65\x6e\x0d\x0a\
+\x69\x6e\x20\x76\x65\x63\x32\x20\x69\x6e\x5f\x70\x6f\x73\x69\x74\
+\x69\x6f\x6e\x3b\x0d\x0a\x2f\x2f\x20\x49\x6e\x20\x70\x69\x78\x65\
+\x6c\x73\x20\x6f\x66\x20\x74\x68\x65\x20\x67\x6c\x79\x70\x68\x20\
+\x61\x74\x6c\x61\x73\x0d\x0a\x69\x6e\x20\x76\x65\x63\x32\x20\x69\
+\x6e\x5f\x74\x65\x78\x63\x6f\x6f\x72\x64\x5f\x30\x3b\x0d\x0a\x69\
+\x6e\x20\x76\x65\x63\x34\x20\x69\x6e\x5f\x63\x6f\x6c\x6f\x72\x3b\
+\x0d\x0a\x0d\x0a\x75\x6e\x69\x66\x6f\x72\x6d\x20\x76\x65\x63\x32\
+\x20\x73\x63\x72\x65\x65\x6e\x5f\x73\x69\x7a\x65\x3b\x0d\x0a\x0d\
+\x0a\x6f\x75\x74\x20\x76\x65\x63\x32\x20\x54\x65\x78\x43\x6f\x6f\
+\x72\x64\x73\x3b\x0d\x0a\x6f\x75\x74\x20\x76\x65\x63\x34\x20\x43\
+\x6f\x6c\x6f\x72\x3b\x0d\x0a\x0d\x0a\x76\x6f\x69\x64\x20\x6d\x61\
+\x69\x6e\x28\x29\x0d\x0a\x7b\x0d\x0a\x20\x20\x20\x20\x76\x65\x63\
+\x32\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\x20\x3d\x20\x69\x6e\x5f\
+\x70\x6f\x73\x69\x74\x69\x6f\x6e\x20\x2f\x20\x73\x63\x72\x65\x65\
+\x6e\x5f\x73\x69\x7a\x65\x20\x2a\x20\x32\x2e\x30\x20\x2d\x20\x31\
+\x2e\x30\x3b\x0d\x0a\x20\x20\x20\x20\x67\x6c\x5f\x50\x6f\x73\x69\
+\x74\x69\x6f\x6e\x20\x3d\x20\x76\x65\x63\x34\x28\x70\x6f\x73\x69\
+\x74\x69\x6f\x6e\x2e\x78\x2c\x20\x2d\x70\x6f\x73\x69\x74\x69\x6f\
+\x6e\x2e\x79\x2c\x20\x30\x2e\x30\x2c\x20\x31\x2e\x30\x29\x3b\x0d\
+\x0a\x20\x20\x20\x20\x54\x65\x78\x43\x6f\x6f\x72\x64\x73\x20\x3d\
+\x20\x69\x6e\x5f\x74\x65\x78\x63\x6f\x6f\x72\x64\x5f\x30\x3b\x0d\
+\x0a\x20\x20\x20\x20\x43\x6f\x6c\x6f\x72\x20\x3d\x20\x69\x6e\x5f\
+\x63\x6f\x6c\x6f\x72\x3b\x0d\x0a\x7d\x0d\x0a\x0d\x0a\x23\x65\x6c\
+\x69\x66\x20\x64\x65\x66\x69\x6e\x65\x64\x20\x46\x52\x41\x47\x4d\
+\x45\x4e\x54\x5f\x53\x48\x41\x44\x45\x52\x0d\x0a\x0d\x0a\x69\x6e\
+\x20\x76\x65\x63\x32\x20\x54\x65\x78\x43\x6f\x6f\x72\x64\x73\x3b\
+\x0d\x0a\x69\x6e\x20\x76\x65\x63\x34\x20\x43\x6f\x6c\x6f\x72\x3b\
+\x0d\x0a\x0d\x0a\x6c\x61\x79\x6f\x75\x74\x20\x28\x6c\x6f\x63\x61\
+\x74\x69\x6f\x6e\x3d\x30\x29\x20\x75\x6e\x69\x66\x6f\x72\x6d\x20\
+\x73\x61\x6d\x70\x6c\x65\x72\x32\x44\x20\x61\x74\x6c\x61\x73\x3b\
+\x0d\x0a\x0d\x0a\x6f\x75\x74\x20\x76\x65\x63\x34\x20\x66\x72\x61\
+\x67\x5f\x63\x6f\x6c\x6f\x72\x3b\x0d\x0a\x0d\x0a\x76\x6f\x69\x64\
+\x20\x6d\x61\x69\x6e\x28\x29\x0d\x0a\x7b\x0d\x0a\x20\x20\x20\x20\
+\x2f\x2f\x20\x54\x68\x65\x20\x61\x74\x6c\x61\x73\x20\x6f\x6e\x6c\
+\x79\x20\x73\x74\x6f\x72\x65\x73\x20\x68\x6f\x77\x20\x6d\x75\x63\
+\x68\x20\x6f\x66\x20\x65\x61\x63\x68\x20\x70\x69\x78\x65\x6c\x20\
+\x74\x68\x65\x20\x67\x6c\x79\x70\x68\x20\x63\x6f\x76\x65\x72\x73\
+\x0d\x0a\x20\x20\x20\x20\x66\x6c\x6f\x61\x74\x20\x63\x6f\x76\x65\
+\x72\x61\x67\x65\x20\x3d\x20\x74\x65\x78\x74\x75\x72\x65\x28\x61\
+\x74\x6c\x61\x73\x2c\x20\x54\x65\x78\x43\x6f\x6f\x72\x64\x73\x20\
+\x2f\x20\x76\x65\x63\x32\x28\x74\x65\x78\x74\x75\x72\x65\x53\x69\
+\x7a\x65\x28\x61\x74\x6c\x61\x73\x2c\x20\x30\x29\x29\x29\x2e\x72\
+\x3b\x0d\x0a\x20\x20\x20\x20\x66\x72\x61\x67\x5f\x63\x6f\x6c\x6f\
+\x72\x20\x3d\x20\x76\x65\x63\x34\x28\x43\x6f\x6c\x6f\x72\x2e\x72\
+\x67\x62\x2c\x20\x43\x6f\x6c\x6f\x72\x2e\x61\x20\x2a\x20\x63\x6f\
+\x76\x65\x72\x61\x67\x65\x29\x3b\x0d\x0a\x7d\x0d\x0a\x23\x65\x6e\
+\x64\x69\x66\x0d\x0a\
+\x00\x00\x03\x3a\
+\x23\
+\x76\x65\x72\x73\x69\x6f\x6e\x20\x33\x33\x30\x20\x63\x6f\x72\x65\
+\x0d\x0a\x0d\x0a\x23\x69\x66\x20\x64\x65\x66\x69\x6e\x65\x64\x20\
+\x56\x45\x52\x54\x45\x58\x5f\x53\x48\x41\x44\x45\x52\x0d\x0a\x69\
+\x6e\x20\x76\x65\x63\x33\x20\x69\x6e\x5f\x70\x6f\x73\x69\x74\x69\
+\x6f\x6e\x3b\x0d\x0a\x69\x6e\x20\x76\x65\x63\x33\x20\x69\x6e\x5f\
+\x6e\x6f\x72\x6d\x61\x6c\x3b\x0d\x0a\x0d\x0a\x2f\x2f\x20\x50\x65\
+\x72\x20\x69\x6e\x73\x74\x61\x6e\x63\x65\x20\x61\x74\x74\x72\x69\
+\x62\x75\x74\x65\x73\x0d\x0a\x69\x6e\x20\x6d\x61\x74\x34\x20\x69\
+\x6e\x5f\x6d\x6f\x64\x65\x6c\x3b\x0d\x0a\x69\x6e\x20\x76\x65\x63\
+\x33\x20\x69\x6e\x5f\x63\x6f\x6c\x6f\x72\x3b\x0d\x0a\x0d\x0a\x75\
+\x6e\x69\x66\x6f\x72\x6d\x20\x6d\x61\x74\x34\x20\x76\x69\x65\x77\
+\x3b\x0d\x0a\x75\x6e\x69\x66\x6f\x72\x6d\x20\x6d\x61\x74\x34\x20\
+\x70\x72\x6f\x6a\x3b\x0d\x0a\x0d\x0a\x6f\x75\x74\x20\x76\x65\x63\
+\x33\x20\x70\x6f\x73\x3b\x0d\x0a\x6f\x75\x74\x20\x76\x65\x63\x33\
+\x20\x6e\x6f\x72\x6d\x61\x6c\x3b\x0d\x0a\x6f\x75\x74\x20\x76\x65\
+\x63\x33\x20\x63\x6f\x6c\x6f\x72\x3b\x0d\x0a\x0d\x0a\x76\x6f\x69\
+\x64\x20\x6d\x61\x69\x6e\x28\x29\x0d\x0a\x7b\x0d\x0a\x20\x20\x20\
+\x20\x6d\x61\x74\x34\x20\x77\x6f\x72\x6c\x64\x5f\x63\x6f\x6f\x72\
+\x64\x73\x20\x3d\x20\x76\x69\x65\x77\x20\x2a\x20\x69\x6e\x5f\x6d\
+\x6f\x64\x65\x6c\x3b\x0d\x0a\x20\x20\x20\x20\x76\x65\x63\x34\x20\
+\x70\x20\x3d\x20\x77\x6f\x72\x6c\x64\x5f\x63\x6f\x6f\x72\x64\x73\
+\x20\x2a\x20\x76\x65\x63\x34\x28\x69\x6e\x5f\x70\x6f\x73\x69\x74\
+\x69\x6f\x6e\x2c\x20\x31\x2e\x30\x29\x3b\x0d\x0a\x20\x20\x20\x20\
+\x67\x6c\x5f\x50\x6f\x73\x69\x74\x69\x6f\x6e\x20\x3d\x20\x70\x72\
+\x6f\x6a\x20\x2a\x20\x70\x3b\x0d\x0a\x20\x20\x20\x20\x6d\x61\x74\
+\x33\x20\x6d\x5f\x6e\x6f\x72\x6d\x61\x6c\x20\x3d\x20\x69\x6e\x76\
+\x65\x72\x73\x65\x28\x74\x72\x61\x6e\x73\x70\x6f\x73\x65\x28\x6d\
+\x61\x74\x33\x28\x77\x6f\x72\x6c\x64\x5f\x63\x6f\x6f\x72\x64\x73\
+\x29\x29\x29\x3b\x0d\x0a\x20\x20\x20\x20\x6e\x6f\x72\x6d\x61\x6c\
+\x20\x3d\x20\x6d\x5f\x6e\x6f\x72\x6d\x61\x6c\x20\x2a\x20\x6e\x6f\
+\x72\x6d\x61\x6c\x69\x7a\x65\x28\x69\x6e\x5f\x6e\x6f\x72\x6d\x61\
+\x6c\x29\x3b\x0d\x0a\x20\x20\x20\x20\x70\x6f\x73\x20\x3d\x20\x70\
+\x2e\x78\x79\x7a\x3b\x0d\x0a\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x20\x3d\x20\x69\x6e\x5f\x63\x6f\x6c\x6f\x72\x3b\x0d\x0a\x7d\x0d\
+\x0a\x0d\x0a\x23\x65\x6c\x69\x66\x20\x64\x65\x66\x69\x6e\x65\x64\
+\x20\x46\x52\x41\x47\x4d\x45\x4e\x54\x5f\x53\x48\x41\x44\x45\x52\
+\x0d\x0a\x0d\x0a\x69\x6e\x20\x76\x65\x63\x33\x20\x70\x6f\x73\x3b\
+\x0d\x0a\x69\x6e\x20\x76\x65\x63\x33\x20\x6e\x6f\x72\x6d\x61\x6c\
+\x3b\x0d\x0a\x69\x6e\x20\x76\x65\x63\x33\x20\x63\x6f\x6c\x6f\x72\
+\x3b\x0d\x0a\x0d\x0a\x6f\x75\x74\x20\x76\x65\x63\x34\x20\x66\x72\
+\x61\x67\x5f\x63\x6f\x6c\x6f\x72\x3b\x0d\x0a\x0d\x0a\x76\x6f\x69\
+\x64\x20\x6d\x61\x69\x6e\x28\x29\x0d\x0a\x7b\x0d\x0a\x20\x20\x20\
+\x20\x66\x6c\x6f\x61\x74\x20\x6c\x20\x3d\x20\x64\x6f\x74\x28\x6e\
+\x6f\x72\x6d\x61\x6c\x69\x7a\x65\x28\x2d\x70\x6f\x73\x29\x2c\x20\
+\x6e\x6f\x72\x6d\x61\x6c\x69\x7a\x65\x28\x6e\x6f\x72\x6d\x61\x6c\
+\x29\x29\x3b\x0d\x0a\x20\x20\x20\x20\x66\x72\x61\x67\x5f\x63\x6f\
+\x6c\x6f\x72\x20\x3d\x20\x76\x65\x63\x34\x28\x63\x6f\x6c\x6f\x72\
+\x2c\x20\x31\x2e\x30\x29\x20\x2a\x20\x28\x30\x2e\x32\x35\x20\x2b\
+\x20\x61\x62\x73\x28\x6c\x29\x20\x2a\x20\x30\x2e\x37\x35\x29\x3b\
+\x0d\x0a\x20\x20\x20\x20\x66\x72\x61\x67\x5f\x63\x6f\x6c\x6f\x72\
+\x2e\x77\x20\x3d\x20\x31\x2e\x30\x3b\x0d\x0a\x7d\x20\x0d\x0a\x0d\
+\x0a\x23\x65\x6e\x64\x69\x66\x0d\x0a\
 "
 
 qt_resource_name = b"\
@@ -28795,68 +28910,83 @@ qt_resource_name = b"\
 \x00\x62\
 \x00\x6f\x00\x75\x00\x6e\x00\x64\x00\x69\x00\x6e\x00\x67\x00\x5f\x00\x62\x00\x6f\x00\x78\x00\x2e\x00\x67\x00\x6c\x00\x73\x00\x6c\
 \
+\x00\x09\
+\x0f\x74\x56\x1c\
+\x00\x74\
+\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x67\x00\x6c\x00\x73\x00\x6c\
+\x00\x17\
+\x0e\x62\x5b\x9c\
+\x00\x76\
+\x00\x69\x00\x65\x00\x77\x00\x70\x00\x6f\x00\x72\x00\x74\x00\x5f\x00\x69\x00\x6e\x00\x73\x00\x74\x00\x61\x00\x6e\x00\x63\x00\x65\
+\x00\x64\x00\x2e\x00\x67\x00\x6c\x00\x73\x00\x6c\
 "
 
 qt_resource_struct_v1 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x05\x00\x00\x00\x01\
-\x00\x00\x00\x3c\x00\x02\x00\x00\x00\x0d\x00\x00\x00\x11\
-\x00\x00\x00\x46\x00\x02\x00\x00\x00\x02\x00\x00\x00\x0f\
-\x00\x00\x00\x52\x00\x02\x00\x00\x00\x02\x00\x00\x00\x0d\
+\x00\x00\x00\x3c\x00\x02\x00\x00\x00\x0d\x00\x00\x00\x13\
+\x00\x00\x00\x46\x00\x02\x00\x00\x00\x02\x00\x00\x00\x11\
+\x00\x00\x00\x52\x00\x02\x00\x00\x00\x02\x00\x00\x00\x0f\
 \x00\x00\x00\x14\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x07\x00\x00\x00\x06\
-\x00\x00\x03\x0c\x00\x00\x00\x00\x00\x01\x00\x06\xea\xd5\
-\x00\x00\x02\xe0\x00\x00\x00\x00\x00\x01\x00\x06\xe4\x3f\
-\x00\x00\x03\xa4\x00\x00\x00\x00\x00\x01\x00\x06\xfa\x28\
-\x00\x00\x03\x5a\x00\x00\x00\x00\x00\x01\x00\x06\xf7\x18\
-\x00\x00\x03\x86\x00\x00\x00\x00\x00\x01\x00\x06\xf8\x65\
-\x00\x00\x03\x44\x00\x00\x00\x00\x00\x01\x00\x06\xf5\xae\
-\x00\x00\x03\x2c\x00\x00\x00\x00\x00\x01\x00\x06\xed\xc0\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x09\x00\x00\x00\x06\
+\x00\x00\x03\x0c\x00\x00\x00\x00\x00\x01\x00\x06\xea\xff\
+\x00\x00\x02\xe0\x00\x00\x00\x00\x00\x01\x00\x06\xe4\x69\
+\x00\x00\x03\xa4\x00\x00\x00\x00\x00\x01\x00\x06\xfa\x6b\
+\x00\x00\x03\x5a\x00\x00\x00\x00\x00\x01\x00\x06\xf7\x44\
+\x00\x00\x03\x86\x00\x00\x00\x00\x00\x01\x00\x06\xf8\xa8\
+\x00\x00\x03\x44\x00\x00\x00\x00\x00\x01\x00\x06\xf5\xda\
+\x00\x00\x03\xe4\x00\x00\x00\x00\x00\x01\x00\x06\xff\x11\
+\x00\x00\x03\x2c\x00\x00\x00\x00\x00\x01\x00\x06\xed\xea\
+\x00\x00\x03\xcc\x00\x00\x00\x00\x00\x01\x00\x06\xfb\xc7\
 \x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x01\xff\xca\
 \x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x04\xc2\
 \x00\x00\x00\xd8\x00\x00\x00\x00\x00\x01\x00\x06\x7e\xc4\
 \x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x06\x6b\x26\
 \x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x06\xa7\xdb\
-\x00\x00\x02\x18\x00\x01\x00\x00\x00\x01\x00\x06\xcb\x79\
-\x00\x00\x01\x8a\x00\x00\x00\x00\x00\x01\x00\x06\xbb\x5f\
+\x00\x00\x02\x18\x00\x01\x00\x00\x00\x01\x00\x06\xcb\xa3\
+\x00\x00\x01\x8a\x00\x00\x00\x00\x00\x01\x00\x06\xbb\x89\
 \x00\x00\x01\x14\x00\x00\x00\x00\x00\x01\x00\x06\xaa\xfa\
 \x00\x00\x01\x68\x00\x01\x00\x00\x00\x01\x00\x06\xb9\x33\
-\x00\x00\x02\xb4\x00\x00\x00\x00\x00\x01\x00\x06\xdd\xbb\
-\x00\x00\x01\xce\x00\x01\x00\x00\x00\x01\x00\x06\xc3\x9b\
-\x00\x00\x02\x6e\x00\x00\x00\x00\x00\x01\x00\x06\xd5\xaf\
-\x00\x00\x01\xaa\x00\x01\x00\x00\x00\x01\x00\x06\xc1\x19\
-\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x06\xc6\x70\
-\x00\x00\x02\x44\x00\x01\x00\x00\x00\x01\x00\x06\xd2\xe4\
+\x00\x00\x02\xb4\x00\x00\x00\x00\x00\x01\x00\x06\xdd\xe5\
+\x00\x00\x01\xce\x00\x01\x00\x00\x00\x01\x00\x06\xc3\xc5\
+\x00\x00\x02\x6e\x00\x00\x00\x00\x00\x01\x00\x06\xd5\xd9\
+\x00\x00\x01\xaa\x00\x01\x00\x00\x00\x01\x00\x06\xc1\x43\
+\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x06\xc6\x9a\
+\x00\x00\x02\x44\x00\x01\x00\x00\x00\x01\x00\x06\xd3\x0e\
 \x00\x00\x01\x42\x00\x00\x00\x00\x00\x01\x00\x06\xb2\x72\
-\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x06\xda\x74\
+\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x06\xda\x9e\
 "
 
 qt_resource_struct_v2 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x05\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x3c\x00\x02\x00\x00\x00\x0d\x00\x00\x00\x11\
+\x00\x00\x00\x3c\x00\x02\x00\x00\x00\x0d\x00\x00\x00\x13\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x46\x00\x02\x00\x00\x00\x02\x00\x00\x00\x0f\
+\x00\x00\x00\x46\x00\x02\x00\x00\x00\x02\x00\x00\x00\x11\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x52\x00\x02\x00\x00\x00\x02\x00\x00\x00\x0d\
+\x00\x00\x00\x52\x00\x02\x00\x00\x00\x02\x00\x00\x00\x0f\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x14\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
 \x00\x00\x01\x7e\x9b\xe3\x9d\x5b\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x07\x00\x00\x00\x06\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x09\x00\x00\x00\x06\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x03\x0c\x00\x00\x00\x00\x00\x01\x00\x06\xea\xd5\
+\x00\x00\x03\x0c\x00\x00\x00\x00\x00\x01\x00\x06\xea\xff\
 \x00\x00\x01\x7e\x99\x83\xf1\x56\
-\x00\x00\x02\xe0\x00\x00\x00\x00\x00\x01\x00\x06\xe4\x3f\
+\x00\x00\x02\xe0\x00\x00\x00\x00\x00\x01\x00\x06\xe4\x69\
 \x00\x00\x01\x7e\x4a\xc6\x19\x5d\
-\x00\x00\x03\xa4\x00\x00\x00\x00\x00\x01\x00\x06\xfa\x28\
-\x00\x00\x01\x7e\x4a\xc6\x19\x5c\
-\x00\x00\x03\x5a\x00\x00\x00\x00\x00\x01\x00\x06\xf7\x18\
-\x00\x00\x01\x7e\x4a\xc6\x19\x5c\
-\x00\x00\x03\x86\x00\x00\x00\x00\x00\x01\x00\x06\xf8\x65\
+\x00\x00\x03\xa4\x00\x00\x00\x00\x00\x01\x00\x06\xfa\x6b\
+\x00\x00\x01\x80\x6d\x9f\xd5\x28\
+\x00\x00\x03\x5a\x00\x00\x00\x00\x00\x01\x00\x06\xf7\x44\
+\x00\x00\x01\x80\x6d\x9f\xd5\x28\
+\x00\x00\x03\x86\x00\x00\x00\x00\x00\x01\x00\x06\xf8\xa8\
 \x00\x00\x01\x7e\x99\x83\xf1\x55\
-\x00\x00\x03\x44\x00\x00\x00\x00\x00\x01\x00\x06\xf5\xae\
+\x00\x00\x03\x44\x00\x00\x00\x00\x00\x01\x00\x06\xf5\xda\
 \x00\x00\x01\x7e\x4a\xc6\x19\x5d\
-\x00\x00\x03\x2c\x00\x00\x00\x00\x00\x01\x00\x06\xed\xc0\
-\x00\x00\x01\x7e\x4a\xc6\x19\x5c\
+\x00\x00\x03\xe4\x00\x00\x00\x00\x00\x01\x00\x06\xff\x11\
+\x00\x00\x01\xa1\x4b\x3c\xeb\x16\
+\x00\x00\x03\x2c\x00\x00\x00\x00\x00\x01\x00\x06\xed\xea\
+\x00\x00\x01\x80\x6d\x9f\xd5\x28\
+\x00\x00\x03\xcc\x00\x00\x00\x00\x00\x01\x00\x06\xfb\xc7\
+\x00\x00\x01\xa1\x4b\x5d\xc0\x72\
 \x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x01\xff\xca\
 \x00\x00\x01\x7e\x99\x83\xf1\x48\
 \x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x04\xc2\
@@ -28867,29 +28997,29 @@ qt_resource_struct_v2 = b"\
 \x00\x00\x01\x7e\x99\x83\xf1\x4b\
 \x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x06\xa7\xdb\
 \x00\x00\x01\x7e\x99\x83\xf1\x58\
-\x00\x00\x02\x18\x00\x01\x00\x00\x00\x01\x00\x06\xcb\x79\
+\x00\x00\x02\x18\x00\x01\x00\x00\x00\x01\x00\x06\xcb\xa3\
 \x00\x00\x01\x7e\x99\x83\xf1\x58\
-\x00\x00\x01\x8a\x00\x00\x00\x00\x00\x01\x00\x06\xbb\x5f\
+\x00\x00\x01\x8a\x00\x00\x00\x00\x00\x01\x00\x06\xbb\x89\
 \x00\x00\x01\x7e\x99\x83\xf1\x59\
 \x00\x00\x01\x14\x00\x00\x00\x00\x00\x01\x00\x06\xaa\xfa\
 \x00\x00\x01\x7e\x99\x83\xf1\x5a\
 \x00\x00\x01\x68\x00\x01\x00\x00\x00\x01\x00\x06\xb9\x33\
-\x00\x00\x01\x7e\x99\x83\xf1\x59\
-\x00\x00\x02\xb4\x00\x00\x00\x00\x00\x01\x00\x06\xdd\xbb\
+\x00\x00\x01\xa1\x4b\x82\x9d\x00\
+\x00\x00\x02\xb4\x00\x00\x00\x00\x00\x01\x00\x06\xdd\xe5\
 \x00\x00\x01\x7e\x99\x83\xf1\x58\
-\x00\x00\x01\xce\x00\x01\x00\x00\x00\x01\x00\x06\xc3\x9b\
+\x00\x00\x01\xce\x00\x01\x00\x00\x00\x01\x00\x06\xc3\xc5\
 \x00\x00\x01\x7e\x99\x83\xf1\x59\
-\x00\x00\x02\x6e\x00\x00\x00\x00\x00\x01\x00\x06\xd5\xaf\
+\x00\x00\x02\x6e\x00\x00\x00\x00\x00\x01\x00\x06\xd5\xd9\
 \x00\x00\x01\x7e\x99\x83\xf1\x57\
-\x00\x00\x01\xaa\x00\x01\x00\x00\x00\x01\x00\x06\xc1\x19\
+\x00\x00\x01\xaa\x00\x01\x00\x00\x00\x01\x00\x06\xc1\x43\
 \x00\x00\x01\x7e\x99\x83\xf1\x59\
-\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x06\xc6\x70\
+\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x06\xc6\x9a\
 \x00\x00\x01\x7e\x99\x83\xf1\x56\
-\x00\x00\x02\x44\x00\x01\x00\x00\x00\x01\x00\x06\xd2\xe4\
+\x00\x00\x02\x44\x00\x01\x00\x00\x00\x01\x00\x06\xd3\x0e\
 \x00\x00\x01\x7e\x99\x83\xf1\x5a\
 \x00\x00\x01\x42\x00\x00\x00\x00\x00\x01\x00\x06\xb2\x72\
 \x00\x00\x01\x7e\x99\x83\xf1\x5b\
-\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x06\xda\x74\
+\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x06\xda\x9e\
 \x00\x00\x01\x7e\x99\x83\xf1\x5a\
 "
 
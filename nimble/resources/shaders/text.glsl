@@ -0,0 +1,39 @@
+#version 430 core
+
+#if defined VERTEX_SHADER
+
+// In pixels, from the top left of the screen
+in vec2 in_position;
+// In pixels of the glyph atlas
+in vec2 in_texcoord_0;
+in vec4 in_color;
+
+uniform vec2 screen_size;
+
+out vec2 TexCoords;
+out vec4 Color;
+
+void main()
+{
+    vec2 position = in_position / screen_size * 2.0 - 1.0;
+    gl_Position = vec4(position.x, -position.y, 0.0, 1.0);
+    TexCoords = in_texcoord_0;
+    Color = in_color;
+}
+
+#elif defined FRAGMENT_SHADER
+
+in vec2 TexCoords;
+in vec4 Color;
+
+layout (location=0) uniform sampler2D atlas;
+
+out vec4 frag_color;
+
+void main()
+{
+    // The atlas only stores how much of each pixel the glyph covers
+    float coverage = texture(atlas, TexCoords / vec2(textureSize(atlas, 0))).r;
+    frag_color = vec4(Color.rgb, Color.a * coverage);
+}
+#endif
@@ -1,4 +1,8 @@
-from typing import Callable, List, TypeVar
+import gc
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, List, TypeVar, Union
 
 
 T = TypeVar("T")
@@ -7,3 +11,28 @@ T = TypeVar("T")
 def custom_index(lst: List[T], predicate: Callable[[T], bool]) -> int:
     """Like `list.index`, but uses custom function to determine equality."""
     return next((i for i, e in enumerate(lst) if predicate(e)), -1)
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Pause the cyclic garbage collector, e.g. while creating many objects
+    that all stay alive (which it would only waste time scanning)."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def write_atomically(path: Path, data: Union[bytes, str]):
+    """Write a file by writing a temporary file next to it first, and then
+    replacing it, so a crash never leaves half a file behind."""
+    path = Path(path)
+    temporary = path.with_name(f"{path.name}.tmp")
+    with open(temporary, "wb" if isinstance(data, bytes) else "w") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
@@ -1,11 +1,18 @@
 import logging
 from pathlib import Path
-from typing import List, cast
+from typing import List, Optional, cast
 
 import moderngl_window as mglw
 from PyQt5.QtCore import QSettings, Qt
 from PyQt5.QtGui import QFont, QFontDatabase, QIcon
-from PyQt5.QtWidgets import QApplication, QDialog, QMainWindow, QMenu, QAction
+from PyQt5.QtWidgets import (
+    QAction,
+    QApplication,
+    QDialog,
+    QMainWindow,
+    QMenu,
+    QProgressDialog,
+)
 from PyQtAds.QtAds import ads
 
 import nimble.resources.resources  # Note: This is needed to load the qt resources. (don't remove this seemingly unused import!)
@@ -15,10 +22,12 @@ from nimble.interface.entity_inspector import EntityInspector
 from nimble.interface.file_explorer import FileExplorer
 from nimble.interface.gui_logger import GuiLogger
 from nimble.interface.outline import OutlineWidget
+from nimble.interface.profiler_panel import ProfilerPanel
 from nimble.interface.project_ui import OpenProject, OverwriteWarning, SaveProjectAs
 from nimble.interface.run_window import RunWindow
 from nimble.interface.viewport import ViewportWidget
 from nimble.objects import Scene
+from nimble.objects.journal import JournalError
 
 
 class MainWindow(QMainWindow, ProjectObserver):
@@ -75,6 +84,10 @@ class MainWindow(QMainWindow, ProjectObserver):
         self.play.setWidget(RunWindow())
         self.dock_manager.addDockWidget(ads.BottomDockWidgetArea, self.play)
 
+        self.profiler = ads.CDockWidget("Profiler")
+        self.profiler.setWidget(ProfilerPanel())
+        self.dock_manager.addDockWidget(ads.BottomDockWidgetArea, self.profiler)
+
         # Create logging widget, with custom GuiLogger
         logTextBox = GuiLogger(self)
         logTextBox.setFormatter(
@@ -98,6 +111,8 @@ class MainWindow(QMainWindow, ProjectObserver):
 
         self.actionCopy.triggered.connect(current_project.copy)
         self.actionPaste.triggered.connect(current_project.paste)
+        self.actionUndo.triggered.connect(self.undo)
+        self.actionRedo.triggered.connect(self.redo)
 
         self.menuWindow = cast(QMenu, self.menuWindow)
         self.menuWindow.addAction(self.viewport_dock.toggleViewAction())
@@ -105,6 +120,7 @@ class MainWindow(QMainWindow, ProjectObserver):
         self.menuWindow.addAction(self.entity_dock.toggleViewAction())
         self.menuWindow.addAction(self.file_explorer_dock.toggleViewAction())
         self.menuWindow.addAction(self.play.toggleViewAction())
+        self.menuWindow.addAction(self.profiler.toggleViewAction())
         self.menuWindow.addAction(self.log.toggleViewAction())
 
         self.restore_layout()  # Load window layout
@@ -121,13 +137,61 @@ class MainWindow(QMainWindow, ProjectObserver):
 
         self.update_recent_projects()
 
+        # Shown while a project is loaded in the background
+        self.load_progress_dialog: Optional[QProgressDialog] = None
+
     def project_changed(self):
         self.setWindowTitle(current_project.get_project_display_name())
 
+    def load_project(self, path: Path):
+        """Open a project in the background, with a dialog to cancel it."""
+        # Cancels (and closes the dialog of) the project that is loading, if any
+        current_project.load_project_async(path, autosave=True)
+        if self.load_progress_dialog is None:
+            dialog = QProgressDialog("Opening project...", "Cancel", 0, 0, self)
+            dialog.setWindowModality(Qt.WindowModal)
+            # Only show up for projects that take a while to load
+            dialog.setMinimumDuration(500)
+            dialog.canceled.connect(current_project.cancel_loading)
+            self.load_progress_dialog = dialog
+
+    def load_progress(self, done: int, total: int):
+        if self.load_progress_dialog is not None:
+            self.load_progress_dialog.setMaximum(total)
+            self.load_progress_dialog.setValue(done)
+
+    def load_finished(self, loaded: bool):
+        dialog = self.load_progress_dialog
+        if dialog is not None:
+            self.load_progress_dialog = None
+            # Closing the dialog would cancel the load
+            dialog.canceled.disconnect()
+            dialog.reset()
+            dialog.deleteLater()
+
+        if loaded:
+            self.add_recent_project(current_project.project_file)
+
     def init_viewport(self):
         current_project.scene.replace(Scene.default_scene())
 
+    def undo(self):
+        try:
+            current_project.scene.journal.undo()
+        except JournalError as e:
+            logging.getLogger("nimble").warning(f"Couldn't undo the last change: {e}")
+
+    def redo(self):
+        try:
+            current_project.scene.journal.redo()
+        except JournalError as e:
+            logging.getLogger("nimble").warning(f"Couldn't redo the last change: {e}")
+
     def closeEvent(self, event):
+        current_project.cancel_loading()
+        # The autosave is only for recovering from crashes, so unsaved changes
+        # are discarded when the editor is closed
+        current_project.autosave.stop(discard=True)
         event.accept()
 
     def save_layout(self):
@@ -158,8 +222,7 @@ class MainWindow(QMainWindow, ProjectObserver):
             dialog = OpenProject(self)
             res = dialog.exec()
             if res == QDialog.Accepted:
-                current_project.load_project(dialog.filename)
-                self.add_recent_project(current_project.project_file)
+                self.load_project(dialog.filename)
 
     def save_project_as(self):
         dialog = SaveProjectAs(self)
@@ -223,5 +286,4 @@ class MainWindow(QMainWindow, ProjectObserver):
         if action:
             path = action.data()
             if path:
-                current_project.load_project(path)
-                self.add_recent_project(current_project.project_file)
+                self.load_project(path)